@@ -18,6 +18,7 @@ import NoticeForm from "./pages/NoticeForm";
 import CourseManagement from "./pages/CourseManagement";
 import CourseForm from "./pages/CourseForm";
 import CourseDetail from "./pages/CourseDetail";
+import CourseGradebook from "./pages/CourseGradebook";
 import StudentCourseDetail from "./pages/StudentCourseDetail"; // ✅ 1. 새로 만든 페이지를 import 합니다.
 
 function ProtectedRoute({ children }: { children: ReactNode }): React.ReactElement {
@@ -53,6 +54,7 @@ export default function App() {
         <Route path="/professor/courses/new" element={<CourseForm />} />
         <Route path="/professor/courses/:id" element={<CourseDetail />} />
         <Route path="/professor/courses/:id/edit" element={<CourseForm />} />
+        <Route path="/professor/courses/:id/gradebook" element={<CourseGradebook />} />
         <Route path="/professor/assignments/:id/submissions" element={<AssignmentSubmissions />} />
         
         {/* 공지사항 관련 라우트 */}
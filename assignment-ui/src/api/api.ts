@@ -1,4 +1,5 @@
 import axios from 'axios';
+import { Paginated } from '../types';
 
 // 백엔드 API의 기본 주소를 설정합니다.
 const apiClient = axios.create({
@@ -22,3 +23,16 @@ apiClient.interceptors.request.use(
 
 export default apiClient;
 
+// 목록 API는 커서 기반 페이지 단위로 응답합니다. (backend/core/pagination.py)
+// 전체 목록이 필요한 화면에서는 next 링크를 따라가며 모든 페이지를 모읍니다.
+export async function fetchAllPages<T>(url: string, params?: Record<string, string | number>): Promise<T[]> {
+  const items: T[] = [];
+  let response = await apiClient.get<Paginated<T>>(url, { params: { page_size: 100, ...params } });
+  items.push(...response.data.results);
+  while (response.data.next) {
+    response = await apiClient.get<Paginated<T>>(response.data.next);
+    items.push(...response.data.results);
+  }
+  return items;
+}
+
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import apiClient from '../api/api';
-import { Notification } from '../types';
+import { Notification, Paginated } from '../types';
 
 // 벨 아이콘 SVG
 const BellIcon = () => (
@@ -11,7 +11,59 @@ const BellIcon = () => (
 
 export default function NotificationBell() {
   const [notifications, setNotifications] = useState<Notification[]>([]);
+  const [nextUrl, setNextUrl] = useState<string | null>(null);
   const [isOpen, setIsOpen] = useState(false);
+  // 배지 숫자는 목록 전체를 받지 않고 안 읽은 알림 수 API로 가져옵니다.
+  const [unreadCount, setUnreadCount] = useState(0);
+
+  const fetchUnreadCount = async () => {
+    try {
+      const response = await apiClient.get<{ unread: number }>('/notifications/unread-count/');
+      setUnreadCount(response.data.unread);
+    } catch (error) {
+      console.error('Failed to fetch unread count:', error);
+    }
+  };
+
+  // 새 알림은 서버가 SSE(/notifications/stream/)로 바로 보내 줍니다. (backend/core/realtime.py)
+  useEffect(() => {
+    let source: EventSource | null = null;
+    let retryTimer: ReturnType<typeof setTimeout> | undefined;
+    let closed = false;
+
+    const connect = async () => {
+      try {
+        const { data } = await apiClient.post<{ token: string }>('/notifications/stream-token/');
+        if (closed) return;
+        source = new EventSource(`${apiClient.defaults.baseURL}/notifications/stream/?token=${encodeURIComponent(data.token)}`);
+        source.addEventListener('notification', (event) => {
+          const notification: Notification = JSON.parse((event as MessageEvent).data);
+          setUnreadCount(prev => prev + 1);
+          // MySQL에서 일괄 생성된 알림은 id 없이 올 수 있으므로, 그때는 목록을 다시 불러옵니다.
+          if (notification.id) {
+            setNotifications(prev => prev.some(n => n.id === notification.id) ? prev : [notification, ...prev]);
+          } else {
+            fetchNotifications();
+          }
+        });
+        source.onerror = () => {
+          // 토큰 만료 등으로 연결이 끊기면 새 토큰으로 다시 연결합니다.
+          source?.close();
+          if (!closed) retryTimer = setTimeout(connect, 10000);
+        };
+      } catch (error) {
+        if (!closed) retryTimer = setTimeout(connect, 30000);
+      }
+    };
+    fetchUnreadCount();
+    connect();
+
+    return () => {
+      closed = true;
+      source?.close();
+      clearTimeout(retryTimer);
+    };
+  }, []);
 
   useEffect(() => {
     // 팝업이 열릴 때만 알림을 가져옵니다.
@@ -22,13 +74,26 @@ export default function NotificationBell() {
 
   const fetchNotifications = async () => {
     try {
-      const response = await apiClient.get<Notification[]>('/notifications/');
-      setNotifications(response.data);
+      const response = await apiClient.get<Paginated<Notification>>('/notifications/', { params: { page_size: 10 } });
+      setNotifications(response.data.results);
+      setNextUrl(response.data.next);
     } catch (error) {
       console.error('Failed to fetch notifications:', error);
     }
   };
 
+  // 목록 끝의 '이전 알림 더 보기'로 다음 페이지를 이어서 불러옵니다.
+  const fetchMoreNotifications = async () => {
+    if (!nextUrl) return;
+    try {
+      const response = await apiClient.get<Paginated<Notification>>(nextUrl);
+      setNotifications(prev => [...prev, ...response.data.results]);
+      setNextUrl(response.data.next);
+    } catch (error) {
+      console.error('Failed to fetch more notifications:', error);
+    }
+  };
+
   const markAsRead = async (notificationId: number) => {
     try {
       await apiClient.post(`/notifications/${notificationId}/read/`);
@@ -36,25 +101,45 @@ export default function NotificationBell() {
       setNotifications(
         notifications.map(n => n.id === notificationId ? { ...n, isRead: true } : n)
       );
+      setUnreadCount(prev => Math.max(prev - 1, 0));
     } catch (error) {
       console.error('Failed to mark notification as read:', error);
     }
   };
-  
-  const unreadCount = notifications.filter(n => !n.isRead).length;
+
+  // 지금 보이는 가장 최근 알림까지만 읽음 처리해, 그 사이 도착한 알림은 남겨 둡니다.
+  const markAllAsRead = async () => {
+    const latestId = notifications.reduce((max, n) => Math.max(max, n.id || 0), 0);
+    try {
+      await apiClient.post('/notifications/read/', latestId ? { upToId: latestId } : {});
+      setNotifications(notifications.map(n => ({ ...n, isRead: true })));
+      fetchUnreadCount();
+    } catch (error) {
+      console.error('Failed to mark notifications as read:', error);
+    }
+  };
 
   return (
     <div className="relative">
       <button onClick={() => setIsOpen(!isOpen)} className="relative text-gray-600 hover:text-gray-800 focus:outline-none">
         <BellIcon />
         {unreadCount > 0 && (
-          <span className="absolute top-0 right-0 block h-2 w-2 rounded-full bg-red-500 ring-2 ring-white"></span>
+          <span className="absolute -top-1 -right-1 min-w-[1rem] h-4 px-1 rounded-full bg-red-500 text-white text-[10px] leading-4 text-center ring-2 ring-white">
+            {unreadCount > 99 ? '99+' : unreadCount}
+          </span>
         )}
       </button>
 
       {isOpen && (
         <div className="absolute right-0 mt-2 w-80 bg-white rounded-lg shadow-xl overflow-hidden z-20">
-          <div className="p-4 font-bold border-b">알림</div>
+          <div className="p-4 font-bold border-b flex justify-between items-center">
+            <span>알림</span>
+            {unreadCount > 0 && (
+              <button onClick={markAllAsRead} className="text-xs font-normal text-blue-600 hover:underline">
+                모두 읽음
+              </button>
+            )}
+          </div>
           <ul className="divide-y max-h-96 overflow-y-auto">
             {notifications.length > 0 ? notifications.map(notification => (
               <li key={notification.id} className={`p-4 text-sm ${!notification.isRead ? 'bg-blue-50' : ''}`}>
@@ -71,6 +156,13 @@ export default function NotificationBell() {
             )) : (
               <li className="p-4 text-center text-gray-500">새로운 알림이 없습니다.</li>
             )}
+            {nextUrl && (
+              <li className="p-2 text-center">
+                <button onClick={fetchMoreNotifications} className="text-xs text-blue-600 hover:underline">
+                  이전 알림 더 보기
+                </button>
+              </li>
+            )}
           </ul>
         </div>
       )}
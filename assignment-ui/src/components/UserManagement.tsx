@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import apiClient from '../api/api';
+import apiClient, { fetchAllPages } from '../api/api';
 import { User, UserRole } from '../types';
 
 const Spinner = () => <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>;
@@ -12,8 +12,7 @@ export default function UserManagement() {
   const fetchUsers = async () => {
     try {
       setLoading(true);
-      const response = await apiClient.get<User[]>('/admin/users/');
-      setUsers(response.data);
+      setUsers(await fetchAllPages<User>('/admin/users/'));
     } catch (err) {
       setError('사용자 목록을 불러오는 데 실패했습니다.');
     } finally {
@@ -62,6 +62,14 @@ export const AuthProvider = ({ children }: { children: ReactNode }) => {
   };
 
   const logout = () => {
+    // 서버에서도 토큰을 폐기합니다. 실패해도(이미 만료 등) 로컬 로그아웃은 그대로 진행합니다.
+    // 인터셉터가 실행되기 전에 토큰을 지우므로 헤더를 직접 넣습니다.
+    const access = localStorage.getItem('access_token');
+    const refresh = localStorage.getItem('refresh_token');
+    if (access) {
+      apiClient.post('/auth/logout/', refresh ? { refresh } : {}, { headers: { Authorization: `Bearer ${access}` } })
+        .catch(() => {});
+    }
     setUser(null);
     localStorage.removeItem('access_token');
     localStorage.removeItem('refresh_token');
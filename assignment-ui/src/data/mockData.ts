@@ -7,8 +7,8 @@ export const mockUsers: User[] = [
 ];
 
 export const courses: Course[] = [
-  { id: 1, name: '네트워크', professor: 2, students: [], joinCode: 'NET-101' },
-  { id: 2, name: '데이터베이스', professor: 2, students: [], joinCode: 'DB-102' },
+  { id: 1, name: '네트워크', professor: 2, students: [], studentCount: 0, joinCode: 'NET-101' },
+  { id: 2, name: '데이터베이스', professor: 2, students: [], studentCount: 0, joinCode: 'DB-102' },
 ];
 
 export const assignments: Assignment[] = [
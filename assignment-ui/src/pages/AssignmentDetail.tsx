@@ -1,7 +1,8 @@
 import React, { useState, useEffect } from 'react';
 import { useParams, Link } from 'react-router-dom';
-import apiClient from '../api/api';
+import apiClient, { fetchAllPages } from '../api/api';
 import { Assignment, Submission } from '../types';
+import { CHUNKED_UPLOAD_THRESHOLD, uploadInChunks } from '../utils/chunkedUpload';
 
 const Spinner = () => <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-blue-600"></div>;
 
@@ -38,13 +39,13 @@ export default function AssignmentDetail() {
     const fetchData = async () => {
       try {
         setLoading(true);
-        const [assignmentRes, submissionsRes] = await Promise.all([
+        const [assignmentRes, submissionList] = await Promise.all([
             apiClient.get<Assignment>(`/assignments/${id}/`),
-            apiClient.get<Submission[]>('/my-submissions/')
+            fetchAllPages<Submission>('/my-submissions/')
         ]);
         
         setAssignment(assignmentRes.data);
-        const currentSubmission = submissionsRes.data.find(sub => sub.assignment === parseInt(id));
+        const currentSubmission = submissionList.find(sub => sub.assignment === parseInt(id));
         if (currentSubmission) {
           setSubmission(currentSubmission);
           // ✅ 수정 모드일 때 기존 설명을 불러와 폼에 채워줍니다.
@@ -76,12 +77,16 @@ export default function AssignmentDetail() {
     // FormData는 파일과 텍스트를 함께 보낼 때 사용하는 특별한 객체입니다.
     const formData = new FormData();
     // ✅ 파일과 설명을 함께 FormData에 담습니다.
-    if (selectedFile) {
-        formData.append('file', selectedFile);
-    }
     formData.append('description', description);
 
     try {
+      if (selectedFile && selectedFile.size > CHUNKED_UPLOAD_THRESHOLD) {
+        // ✅ 큰 파일은 조각으로 나누어 먼저 올린 뒤, upload_id로 제출합니다.
+        formData.append('upload_id', await uploadInChunks(id!, selectedFile));
+      } else if (selectedFile) {
+        formData.append('file', selectedFile);
+      }
+
       if (submission) {
         // 수정(재제출) 시에는 PATCH 요청을 보냅니다.
         await apiClient.patch(`/submissions/${submission.id}/`, formData, {
@@ -139,7 +144,7 @@ export default function AssignmentDetail() {
               <div className='mb-4 p-3 bg-blue-100 rounded-md text-sm text-blue-800'>
                 <p><strong>현재 제출된 파일:</strong></p>
                 <a href={submission.fileUrl} target="_blank" rel="noopener noreferrer" className="font-medium hover:underline">
-                  {submission.fileUrl?.split('/').pop()}
+                  {submission.fileName || submission.fileUrl?.split('/').pop()}
                 </a>
               </div>
             )}
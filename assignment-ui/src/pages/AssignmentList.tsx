@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
-import apiClient from '../api/api';
+import { fetchAllPages } from '../api/api';
 import { Assignment } from '../types';
 
 const Spinner = () => (
@@ -18,8 +18,7 @@ export default function AssignmentList() {
     const fetchAssignments = async () => {
       try {
         setLoading(true);
-        const response = await apiClient.get<Assignment[]>('/assignments/');
-        setAssignments(response.data);
+        setAssignments(await fetchAllPages<Assignment>('/assignments/'));
       } catch (err) {
         setError('과제 목록을 불러오는 데 실패했습니다.');
       } finally {
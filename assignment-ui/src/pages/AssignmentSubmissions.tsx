@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { useParams, Link } from 'react-router-dom';
 import apiClient from '../api/api';
-import { Submission } from '../types';
+import { Paginated, Submission } from '../types';
 import StatusBadge from '../components/StatusBadge';
 
 const Spinner = () => <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>;
@@ -9,14 +9,23 @@ const Spinner = () => <div className="animate-spin rounded-full h-8 w-8 border-b
 export default function AssignmentSubmissions() {
   const { id } = useParams<{ id: string }>();
   const [submissions, setSubmissions] = useState<Submission[]>([]);
+  const [nextUrl, setNextUrl] = useState<string | null>(null);
+  const [totalCount, setTotalCount] = useState<number | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [exporting, setExporting] = useState(false);
 
   useEffect(() => {
     if (!id) return;
     const fetchSubmissions = async () => {
       try {
-        const response = await apiClient.get<Submission[]>(`/assignments/${id}/submissions/`);
-        setSubmissions(response.data);
+        // 첫 페이지를 불러올 때만 전체 제출 수를 함께 요청합니다.
+        const response = await apiClient.get<Paginated<Submission>>(`/assignments/${id}/submissions/`, {
+          params: { include_total: 'true' }
+        });
+        setSubmissions(response.data.results);
+        setNextUrl(response.data.next);
+        setTotalCount(response.data.count ?? null);
       } catch (error) {
         console.error("Failed to fetch submissions", error);
       } finally {
@@ -26,6 +35,20 @@ export default function AssignmentSubmissions() {
     fetchSubmissions();
   }, [id]);
 
+  const loadMore = async () => {
+    if (!nextUrl) return;
+    setLoadingMore(true);
+    try {
+      const response = await apiClient.get<Paginated<Submission>>(nextUrl);
+      setSubmissions(prev => [...prev, ...response.data.results]);
+      setNextUrl(response.data.next);
+    } catch (error) {
+      console.error("Failed to fetch more submissions", error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleGradeChange = (submissionId: number, grade: number) => {
     setSubmissions(submissions.map(s => s.id === submissionId ? { ...s, grade } : s));
   };
@@ -49,10 +72,71 @@ export default function AssignmentSubmissions() {
     }
   };
 
+  // 불러온 제출물 중 점수가 입력된 것들을 한 번의 요청으로 저장합니다.
+  const handleSaveAllGrades = async () => {
+    const grades = submissions
+      .filter(s => s.grade !== null && s.grade !== undefined)
+      .map(s => ({ submissionId: s.id, grade: s.grade, feedback: s.feedback ?? '' }));
+    if (grades.length === 0) return;
+    try {
+      const response = await apiClient.post(`/assignments/${id}/grades/`, { grades });
+      alert(`${response.data.updated}건의 채점이 저장되었습니다.`);
+    } catch (error) {
+      alert("일괄 채점 저장에 실패했습니다.");
+    }
+  };
+
+  // CSV(username 또는 submission_id, grade, feedback)로 일괄 채점합니다. ZIP의 manifest.csv를 고쳐서 올려도 됩니다.
+  const handleGradesCsv = async (e: React.ChangeEvent<HTMLInputElement>) => {
+    const file = e.target.files?.[0];
+    e.target.value = '';
+    if (!file) return;
+    const formData = new FormData();
+    formData.append('file', file);
+    try {
+      const response = await apiClient.post(`/assignments/${id}/grades/`, formData);
+      alert(`${response.data.updated}건의 채점이 저장되었습니다. 목록을 새로고침합니다.`);
+      window.location.reload();
+    } catch (error) {
+      alert("CSV 채점 업로드에 실패했습니다.");
+    }
+  };
+
+  // 모든 제출 파일과 성적 목록(manifest.csv)을 하나의 ZIP으로 내려받습니다.
+  const handleExport = async () => {
+    setExporting(true);
+    try {
+      const response = await apiClient.get(`/assignments/${id}/submissions/export/`, { responseType: 'blob' });
+      const url = URL.createObjectURL(response.data);
+      const link = document.createElement('a');
+      link.href = url;
+      link.download = `assignment-${id}-submissions.zip`;
+      link.click();
+      URL.revokeObjectURL(url);
+    } catch (error) {
+      alert("전체 다운로드에 실패했습니다.");
+    } finally {
+      setExporting(false);
+    }
+  };
+
   return (
     <div>
       <Link to="/professor" className="text-blue-600 hover:underline mb-4 block">&larr; 대시보드로 돌아가기</Link>
-      <h1 className="text-3xl font-bold mb-6">과제 제출 현황</h1>
+      <h1 className="text-3xl font-bold mb-6">
+        과제 제출 현황
+        {totalCount !== null && <span className="ml-2 text-lg font-normal text-gray-500">({submissions.length} / {totalCount})</span>}
+      </h1>
+      <button onClick={handleExport} disabled={exporting} className="mb-6 bg-blue-600 text-white py-2 px-4 rounded-lg hover:bg-blue-700 disabled:opacity-50">
+        {exporting ? '압축 중...' : '전체 제출물 ZIP 다운로드'}
+      </button>
+      <button onClick={handleSaveAllGrades} className="mb-6 ml-2 bg-green-600 text-white py-2 px-4 rounded-lg hover:bg-green-700">
+        모든 채점 저장
+      </button>
+      <label className="mb-6 ml-2 inline-block bg-gray-100 text-gray-700 py-2 px-4 rounded-lg hover:bg-gray-200 cursor-pointer">
+        CSV로 채점 업로드
+        <input type="file" accept=".csv,text/csv" onChange={handleGradesCsv} className="hidden" />
+      </label>
       {loading ? <div className="flex justify-center p-8"><Spinner /></div> : (
         <div className="space-y-4">
           {submissions.map(submission => (
@@ -103,6 +187,13 @@ export default function AssignmentSubmissions() {
               )}
             </div>
           ))}
+          {nextUrl && (
+            <div className="flex justify-center">
+              <button onClick={loadMore} disabled={loadingMore} className="bg-gray-100 text-gray-700 py-2 px-4 rounded-lg hover:bg-gray-200 disabled:opacity-50">
+                {loadingMore ? '불러오는 중...' : '더 보기'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { useParams, Link } from 'react-router-dom';
-import apiClient from '../api/api';
-import { Course, Assignment, User } from '../types';
+import apiClient, { fetchAllPages } from '../api/api';
+import { Course, Assignment, User, EnrollmentResult } from '../types';
 
 const Spinner = () => <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>;
 
@@ -77,7 +77,7 @@ const AssignmentEditor = ({
 };
 
 const StudentManagementModal = ({ course, allStudents, onClose, onSave }: { course: Course, allStudents: User[], onClose: () => void, onSave: (updatedCourse: Course) => void }) => {
-    const [selectedStudentIds, setSelectedStudentIds] = useState<number[]>(() => course.students.map(s => s.id));
+    const [selectedStudentIds, setSelectedStudentIds] = useState<number[]>(() => (course.students ?? []).map(s => s.id));
     const [isSaving, setIsSaving] = useState(false);
 
     const handleStudentSelect = (studentId: number) => {
@@ -91,10 +91,24 @@ const StudentManagementModal = ({ course, allStudents, onClose, onSave }: { cour
     const handleSave = async () => {
         setIsSaving(true);
         try {
-            const response = await apiClient.post<Course>(`/courses/${course.id}/students/`, {
-                student_ids: selectedStudentIds
+            // ✅ 바뀐 학생만 보냅니다. 전체 명단을 다시 보내거나 받지 않습니다.
+            const originalIds = (course.students ?? []).map(s => s.id);
+            const addIds = selectedStudentIds.filter(id => !originalIds.includes(id));
+            const removeIds = originalIds.filter(id => !selectedStudentIds.includes(id));
+            let studentCount = course.studentCount;
+            if (addIds.length > 0) {
+                const response = await apiClient.post<EnrollmentResult>(`/courses/${course.id}/students/add/`, { student_ids: addIds });
+                studentCount = response.data.studentCount;
+            }
+            if (removeIds.length > 0) {
+                const response = await apiClient.post<EnrollmentResult>(`/courses/${course.id}/students/remove/`, { student_ids: removeIds });
+                studentCount = response.data.studentCount;
+            }
+            onSave({
+                ...course,
+                students: allStudents.filter(student => selectedStudentIds.includes(student.id)),
+                studentCount,
             });
-            onSave(response.data);
         } catch (error) {
             alert('학생 정보 저장에 실패했습니다.');
         } finally {
@@ -146,21 +160,20 @@ export default function CourseDetail() {
 
   // --- 기존 함수들은 그대로 둡니다 ---
   const fetchAssignments = async (courseId: string) => {
-    const assignmentsRes = await apiClient.get<Assignment[]>(`/assignments/?course_id=${courseId}`);
-    setAssignments(assignmentsRes.data);
+    setAssignments(await fetchAllPages<Assignment>('/assignments/', { course_id: courseId }));
   };
 
   useEffect(() => {
     if (!id) return;
     const fetchData = async () => {
       try {
-        const [courseRes, allStudentsRes] = await Promise.all([
+        const [courseRes, userList] = await Promise.all([
             apiClient.get<Course>(`/courses/${id}/`),
-            apiClient.get<User[]>('/admin/users/')
+            fetchAllPages<User>('/admin/users/')
         ]);
         
         setCourse(courseRes.data);
-        setAllStudents(allStudentsRes.data.filter(u => u.role === 'student'));
+        setAllStudents(userList.filter(u => u.role === 'student'));
         await fetchAssignments(id);
 
       } catch (error) {
@@ -205,9 +218,14 @@ export default function CourseDetail() {
       <Link to="/professor/courses" className="text-blue-600 hover:underline mb-4 block">&larr; 전체 과목 목록으로</Link>
       <div className="flex justify-between items-center mb-6">
         <h1 className="text-3xl font-bold">{course.name}</h1>
-        <Link to={`/professor/courses/${id}/edit`} className="bg-yellow-500 text-white py-2 px-4 rounded-lg hover:bg-yellow-600">
-            과목 정보 수정
-        </Link>
+        <div className="flex gap-2">
+          <Link to={`/professor/courses/${id}/gradebook`} className="bg-green-600 text-white py-2 px-4 rounded-lg hover:bg-green-700">
+              성적부
+          </Link>
+          <Link to={`/professor/courses/${id}/edit`} className="bg-yellow-500 text-white py-2 px-4 rounded-lg hover:bg-yellow-600">
+              과목 정보 수정
+          </Link>
+        </div>
       </div>
       
       {/* ✅ 과목 헤더에 참여 코드를 표시하는 부분을 추가합니다. */}
@@ -248,7 +266,7 @@ export default function CourseDetail() {
             </button>
           </div>
           <ul className="divide-y divide-gray-200">
-            {course.students.map(student => (
+            {(course.students ?? []).map(student => (
               <li key={student.id} className="py-3">
                 <p className="font-medium text-gray-800">{student.username}</p>
                 <p className="text-sm text-gray-500">{student.email}</p>
@@ -0,0 +1,76 @@
+import React, { useState, useEffect } from 'react';
+import { useParams, Link } from 'react-router-dom';
+import apiClient from '../api/api';
+import { Gradebook } from '../types';
+
+const Spinner = () => <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>;
+
+const formatRate = (rate: number | null) => rate === null ? '-' : `${Math.round(rate * 100)}%`;
+
+export default function CourseGradebook() {
+  const { id } = useParams<{ id: string }>();
+  const [gradebook, setGradebook] = useState<Gradebook | null>(null);
+  const [loading, setLoading] = useState(true);
+
+  useEffect(() => {
+    const fetchGradebook = async () => {
+      try {
+        const response = await apiClient.get<Gradebook>(`/courses/${id}/gradebook/`);
+        setGradebook(response.data);
+      } catch (error) {
+        console.error("Failed to fetch gradebook", error);
+      } finally {
+        setLoading(false);
+      }
+    };
+    fetchGradebook();
+  }, [id]);
+
+  if (loading) return <div className="flex justify-center p-8"><Spinner /></div>;
+  if (!gradebook) return <div>성적부를 불러올 수 없습니다.</div>;
+
+  return (
+    <div>
+      <Link to={`/professor/courses/${id}`} className="text-blue-600 hover:underline mb-4 block">&larr; 과목 관리로</Link>
+      <h1 className="text-3xl font-bold mb-6">{gradebook.course.name} 성적부</h1>
+      <div className="bg-white rounded-lg shadow-md overflow-x-auto">
+        <table className="min-w-full text-sm">
+          <thead className="bg-gray-50">
+            <tr>
+              <th className="p-3 text-left">학생</th>
+              {gradebook.assignments.map(assignment => (
+                <th key={assignment.id} className="p-3 text-center">{assignment.title}</th>
+              ))}
+              <th className="p-3 text-center">평균</th>
+            </tr>
+          </thead>
+          <tbody className="divide-y divide-gray-200">
+            {gradebook.students.map(student => (
+              <tr key={student.id}>
+                <td className="p-3 font-medium">{student.username}</td>
+                {student.cells.map((cell, index) => (
+                  <td key={gradebook.assignments[index].id} className="p-3 text-center" title={cell.status}>
+                    {cell.grade ?? (cell.submissionId ? '미채점' : '-')}
+                    {cell.isLate && <span className="ml-1 text-xs text-yellow-700">(지연)</span>}
+                  </td>
+                ))}
+                <td className="p-3 text-center font-semibold">{student.average ?? '-'}</td>
+              </tr>
+            ))}
+          </tbody>
+          <tfoot className="bg-gray-50 text-gray-600">
+            <tr>
+              <td className="p-3">제출률 / 평균 / 중앙값</td>
+              {gradebook.assignments.map(assignment => (
+                <td key={assignment.id} className="p-3 text-center">
+                  {formatRate(assignment.submissionRate)} / {assignment.mean ?? '-'} / {assignment.median ?? '-'}
+                </td>
+              ))}
+              <td />
+            </tr>
+          </tfoot>
+        </table>
+      </div>
+    </div>
+  );
+}
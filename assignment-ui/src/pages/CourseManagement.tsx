@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
-import apiClient from '../api/api';
+import apiClient, { fetchAllPages } from '../api/api';
 import { Course } from '../types';
 
 const Spinner = () => <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>;
@@ -12,8 +12,7 @@ export default function CourseManagement() {
   useEffect(() => {
     const fetchCourses = async () => {
       try {
-        const response = await apiClient.get<Course[]>('/courses/');
-        setCourses(response.data);
+        setCourses(await fetchAllPages<Course>('/courses/'));
       } catch (error) {
         console.error("Failed to fetch courses", error);
       } finally {
@@ -50,7 +49,7 @@ export default function CourseManagement() {
               <li key={course.id} className="p-4 hover:bg-gray-50 flex justify-between items-center">
                 <div>
                   <h2 className="font-semibold text-lg text-gray-800">{course.name}</h2>
-                  <p className="text-sm text-gray-500">학생 수: {course.students.length}</p>
+                  <p className="text-sm text-gray-500">학생 수: {course.studentCount}</p>
                 </div>
                 <div className="flex items-center gap-4">
                   <Link to={`/professor/courses/${course.id}`} className="text-blue-600 hover:underline font-medium">
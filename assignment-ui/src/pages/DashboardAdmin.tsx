@@ -8,6 +8,10 @@ interface DashboardStats {
   totalAssignments: number;
   totalSubmissions: number;
   totalUsers: number;
+  usersByRole: { student: number; professor: number; admin: number };
+  lateSubmissions: number;
+  onTimeSubmissions: number;
+  ungradedSubmissions: number;
 }
 
 const Spinner = () => <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-blue-600"></div>;
@@ -58,6 +62,26 @@ export default function DashboardAdmin() {
         </div>
       </section>
 
+      {/* 사용자 / 제출물 세부 현황 */}
+      <section className="grid grid-cols-1 md:grid-cols-2 gap-6 mb-8">
+        <div className="p-6 bg-white rounded-lg shadow-md">
+          <h3 className="text-lg font-semibold text-gray-600 mb-4">역할별 사용자</h3>
+          <dl className="grid grid-cols-3 gap-4 text-center">
+            <div><dt className="text-sm text-gray-500">학생</dt><dd className="text-2xl font-bold">{stats?.usersByRole.student ?? '...'}</dd></div>
+            <div><dt className="text-sm text-gray-500">교수</dt><dd className="text-2xl font-bold">{stats?.usersByRole.professor ?? '...'}</dd></div>
+            <div><dt className="text-sm text-gray-500">관리자</dt><dd className="text-2xl font-bold">{stats?.usersByRole.admin ?? '...'}</dd></div>
+          </dl>
+        </div>
+        <div className="p-6 bg-white rounded-lg shadow-md">
+          <h3 className="text-lg font-semibold text-gray-600 mb-4">제출물 현황</h3>
+          <dl className="grid grid-cols-3 gap-4 text-center">
+            <div><dt className="text-sm text-gray-500">정상 제출</dt><dd className="text-2xl font-bold text-green-600">{stats?.onTimeSubmissions ?? '...'}</dd></div>
+            <div><dt className="text-sm text-gray-500">지연 제출</dt><dd className="text-2xl font-bold text-yellow-600">{stats?.lateSubmissions ?? '...'}</dd></div>
+            <div><dt className="text-sm text-gray-500">미채점</dt><dd className="text-2xl font-bold text-red-600">{stats?.ungradedSubmissions ?? '...'}</dd></div>
+          </dl>
+        </div>
+      </section>
+
       {/* ✅ 2. 기존 placeholder 대신 UserManagement 컴포넌트를 여기에 배치합니다. */}
       <section>
         <UserManagement />
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
-import apiClient from '../api/api';
+import { fetchAllPages } from '../api/api';
 import { Assignment } from '../types';
 
 const Spinner = () => <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>;
@@ -14,8 +14,7 @@ export default function DashboardProfessor() {
       try {
         // 교수가 로그인하면, views.py의 get_queryset 로직에 따라
         // 자신이 담당하는 과제 목록만 자동으로 불러옵니다.
-        const response = await apiClient.get<Assignment[]>('/assignments/');
-        setAssignments(response.data);
+        setAssignments(await fetchAllPages<Assignment>('/assignments/'));
       } catch (error) {
         console.error("Failed to fetch assignments", error);
       } finally {
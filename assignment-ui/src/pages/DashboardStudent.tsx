@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
-import apiClient from '../api/api';
+import apiClient, { fetchAllPages } from '../api/api';
 import { Course } from '../types';
 
 const Spinner = () => <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>;
@@ -57,8 +57,7 @@ export default function DashboardStudent() {
     const fetchCourses = async () => {
       try {
         setLoading(true);
-        const coursesRes = await apiClient.get<Course[]>('/courses/');
-        setCourses(coursesRes.data);
+        setCourses(await fetchAllPages<Course>('/courses/'));
       } catch (error) {
         console.error("Failed to fetch data", error);
       } finally {
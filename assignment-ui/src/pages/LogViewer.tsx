@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import apiClient from '../api/api';
+import { Paginated } from '../types';
 
 // 백엔드로부터 받아올 로그 데이터의 타입을 정의합니다.
 interface ActivityLog {
@@ -14,15 +15,23 @@ const Spinner = () => <div className="animate-spin rounded-full h-8 w-8 border-b
 
 export default function LogViewer() {
   const [logs, setLogs] = useState<ActivityLog[]>([]);
+  const [nextUrl, setNextUrl] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  // 기간/사용자/활동 유형 필터입니다. 빈 값은 보내지 않습니다.
+  const [filters, setFilters] = useState({ since: '', until: '', actor: '', action_type: '' });
+  const [appliedFilters, setAppliedFilters] = useState(filters);
 
   useEffect(() => {
     const fetchLogs = async () => {
+      setLoading(true);
       try {
-        // 백엔드의 /api/admin/logs/ API를 호출합니다.
-        const response = await apiClient.get<ActivityLog[]>('/admin/logs/');
-        setLogs(response.data);
+        // 백엔드의 /api/admin/logs/ API를 호출합니다. (최신 로그부터 한 페이지씩)
+        const params = Object.fromEntries(Object.entries(appliedFilters).filter(([, value]) => value));
+        const response = await apiClient.get<Paginated<ActivityLog>>('/admin/logs/', { params });
+        setLogs(response.data.results);
+        setNextUrl(response.data.next);
       } catch (error) {
         setError("활동 로그를 불러오는 데 실패했습니다.");
         console.error("Failed to fetch logs", error);
@@ -31,14 +40,40 @@ export default function LogViewer() {
       }
     };
     fetchLogs();
-  }, []);
+  }, [appliedFilters]);
+
+  // '더 보기'를 누르면 다음 페이지의 로그를 이어 붙입니다.
+  const loadMore = async () => {
+    if (!nextUrl) return;
+    setLoadingMore(true);
+    try {
+      const response = await apiClient.get<Paginated<ActivityLog>>(nextUrl);
+      setLogs(prev => [...prev, ...response.data.results]);
+      setNextUrl(response.data.next);
+    } catch (error) {
+      console.error("Failed to fetch more logs", error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
-  if (loading) return <div className="flex justify-center p-8"><Spinner /></div>;
   if (error) return <div className="text-center text-red-600 bg-red-100 p-4 rounded-lg">{error}</div>;
 
   return (
     <div className="bg-white p-6 rounded-lg shadow-md">
       <h1 className="text-3xl font-bold mb-6">시스템 활동 로그</h1>
+      <form
+        onSubmit={(e) => { e.preventDefault(); setAppliedFilters(filters); }}
+        className="flex flex-wrap gap-2 mb-6 text-sm"
+      >
+        <input type="date" value={filters.since} onChange={(e) => setFilters({ ...filters, since: e.target.value })} className="p-2 border rounded-md" />
+        <span className="self-center">~</span>
+        <input type="date" value={filters.until} onChange={(e) => setFilters({ ...filters, until: e.target.value })} className="p-2 border rounded-md" />
+        <input type="text" placeholder="사용자 (아이디)" value={filters.actor} onChange={(e) => setFilters({ ...filters, actor: e.target.value })} className="p-2 border rounded-md" />
+        <input type="text" placeholder="활동 유형" value={filters.action_type} onChange={(e) => setFilters({ ...filters, action_type: e.target.value })} className="p-2 border rounded-md" />
+        <button type="submit" className="bg-blue-600 text-white py-2 px-4 rounded-lg hover:bg-blue-700">검색</button>
+      </form>
+      {loading ? <div className="flex justify-center p-8"><Spinner /></div> : (
       <div className="overflow-x-auto">
         <table className="min-w-full divide-y divide-gray-200">
           <thead className="bg-gray-50">
@@ -65,6 +100,14 @@ export default function LogViewer() {
           </tbody>
         </table>
       </div>
+      )}
+      {!loading && nextUrl && (
+        <div className="flex justify-center mt-6">
+          <button onClick={loadMore} disabled={loadingMore} className="bg-gray-100 text-gray-700 py-2 px-4 rounded-lg hover:bg-gray-200 disabled:opacity-50">
+            {loadingMore ? '불러오는 중...' : '더 보기'}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import apiClient from '../api/api';
+import { fetchAllPages } from '../api/api';
 import { Submission } from '../types';
 
 const Spinner = () => <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>;
@@ -11,8 +11,7 @@ export default function MySubmissions() {
   useEffect(() => {
     const fetchSubmissions = async () => {
       try {
-        const response = await apiClient.get<Submission[]>('/my-submissions/');
-        setSubmissions(response.data);
+        setSubmissions(await fetchAllPages<Submission>('/my-submissions/'));
       } catch (error) {
         console.error("Failed to fetch submissions", error);
       } finally {
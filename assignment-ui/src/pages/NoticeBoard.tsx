@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from "react";
 import { Link } from "react-router-dom";
-import apiClient from "../api/api";
+import { fetchAllPages } from "../api/api";
 import { Notice } from "../types"; // types.ts에서 Notice 타입을 가져옵니다.
 import { useAuth } from "../context/AuthContext";
 
@@ -17,8 +17,7 @@ export default function NoticeBoard() {
     const fetchNotices = async () => {
       try {
         // 백엔드의 /api/notices/ API를 호출합니다.
-        const response = await apiClient.get<Notice[]>("/notices/");
-        setNotices(response.data);
+        setNotices(await fetchAllPages<Notice>("/notices/"));
       } catch (error) {
         console.error("Failed to fetch notices", error);
       } finally {
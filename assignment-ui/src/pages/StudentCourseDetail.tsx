@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { useParams, Link } from 'react-router-dom';
-import apiClient from '../api/api';
+import apiClient, { fetchAllPages } from '../api/api';
 import { Course, Assignment, Submission } from '../types';
 import StatusBadge from '../components/StatusBadge';
 
@@ -17,14 +17,14 @@ export default function StudentCourseDetail() {
     if (!id) return;
     const fetchData = async () => {
       try {
-        const [courseRes, assignmentsRes, submissionsRes] = await Promise.all([
+        const [courseRes, assignmentList, submissionList] = await Promise.all([
           apiClient.get<Course>(`/courses/${id}/`),
-          apiClient.get<Assignment[]>(`/assignments/?course_id=${id}`),
-          apiClient.get<Submission[]>('/my-submissions/')
+          fetchAllPages<Assignment>('/assignments/', { course_id: id }),
+          fetchAllPages<Submission>('/my-submissions/')
         ]);
         setCourse(courseRes.data);
-        setAssignments(assignmentsRes.data);
-        setSubmissions(submissionsRes.data);
+        setAssignments(assignmentList);
+        setSubmissions(submissionList);
       } catch (error) {
         console.error("Failed to fetch course details", error);
       } finally {
@@ -15,10 +15,20 @@ export interface Course {
   id: number;
   name:string;
   professor: number;
-  students: User[];
+  // 목록 API는 studentCount만 보냅니다. 상세 API 또는 ?expand=students일 때 students가 옵니다.
+  students?: User[];
+  studentCount: number;
   joinCode: string;
 }
 
+// 수강생 등록/해제 API는 명단 대신 바뀐 수와 찾지 못한 값만 돌려줍니다.
+export interface EnrollmentResult {
+  added: number;
+  removed: number;
+  unknown: string[];
+  studentCount: number;
+}
+
 // Assignment, Submission, Notice, Notification, ActivityLog 타입은 그대로 둡니다.
 export interface Assignment {
   id: number;
@@ -27,6 +37,8 @@ export interface Assignment {
   description: string;
   dueDate: string;
   allowLate: boolean;
+  maxUploadSize?: number | null;
+  allowedExtensions?: string;
 }
 
 export type SubmissionStatus = "제출 전" | "제출 완료" | "지연 제출" | "평가 완료";
@@ -39,6 +51,8 @@ export type Submission = {
   studentUsername?: string;
   file: string | null;
   fileUrl?: string;
+  fileName?: string;
+  fileSize?: number | null;
   description?: string;
   submittedAt: string | null;
   isLate: boolean;
@@ -64,6 +78,14 @@ export interface Notification {
   createdAt: string;
 }
 
+// 커서 기반 페이지네이션 응답 형식입니다. count는 include_total=true일 때만 포함됩니다.
+export interface Paginated<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+  count?: number;
+}
+
 export interface ActivityLog {
     id: number;
     actorUsername: string;
@@ -72,3 +94,33 @@ export interface ActivityLog {
     createdAt: string;
 }
 
+
+// 과목 성적부(GET /courses/:id/gradebook/). 학생별 cells는 assignments와 같은 순서입니다.
+export interface GradebookCell {
+  submissionId: number | null;
+  grade: number | null;
+  isLate: boolean;
+  status: string;
+}
+
+export interface Gradebook {
+  course: { id: number; name: string };
+  assignments: {
+    id: number;
+    title: string;
+    dueDate: string;
+    submitted: number;
+    graded: number;
+    late: number;
+    submissionRate: number | null;
+    mean: number | null;
+    median: number | null;
+  }[];
+  students: {
+    id: number;
+    username: string;
+    submitted: number;
+    average: number | null;
+    cells: GradebookCell[];
+  }[];
+}
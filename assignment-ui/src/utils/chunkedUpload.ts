@@ -0,0 +1,51 @@
+// utils/chunkedUpload.ts
+import apiClient from '../api/api';
+
+interface UploadSession {
+  id: string;
+  received: number;
+  size: number;
+  chunkSize: number;
+}
+
+// 이 크기보다 큰 파일은 조각 업로드를 사용합니다.
+export const CHUNKED_UPLOAD_THRESHOLD = 10 * 1024 * 1024;
+
+const MAX_RETRIES = 3;
+
+// 큰 파일을 조각으로 나누어 올리고, 제출 API에 넘길 upload_id를 돌려줍니다.
+// 조각 전송이 실패하면 서버가 실제로 받은 위치(received)를 확인한 뒤 그 위치부터 이어서 올립니다.
+export async function uploadInChunks(
+  assignmentId: number | string,
+  file: File,
+  onProgress?: (ratio: number) => void
+): Promise<string> {
+  const { data: session } = await apiClient.post<UploadSession>('/uploads/', {
+    assignment: assignmentId,
+    filename: file.name,
+    size: file.size,
+  });
+
+  let offset = 0;
+  let retries = 0;
+  while (offset < file.size) {
+    const end = Math.min(offset + session.chunkSize, file.size);
+    try {
+      const { data } = await apiClient.put<UploadSession>(`/uploads/${session.id}/`, file.slice(offset, end), {
+        headers: {
+          'Content-Type': 'application/octet-stream',
+          'Content-Range': `bytes ${offset}-${end - 1}/${file.size}`,
+        },
+      });
+      offset = data.received;
+      retries = 0;
+    } catch (error) {
+      if (retries >= MAX_RETRIES) throw error;
+      retries += 1;
+      const { data } = await apiClient.get<UploadSession>(`/uploads/${session.id}/`);
+      offset = data.received;
+    }
+    onProgress?.(offset / file.size);
+  }
+  return session.id;
+}
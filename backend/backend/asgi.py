@@ -5,6 +5,12 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+
+실시간 알림 스트림(api/notifications/stream/, core/realtime.py)은 ASGI 서버에서만 동작합니다.
+예) uvicorn backend.asgi:application --workers 4
+
+ASGI로 실행하면 자주 호출되는 목록 API(알림, 내 제출물, 과목/과제 목록)는 비동기 View를 사용합니다.
+(backend/asgi_urls.py, core/async_views.py) DJANGO_ASYNC_VIEWS=false면 WSGI와 같은 동기 View를 사용합니다.
 """
 
 import os
@@ -12,5 +18,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+os.environ.setdefault('DJANGO_ASYNC_VIEWS', 'true')
 
 application = get_asgi_application()
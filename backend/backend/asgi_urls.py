@@ -0,0 +1,13 @@
+"""
+ASGI 서버용 URLconf입니다. backend/urls.py와 같지만, api/의 자주 호출되는 목록 API를
+비동기 View(core/async_views.py)로 연결합니다. DJANGO_ASYNC_VIEWS가 켜져 있으면 사용합니다. (backend/asgi.py)
+"""
+from django.contrib import admin
+from django.urls import path, include
+
+from core.urls import async_urlpatterns
+
+urlpatterns = [
+    path('admin/', admin.site.urls),
+    path('api/', include(async_urlpatterns)),
+]
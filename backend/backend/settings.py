@@ -1,6 +1,8 @@
 from pathlib import Path
 import os
 
+from corsheaders.defaults import default_headers
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -36,6 +38,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # REQUEST_PROFILING["ENABLED"]가 아니면 로드되지 않습니다. 전체 시간을 재도록 가장 바깥에 둡니다.
+    'core.profiling.RequestProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     "corsheaders.middleware.CorsMiddleware",
@@ -47,6 +51,10 @@ MIDDLEWARE = [
 ]
 
 ROOT_URLCONF = 'backend.urls'
+# ASGI 서버(backend/asgi.py)에서는 자주 호출되는 목록 API를 비동기 View로 연결한 URLconf를 사용합니다.
+# DJANGO_ASYNC_VIEWS=false로 끌 수 있습니다. (core/async_views.py)
+if os.environ.get('DJANGO_ASYNC_VIEWS', '').lower() in ('1', 'true', 'yes'):
+    ROOT_URLCONF = 'backend.asgi_urls'
 
 TEMPLATES = [
     {
@@ -118,6 +126,8 @@ CORS_ALLOWED_ORIGINS = [
     'http://localhost:8080',
 ]
 CORS_ALLOW_CREDENTIALS = True
+# 조각 업로드(PUT /api/uploads/<id>/)는 Content-Range 헤더를 사용합니다.
+CORS_ALLOW_HEADERS = (*default_headers, "content-range")
 
 # ✅ 2. 이 프론트엔드 주소가 CSRF 공격으로부터 안전하다고 알려줍니다.
 CSRF_TRUSTED_ORIGINS = ['http://192.168.24.182:8080']
@@ -126,10 +136,108 @@ CSRF_TRUSTED_ORIGINS = ['http://192.168.24.182:8080']
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# 제출 파일은 내용 주소 저장소(core/storage.py)에 저장합니다.
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    "submissions": {"BACKEND": "core.storage.ContentAddressedStorage"},
+}
+
+# 제출 파일 업로드 (core/uploads.py)
+# 업로드 중인 파일은 임시 디렉터리에 바로 기록되며, MEDIA_ROOT와 같은 디스크에 두면 저장 시 복사 없이 이동됩니다.
+SUBMISSION_UPLOAD_TEMP_DIR = BASE_DIR / "var" / "uploads"
+SUBMISSION_MAX_UPLOAD_SIZE = 50 * 1024 * 1024       # 과제에 따로 지정하지 않았을 때의 최대 크기
+SUBMISSION_UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024      # 조각 업로드 시 조각 하나의 최대 크기
+
+# 제출 파일 다운로드 (core/downloads.py)
+# nginx 예시: location /protected-media/ { internal; alias <MEDIA_ROOT>/; }
+# 비워 두면 Django가 FileResponse로 직접 스트리밍합니다(개발 환경).
+SUBMISSION_X_ACCEL_REDIRECT_PREFIX = os.environ.get("SUBMISSION_X_ACCEL_REDIRECT_PREFIX", "")
+SUBMISSION_DOWNLOAD_URL_MAX_AGE = 60 * 60           # 다운로드 링크(서명 토큰) 유효 시간(초)
+
+# Cache
+# 기본은 프로세스 메모리(locmem)이며, REDIS_URL 환경 변수가 있으면 Redis를 사용합니다.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "lms",
+    }
+}
+if os.environ.get("REDIS_URL"):
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ["REDIS_URL"],
+    }
+
+# 실시간 알림 푸시 (core/realtime.py)
+# 기본 브로커는 프로세스 안에서만 전달합니다. 워커가 여러 개이거나 관리 명령에서 만든 알림도
+# 보내려면 REDIS_URL을 설정해 Redis pub/sub을 사용하세요. 스트림은 ASGI 서버에서 실행해야 합니다.
+REALTIME_BROKER = {"BACKEND": "core.realtime.InMemoryBroker"}
+if os.environ.get("REDIS_URL"):
+    REALTIME_BROKER = {"BACKEND": "core.realtime.RedisBroker", "URL": os.environ["REDIS_URL"]}
+REALTIME_HEARTBEAT_SECONDS = 15
+# 알림 스트림 연결용 토큰의 유효 시간(초)입니다. 연결할 때만 확인하므로 짧게 둡니다.
+REALTIME_STREAM_TOKEN_MAX_AGE = 5 * 60
+
+# 읽은 알림은 이 기간(일)이 지나면 prune_notifications 명령으로 지웁니다. (매일 cron 실행 권장)
+NOTIFICATION_RETENTION_DAYS = 90
+
+# 과목/과제/공지 목록 응답 캐시 유지 시간(초) (core/response_cache.py)
+RESPONSE_CACHE_TTL = 300
+
+# 사용자별 과목 소속(담당/수강) 정보 캐시 유지 시간(초) (core/permissions.py)
+MEMBERSHIP_CACHE_TTL = 60
+
+# 관리자 대시보드 통계 캐시 유지 시간(초) (core/stats.py)
+STATS_CACHE_TTL = 60
+
+# ActivityLog 비동기 배치 기록기 (core/activity.py)
+ACTIVITY_LOG_WRITER = {
+    "ASYNC": True,
+    "BATCH_SIZE": 100,          # 이 개수가 쌓이면 바로 저장합니다.
+    "FLUSH_INTERVAL_MS": 500,   # 최소 이 주기마다 저장합니다.
+    "SPOOL_DIR": BASE_DIR / "var" / "activitylog",  # 비정상 종료 대비 임시 기록 위치
+    "STALE_AFTER_SECONDS": 30,
+    "MAX_ATTEMPTS": 5,          # 로그 하나가 이만큼 저장에 실패하면 dead-letter 파일로 옮깁니다.
+}
+
+# 백그라운드 작업 큐 (core/task_queue.py, 작업 정의는 core/tasks.py)
+# 여러 프로세스로 운영하거나 작업을 잃지 않으려면 DatabaseBackend로 바꾸고 run_task_worker 명령을 실행하세요.
+TASK_QUEUE = {
+    "BACKEND": os.environ.get("TASK_QUEUE_BACKEND", "core.task_queue.ThreadPoolBackend"),
+    "WORKERS": 2,
+    "MAX_RETRIES": 3,
+    "RETRY_DELAY_SECONDS": 10,   # 재시도 간격은 10초, 20초, 40초로 늘어납니다.
+    "POLL_INTERVAL_SECONDS": 1,
+    "LEASE_SECONDS": 300,        # DatabaseBackend: 이 시간 안에 끝나지 않은 작업은 다른 워커가 다시 실행합니다.
+    "SCHEDULE": {
+        # run_task_worker가 매시간 마감 24시간 전 알림을 보냅니다. (send_deadline_reminders 명령과 같은 작업)
+        "deadline-reminders": {"task": "core.send_deadline_reminders", "every": 60 * 60, "kwargs": {"hours": 24}},
+    },
+}
+
+# 최근 N개월치 활동 로그만 운영 테이블에 두고, 그 이전 달은 archive_activity_logs 명령으로
+# ACTIVITY_LOG_ARCHIVE_DIR에 jsonl.gz로 내보낸 뒤 지웁니다. (core/log_archive.py, 매월 cron 실행 권장)
+ACTIVITY_LOG_HOT_MONTHS = 6
+ACTIVITY_LOG_ARCHIVE_DIR = BASE_DIR / "var" / "archive" / "activitylog"
+
+# 요청 프로파일링 (core/profiling.py)
+# Server-Timing 헤더, /api/metrics/(Prometheus), 느린 요청의 cProfile 기록을 켭니다.
+REQUEST_PROFILING = {
+    "ENABLED": os.environ.get("REQUEST_PROFILING") == "1",
+    "SERVER_TIMING": True,
+    "DUPLICATE_QUERY_THRESHOLD": 2,  # 한 요청에서 같은 SQL이 이 횟수 이상 실행되면 중복으로 셉니다.
+    "SLOW_REQUEST_MS": 500,          # 이보다 느린 요청은 로그를 남깁니다.
+    "SAMPLE_RATE": float(os.environ.get("REQUEST_PROFILING_SAMPLE_RATE", "0")),  # cProfile로 측정할 요청 비율
+    "PROFILE_DIR": BASE_DIR / "var" / "profiles",
+    "METRICS_TOKEN": os.environ.get("METRICS_TOKEN", ""),
+}
+
 # DRF + JWT
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # 액세스 토큰의 클레임으로 사용자를 만들고 DB를 조회하지 않습니다. (core/authentication.py)
+        "core.authentication.ClaimsJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -141,5 +249,17 @@ REST_FRAMEWORK = {
     "DEFAULT_PARSER_CLASSES": (
         "djangorestframework_camel_case.parser.CamelCaseJSONParser",
     ),
+    # 모든 목록 API는 커서 기반 페이지네이션을 사용합니다. (core/pagination.py)
+    "DEFAULT_PAGINATION_CLASS": "core.pagination.KeysetCursorPagination",
+    "PAGE_SIZE": 20,
 }
 
+SIMPLE_JWT = {
+    # 액세스 토큰에 username, role 클레임을 넣고, 폐기된 리프레시 토큰은 거부합니다.
+    "TOKEN_OBTAIN_SERIALIZER": "core.authentication.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "core.authentication.DenylistTokenRefreshSerializer",
+}
+
+# 폐기된 토큰 목록(denylist) 캐시 유지 시간(초). 폐기 시에는 바로 갱신됩니다. (core/authentication.py)
+TOKEN_DENYLIST_CACHE_TTL = 300
+
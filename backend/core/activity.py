@@ -0,0 +1,344 @@
+"""
+ActivityLog 비동기 배치 기록기입니다.
+
+요청 처리 중에는 로그를 메모리 버퍼에 넣기만 하고, 백그라운드 스레드가
+BATCH_SIZE개가 모이거나 FLUSH_INTERVAL_MS가 지나면 bulk_create로 한 번에 저장합니다.
+
+- 내구성: 버퍼에 넣기 전에 프로세스별 spool 파일(JSONL)에 먼저 기록합니다. 기록할 때마다 OS로 flush하고,
+  백그라운드 스레드가 FLUSH_INTERVAL_MS마다 fsync하므로 서버가 꺼져도 잃는 로그는 그 사이의 것뿐입니다.
+  프로세스가 비정상 종료되면, 다음에 시작하는 기록기가 오래된 spool 파일을 찾아 다시 저장합니다.
+  (DB 저장 직후 spool 정리 전에 종료되면 같은 로그가 한 번 더 저장될 수 있습니다: at-least-once)
+- 살아 있는 기록기의 spool은 복구하지 않습니다. 기록기는 spool 파일에 배타적 잠금(flock)을 걸어 두고,
+  DB 저장이 실패하는 동안에도 spool의 수정 시각을 계속 갱신합니다. (잠금은 POSIX에서만 사용합니다)
+  복구는 백그라운드 스레드가 STALE_AFTER_SECONDS마다 시도하므로, 시작할 때 DB가 아직 떠 있지 않아도 나중에 복구됩니다.
+  복구 중에 실패한 파일(spool-*.claimed-<pid>)도 다음 복구에서 다시 찾습니다.
+- DB 장애로 저장하지 못한 로그는 계속 다시 시도합니다. 반면 로그 자체가 문제인 경우(삭제된 사용자 등으로
+  IntegrityError/DataError)는 하나씩 저장해 그 로그만 골라내고, MAX_ATTEMPTS번 실패하면
+  SPOOL_DIR/dead-letter.jsonl로 옮기고(에러 로그도 남깁니다) 더는 시도하지 않습니다.
+- 종료 시: atexit에서 남은 버퍼를 모두 저장(drain)합니다.
+- 순서: created_at은 log_activity 호출 시각으로 기록되며, 버퍼는 FIFO로 저장됩니다.
+
+settings.ACTIVITY_LOG_WRITER로 설정하며, ASYNC가 False이면 바로 ActivityLog.objects.create를 호출합니다.
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from django.conf import settings
+from django.db import DataError, IntegrityError, close_old_connections, connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import ActivityLog
+from .search import index_documents
+
+DEFAULTS = {
+    'ASYNC': True,
+    'BATCH_SIZE': 100,
+    'FLUSH_INTERVAL_MS': 500,
+    'SPOOL_DIR': None,
+    # 이 시간 동안 갱신되지 않은 spool 파일은 종료된 프로세스의 것으로 보고 복구합니다.
+    'STALE_AFTER_SECONDS': 30,
+    # 로그 하나가 이 횟수만큼 저장에 실패하면 dead-letter 파일로 옮깁니다.
+    'MAX_ATTEMPTS': 5,
+}
+# 다시 시도해도 성공하지 않는, 로그 자체의 문제로 보는 에러입니다. 나머지(OperationalError 등)는 DB 장애로 봅니다.
+ENTRY_ERRORS = (IntegrityError, DataError)
+DEAD_LETTER_NAME = 'dead-letter.jsonl'
+
+logger = logging.getLogger(__name__)
+
+
+def get_writer_settings():
+    return {**DEFAULTS, **getattr(settings, 'ACTIVITY_LOG_WRITER', {})}
+
+
+class ActivityLogWriter:
+    def __init__(self, batch_size=100, flush_interval_ms=500, spool_dir=None, stale_after_seconds=30, max_attempts=5):
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.flush_interval = flush_interval_ms / 1000
+        self.stale_after_seconds = stale_after_seconds
+        self.spool_dir = Path(spool_dir) if spool_dir else None
+        self.spool_path = None
+        if self.spool_dir:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            self.spool_path = self.spool_dir / f'spool-{os.getpid()}-{time.time_ns()}.jsonl'
+
+        self._spool_file = None
+        self._spool_dirty = False
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._next_recovery = 0
+
+    # --- 기록 ---
+    def log(self, actor, action_type, details=''):
+        entry = {
+            'actor_id': actor.pk,
+            'action_type': action_type,
+            'details': details,
+            'created_at': timezone.now().isoformat(),
+        }
+        with self._lock:
+            if self.spool_path:
+                spool = self._open_spool()
+                spool.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                spool.flush()
+                self._spool_dirty = True
+            self._buffer.append(entry)
+            buffered = len(self._buffer)
+        if buffered >= self.batch_size:
+            self._wakeup.set()
+
+    def flush(self):
+        """버퍼에 쌓인 로그를 모두 저장합니다. 저장한 개수를 돌려줍니다."""
+        with self._flush_lock:
+            with self._lock:
+                entries, self._buffer = self._buffer, []
+            if not entries:
+                return 0
+            try:
+                saved, retry = self.save(entries)
+            except Exception:
+                # 저장에 실패한 로그는 다음 flush에서 다시 시도합니다. (spool에는 그대로 남아 있습니다)
+                with self._lock:
+                    self._buffer = entries + self._buffer
+                raise
+            with self._lock:
+                self._buffer = retry + self._buffer
+                self._rewrite_spool()
+            return saved
+
+    def save(self, entries):
+        """
+        로그를 저장하고 (저장한 개수, 다시 시도할 로그 목록)을 돌려줍니다.
+        한 번에 저장하다 ENTRY_ERRORS가 나면 하나씩 저장해 문제가 있는 로그만 남기고, DB 장애는 그대로 올려 보냅니다.
+        """
+        try:
+            with transaction.atomic():
+                save_entries(entries, self.batch_size)
+            return len(entries), []
+        except ENTRY_ERRORS:
+            pass
+        saved, retry = 0, []
+        for index, entry in enumerate(entries):
+            try:
+                with transaction.atomic():
+                    save_entries([entry], self.batch_size)
+            except ENTRY_ERRORS as exc:
+                entry['attempts'] = entry.get('attempts', 0) + 1
+                if entry['attempts'] >= self.max_attempts:
+                    self._dead_letter(entry, exc)
+                else:
+                    retry.append(entry)
+            except Exception:
+                # 도중에 DB 장애가 나면 남은 로그는 다음에 다시 시도합니다.
+                retry.extend(entries[index:])
+                break
+            else:
+                saved += 1
+        return saved, retry
+
+    def _dead_letter(self, entry, exc):
+        logger.error('Dropping activity log after %d failed attempts: %r (%s)', entry['attempts'], entry, exc)
+        if self.spool_dir:
+            with open(self.spool_dir / DEAD_LETTER_NAME, 'a', encoding='utf-8') as dead_letter:
+                dead_letter.write(json.dumps({**entry, 'error': str(exc)}, ensure_ascii=False) + '\n')
+
+    def _open_spool(self):
+        # 추가 모드로 열어 둔 spool 파일입니다. 열 때 배타적 잠금을 걸어 다른 프로세스가 복구하지 못하게 합니다.
+        if self._spool_file is None:
+            self._spool_file = open(self.spool_path, 'a', encoding='utf-8')
+            if fcntl is not None:
+                fcntl.flock(self._spool_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return self._spool_file
+
+    def close_spool(self):
+        """spool 파일을 닫고 잠금을 풉니다. (self._lock을 잡은 상태 또는 종료 시 호출)"""
+        if self._spool_file is not None:
+            self._spool_file.close()
+            self._spool_file = None
+
+    def sync_spool(self):
+        """지금까지 기록한 spool 내용을 디스크에 씁니다(fsync)."""
+        with self._lock:
+            if self._spool_file is not None and self._spool_dirty:
+                os.fsync(self._spool_file.fileno())
+                self._spool_dirty = False
+
+    def _rewrite_spool(self):
+        # 아직 저장되지 않은 로그만 spool에 남깁니다. (self._lock을 잡은 상태에서 호출)
+        if not self.spool_path:
+            return
+        if not self._buffer:
+            self.spool_path.unlink(missing_ok=True)
+            self.close_spool()
+            return
+        tmp_path = self.spool_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as spool:
+            for entry in self._buffer:
+                spool.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            spool.flush()
+            os.fsync(spool.fileno())
+        # 새 파일은 방금 수정되었으므로 잠그기 전에도 복구 대상(오래된 파일)이 되지 않습니다.
+        os.replace(tmp_path, self.spool_path)
+        self.close_spool()
+        self._open_spool()
+        self._spool_dirty = False
+
+    # --- 백그라운드 스레드 ---
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='activity-log-writer', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.tick()
+        connection.close()
+
+    def tick(self):
+        """백그라운드 스레드가 주기마다 하는 일: spool fsync, 버퍼 저장, 다른 프로세스의 spool 복구, spool 수정 시각 갱신."""
+        try:
+            self.sync_spool()
+            self.flush()
+            # 복구가 실패하면(시작할 때 DB가 아직 안 떠 있는 등) 다음 주기에 다시 시도합니다.
+            if time.monotonic() >= self._next_recovery:
+                self.recover()
+                self._next_recovery = time.monotonic() + self.stale_after_seconds
+        except Exception:
+            close_old_connections()
+        finally:
+            # 저장이 실패해도 살아 있다는 표시로 수정 시각을 갱신합니다.
+            self._touch_spool()
+
+    def _touch_spool(self):
+        if self.spool_path and self.spool_path.exists():
+            os.utime(self.spool_path)
+
+    def shutdown(self):
+        """백그라운드 스레드를 멈추고 남은 로그를 모두 저장합니다."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        with self._lock:
+            self.close_spool()
+
+    # --- 복구 ---
+    def recover(self):
+        """종료된 프로세스가 남긴 spool 파일의 로그를 저장합니다. 복구한 개수를 돌려줍니다."""
+        if not self.spool_dir:
+            return 0
+        recovered = 0
+        deadline = time.time() - self.stale_after_seconds
+        paths = sorted([*self.spool_dir.glob('spool-*.jsonl'), *self.spool_dir.glob('spool-*.claimed-*')])
+        for path in paths:
+            if path == self.spool_path:
+                continue
+            try:
+                if path.stat().st_mtime > deadline:
+                    continue
+                spool = open(path, 'r+', encoding='utf-8')
+            except FileNotFoundError:
+                continue
+            with spool:
+                if not claim_spool(spool, path):
+                    continue
+                # 다른 프로세스와 동시에 복구하지 않도록 파일 이름을 바꿔 먼저 선점합니다.
+                # 복구하다 실패하면 이 이름(spool-*.claimed-<pid>)으로 남아 다음 복구에서 다시 찾습니다.
+                claimed = path.with_suffix(f'.claimed-{os.getpid()}')
+                try:
+                    os.replace(path, claimed)
+                except FileNotFoundError:
+                    continue
+                entries = [json.loads(line) for line in spool if line.strip()]
+                saved, retry = self.save(entries)
+                recovered += saved
+                if retry:
+                    # 아직 다시 시도할 로그만 남겨 둡니다.
+                    spool.seek(0)
+                    spool.truncate()
+                    spool.writelines(json.dumps(entry, ensure_ascii=False) + '\n' for entry in retry)
+                    spool.flush()
+                    os.fsync(spool.fileno())
+                else:
+                    claimed.unlink()
+        return recovered
+
+
+def claim_spool(spool, path):
+    """
+    열어 둔 spool 파일에 배타적 잠금을 겁니다. 살아 있는 기록기나 다른 복구가 잡고 있으면 False입니다.
+    잠그는 사이에 그 이름의 파일이 바뀌었으면(이미 복구되어 지워졌거나 새로 쓰였으면) 역시 False입니다.
+    """
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(spool, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    try:
+        return os.stat(path).st_ino == os.fstat(spool.fileno()).st_ino
+    except FileNotFoundError:
+        return False
+
+
+def save_entries(entries, batch_size):
+    # bulk_create는 post_save 시그널을 보내지 않으므로 검색 색인도 여기서 만듭니다.
+    logs = ActivityLog.objects.bulk_create([
+        ActivityLog(
+            actor_id=entry['actor_id'],
+            action_type=entry['action_type'],
+            details=entry['details'],
+            created_at=parse_datetime(entry['created_at']),
+        )
+        for entry in entries
+    ], batch_size=batch_size)
+    index_documents('log', logs, created=True)
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            config = get_writer_settings()
+            _writer = ActivityLogWriter(
+                batch_size=config['BATCH_SIZE'],
+                flush_interval_ms=config['FLUSH_INTERVAL_MS'],
+                spool_dir=config['SPOOL_DIR'],
+                stale_after_seconds=config['STALE_AFTER_SECONDS'],
+                max_attempts=config['MAX_ATTEMPTS'],
+            )
+            _writer.start()
+            atexit.register(_writer.shutdown)
+        return _writer
+
+
+def log_activity(actor, action_type, details=''):
+    """ActivityLog를 기록합니다. 비동기 모드에서는 버퍼에 넣고 바로 돌아갑니다."""
+    if not get_writer_settings()['ASYNC']:
+        return ActivityLog.objects.create(actor=actor, action_type=action_type, details=details)
+    get_writer().log(actor, action_type, details)
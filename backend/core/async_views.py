@@ -0,0 +1,93 @@
+"""
+자주 호출되는 읽기 API(알림, 내 제출물, 과목/과제 목록)의 비동기 View입니다.
+
+ASGI 서버에서는 backend/asgi_urls.py가 같은 경로에 이 View를 연결합니다. (backend/asgi.py)
+ASGI에서 동기 View는 요청 전체가 하나의 동기 스레드로 넘겨져 차례로 실행되지만, 이 View는 이벤트 루프에서 실행되고
+DB 조회만 비동기 ORM(acount, async for)으로 기다립니다. 그래서 마감 직전처럼 동시 연결이 많을 때
+워커 하나가 더 많은 연결을 붙잡고 있을 수 있습니다.
+다만 Django의 비동기 ORM도 쿼리는 하나의 동기 스레드에서 차례로 실행하므로 쿼리 처리량 자체는 늘지 않습니다.
+배포 전에 benchmark_asgi 명령으로 WSGI와 비교하세요. (core/benchmark.py)
+
+- 인증·권한·필터·정렬·페이지네이션·직렬화·응답 캐시(ETag/304)는 sync_view(동기 View)의 설정과 코드를
+  그대로 사용하므로 응답도 같습니다.
+- 응답은 JSON만 보냅니다. Browsable API는 동기 View(WSGI)에서 사용하세요.
+- GET 외의 요청(과목/과제 생성, OPTIONS)은 sync_view가 처리합니다.
+- 직렬화 중에 지연 로딩으로 DB를 조회하면 SynchronousOnlyOperation이 납니다. get_queryset에서 미리 불러오세요.
+"""
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+
+from . import views
+from .response_cache import CachedResponseMixin
+
+
+def rendered(response):
+    """
+    DRF Response를 렌더링한 HttpResponse로 바꿉니다.
+    Django의 ASGI 핸들러는 render()가 남은 응답을 동기 스레드로 넘겨 렌더링하므로, 여기서 미리 렌더링합니다.
+    """
+    response.render()
+    return HttpResponse(response.content, status=response.status_code, headers=response.headers)
+
+
+class AsyncListAPIView(View):
+    """sync_view(generics.ListAPIView 하위 클래스)의 GET을 비동기로 실행합니다."""
+    sync_view = None
+    sync_handler = None
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        # DRF View처럼 CSRF 검사를 하지 않습니다. 인증은 Authorization 헤더(JWT)로 합니다.
+        return csrf_exempt(super().as_view(sync_handler=cls.sync_view.as_view(), **initkwargs))
+
+    async def get(self, request, *args, **kwargs):
+        # APIView.dispatch와 같은 순서로 처리하되, 쿼리셋 조회만 await합니다.
+        view = self.sync_view()
+        view.setup(request, *args, **kwargs)
+        view.renderer_classes = [CamelCaseJSONRenderer]
+        request = view.request = view.initialize_request(request, *args, **kwargs)
+        view.headers = view.default_response_headers
+        try:
+            # 인증에서 폐기된 토큰 목록을 DB에서 읽을 수 있으므로 동기 스레드에서 실행합니다.
+            await sync_to_async(view.initial)(request, *args, **kwargs)
+            if isinstance(view, CachedResponseMixin):
+                response = await view.acached_response(lambda request: self.list(view, request), request)
+            else:
+                response = await self.list(view, request)
+        except Exception as exc:
+            response = view.handle_exception(exc)
+        return rendered(view.finalize_response(request, response, *args, **kwargs))
+
+    async def list(self, view, request):
+        queryset = view.filter_queryset(view.get_queryset())
+        page = await view.paginator.apaginate_queryset(queryset, request, view=view)
+        return view.get_paginated_response(view.get_serializer(page, many=True).data)
+
+    async def options(self, request, *args, **kwargs):
+        return await sync_to_async(self.sync_handler)(request, *args, **kwargs)
+
+
+class AsyncListCreateAPIView(AsyncListAPIView):
+    """POST(생성)는 sync_view가 처리합니다."""
+    async def post(self, request, *args, **kwargs):
+        return await sync_to_async(self.sync_handler)(request, *args, **kwargs)
+
+
+class NotificationListView(AsyncListAPIView):
+    sync_view = views.NotificationListView
+
+
+class MySubmissionsListView(AsyncListAPIView):
+    sync_view = views.MySubmissionsListView
+
+
+class CourseListCreateView(AsyncListCreateAPIView):
+    sync_view = views.CourseListCreateView
+
+
+class AssignmentListCreateView(AsyncListCreateAPIView):
+    sync_view = views.AssignmentListCreateView
@@ -0,0 +1,153 @@
+"""
+JWT 인증입니다. 요청마다 User를 조회하지 않습니다.
+
+- 로그인/토큰 갱신 시 액세스 토큰에 username, role 클레임을 넣습니다. (ClaimsTokenObtainPairSerializer)
+- ClaimsJWTAuthentication은 클레임만으로 User 인스턴스를 만듭니다. id/username/role 외의 필드(email 등)는
+  지연 로딩(deferred)되어 처음 접근할 때 조회되며, 외래 키 값이나 isinstance 검사에도 그대로 쓸 수 있습니다.
+  클레임이 없는 예전 토큰은 기존처럼 DB에서 조회합니다.
+- 폐기는 RevokedToken(denylist)으로 확인합니다. 만료되지 않은 항목만 캐시에 한 덩어리로 두고,
+  폐기할 때 네임스페이스 버전(core/response_cache.py)을 올려 바로 새로 읽습니다.
+  역할·활성 상태·비밀번호가 바뀌면(core/signals.py) 그 사용자의 기존 토큰을 모두 폐기하므로
+  토큰의 role 클레임이 실제 역할과 어긋난 채로 쓰이지 않습니다.
+  iat는 초 단위라 폐기와 같은 초에 발급된 토큰을 구분할 수 없으므로, 밀리초 단위 발급 시각(iat_ms)을 함께 넣어 비교합니다.
+"""
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import RevokedToken, User
+from .response_cache import get_versions, invalidate
+
+# 토큰에 넣는 User 필드입니다. (클레임 이름 = 필드 이름)
+CLAIM_FIELDS = ('username', 'role')
+DENYLIST_NAMESPACE = 'token-denylist'
+ISSUED_AT_MS_CLAIM = 'iat_ms'
+
+
+# --- 토큰 발급 ---
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        for field in CLAIM_FIELDS:
+            token[field] = getattr(user, field)
+        # 리프레시 토큰으로 받은 액세스 토큰에도 그대로 복사됩니다.
+        token[ISSUED_AT_MS_CLAIM] = int(token.current_time.timestamp() * 1000)
+        return token
+
+
+class DenylistTokenRefreshSerializer(TokenRefreshSerializer):
+    """폐기된 리프레시 토큰으로는 새 액세스 토큰을 받을 수 없습니다."""
+    def validate(self, attrs):
+        if is_revoked(self.token_class(attrs['refresh'])):
+            raise InvalidToken('Token has been revoked.')
+        return super().validate(attrs)
+
+
+def token_user_id(token):
+    # simplejwt는 사용자 id를 문자열로 넣습니다.
+    return User._meta.pk.to_python(token.get(api_settings.USER_ID_CLAIM))
+
+
+# --- 폐기 목록 ---
+def token_expires_at(token):
+    return datetime.fromtimestamp(token['exp'], tz=dt_timezone.utc)
+
+
+def invalidate_denylist_on_commit():
+    transaction.on_commit(lambda: invalidate([DENYLIST_NAMESPACE]))
+
+
+def prune_denylist():
+    """만료된 토큰의 폐기 항목은 더 확인할 필요가 없으므로 지웁니다."""
+    RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+
+
+def revoke_token(token):
+    """토큰 하나(jti)를 폐기합니다. 로그아웃 시 액세스/리프레시 토큰에 사용합니다."""
+    prune_denylist()
+    RevokedToken.objects.create(
+        user_id=token_user_id(token), jti=token[api_settings.JTI_CLAIM],
+        expires_at=token_expires_at(token),
+    )
+    invalidate_denylist_on_commit()
+
+
+def revoke_user_tokens(user_id):
+    """지금까지 그 사용자에게 발급된 모든 토큰을 폐기합니다."""
+    prune_denylist()
+    lifetime = max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME)
+    now = timezone.now()
+    RevokedToken.objects.create(user_id=user_id, jti='', revoked_at=now, expires_at=now + lifetime)
+    invalidate_denylist_on_commit()
+
+
+def load_denylist():
+    """(폐기된 jti 집합, {사용자 id: 이 시각(timestamp) 이전에 발급된 토큰은 폐기})"""
+    jtis, cutoffs = set(), {}
+    rows = RevokedToken.objects.filter(expires_at__gt=timezone.now()).values_list('user_id', 'jti', 'revoked_at')
+    for user_id, jti, revoked_at in rows:
+        if jti:
+            jtis.add(jti)
+        else:
+            cutoffs[user_id] = max(cutoffs.get(user_id, 0), revoked_at.timestamp())
+    return frozenset(jtis), cutoffs
+
+
+def get_denylist():
+    version = get_versions([DENYLIST_NAMESPACE])[0]
+    key = f'token-denylist:{version!r}'
+    denylist = cache.get(key)
+    if denylist is None:
+        denylist = load_denylist()
+        cache.set(key, denylist, getattr(settings, 'TOKEN_DENYLIST_CACHE_TTL', 300))
+    return denylist
+
+
+def is_revoked(token):
+    jtis, cutoffs = get_denylist()
+    if token.get(api_settings.JTI_CLAIM) in jtis:
+        return True
+    cutoff = cutoffs.get(token_user_id(token))
+    if cutoff is None:
+        return False
+    if ISSUED_AT_MS_CLAIM in token:
+        return token[ISSUED_AT_MS_CLAIM] / 1000 < cutoff
+    # iat_ms가 없는 예전 토큰은 초 단위로 비교합니다. 같은 초에 발급된 토큰은 폐기하지 않습니다.
+    return token.get('iat', 0) < int(cutoff)
+
+
+def is_user_revoked(user_id, issued_at, jti=None):
+    """
+    JWT가 아닌 다른 자격 증명(알림 스트림 토큰 등)의 폐기 여부입니다.
+    jti가 폐기되었거나, 발급 시각(issued_at, timestamp)이 그 사용자의 폐기 시각보다 이르면 True입니다.
+    """
+    jtis, cutoffs = get_denylist()
+    if jti and jti in jtis:
+        return True
+    cutoff = cutoffs.get(user_id)
+    return cutoff is not None and issued_at < cutoff
+
+
+# --- 인증 ---
+def user_from_claims(token):
+    """클레임으로 User 인스턴스를 만듭니다. 나머지 필드는 지연 로딩되고, save()는 불러온 필드만 저장합니다."""
+    field_names = ['id', *CLAIM_FIELDS]
+    values = [token_user_id(token), *(token[field] for field in CLAIM_FIELDS)]
+    return User.from_db(DEFAULT_DB_ALIAS, field_names, values)
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if is_revoked(validated_token):
+            raise InvalidToken('Token has been revoked.')
+        if api_settings.USER_ID_CLAIM in validated_token and all(field in validated_token for field in CLAIM_FIELDS):
+            return user_from_claims(validated_token)
+        return super().get_user(validated_token)
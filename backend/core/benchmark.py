@@ -0,0 +1,301 @@
+"""
+API 벤치마크입니다. (benchmark_api 명령)
+
+core/urls.py의 실제 URLconf를 DRF 테스트 클라이언트로 같은 프로세스 안에서 호출하고,
+엔드포인트마다 지연 시간(p50/p95/p99)과 쿼리 수를 잽니다. 미들웨어·인증·권한·직렬화·렌더링까지 포함되며,
+인증은 로그인 API가 발급하는 것과 같은 JWT 액세스 토큰(Authorization 헤더)으로 합니다.
+네트워크와 웹 서버(gunicorn/uvicorn) 비용은 포함하지 않습니다.
+
+결과는 JSON으로 저장해 커밋 사이에 비교합니다(compare_results). 데이터는 seed_data 명령으로 만듭니다.
+
+run_throughput(benchmark_asgi 명령)은 자주 호출되는 목록 API를 동시에 호출해 WSGI와 ASGI의 처리량을 비교합니다.
+- wsgi: 동기 View(backend/urls.py)를 동시 요청 수만큼의 스레드에서 호출합니다. (gunicorn --threads N 워커 하나)
+- asgi: 비동기 View(backend/asgi_urls.py)를 이벤트 루프 하나에서 동시에 호출합니다. (uvicorn 워커 하나)
+  동기 코드(비동기 ORM 포함)는 uvicorn과 같이 하나의 동기 스레드에서 실행됩니다.
+  네트워크 없이 같은 프로세스에서 호출하므로, 느린 클라이언트나 오래 열린 연결(SSE 등)이 많을 때의 이점은 드러나지 않습니다.
+"""
+import asyncio
+import statistics
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, connections
+from django.test import AsyncClient, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .authentication import ClaimsTokenObtainPairSerializer
+from .models import User, Course, Assignment, Submission, Notice, Notification, ActivityLog
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    name: str
+    role: str
+    # BenchmarkContext -> 요청 경로(쿼리 문자열 포함)
+    path: Callable
+
+
+@dataclass
+class BenchmarkContext:
+    student: User
+    professor: User
+    admin: User
+    course_id: int
+    assignment_id: int
+
+    def user(self, role):
+        return getattr(self, role)
+
+
+ENDPOINTS = [
+    Endpoint('courses.list', 'student', lambda c: reverse('course-list-create')),
+    Endpoint('assignments.list', 'student', lambda c: reverse('assignment-list-create')),
+    Endpoint('my-submissions.list', 'student', lambda c: reverse('my-submissions-list')),
+    Endpoint('notices.list', 'student', lambda c: reverse('notice-list-create')),
+    Endpoint('notifications.list', 'student', lambda c: reverse('notification-list')),
+    Endpoint('notifications.unread-count', 'student', lambda c: reverse('notification-unread-count')),
+    Endpoint('search', 'student', lambda c: reverse('search') + '?q=과제'),
+    Endpoint('courses.detail', 'professor', lambda c: reverse('course-detail', kwargs={'pk': c.course_id})),
+    Endpoint('assignment.submissions', 'professor',
+             lambda c: reverse('assignment-submissions-list', kwargs={'assignment_id': c.assignment_id})),
+    Endpoint('course.gradebook', 'professor', lambda c: reverse('course-gradebook', kwargs={'pk': c.course_id})),
+    Endpoint('admin.stats', 'admin', lambda c: reverse('admin-stats')),
+    Endpoint('admin.users', 'admin', lambda c: reverse('admin-user-list')),
+    Endpoint('admin.logs', 'admin', lambda c: reverse('activity-log-list')),
+]
+
+
+def build_context():
+    """
+    제출물이 있는 과제를 가진 교수, 그 과목의 수강생, 관리자를 id 순으로 고릅니다.
+    데이터가 같으면 매번 같은 사용자가 골라지므로 실행 사이의 결과를 비교할 수 있습니다. 없으면 None입니다.
+    """
+    submission = Submission.objects.select_related('assignment__course').order_by('id').first()
+    admin = User.objects.filter(role='admin').order_by('id').first()
+    if submission is None or admin is None:
+        return None
+    course = submission.assignment.course
+    return BenchmarkContext(
+        student=course.students.order_by('id').first() or submission.student,
+        professor=course.professor,
+        admin=admin,
+        course_id=course.id,
+        assignment_id=submission.assignment_id,
+    )
+
+
+def percentile(sorted_values, percent):
+    """nearest-rank 방식의 백분위수입니다."""
+    index = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def server_name():
+    hosts = [host for host in settings.ALLOWED_HOSTS if host not in ('*',) and not host.startswith('.')]
+    return hosts[0] if hosts else 'localhost'
+
+
+def measure(client, path, requests, warmup, cold_cache):
+    for _ in range(warmup):
+        client.get(path)
+    timings, queries, status_codes, size = [], [], set(), 0
+    for _ in range(requests):
+        if cold_cache:
+            cache.clear()
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = client.get(path)
+            timings.append((time.perf_counter() - started) * 1000)
+        queries.append(len(captured))
+        status_codes.add(response.status_code)
+        size = len(response.content)
+    timings.sort()
+    return {
+        'path': path,
+        'status': sorted(status_codes),
+        'requests': requests,
+        'p50_ms': round(percentile(timings, 50), 3),
+        'p95_ms': round(percentile(timings, 95), 3),
+        'p99_ms': round(percentile(timings, 99), 3),
+        'mean_ms': round(statistics.fmean(timings), 3),
+        'queries': max(queries),
+        'bytes': size,
+    }
+
+
+def git_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=settings.BASE_DIR, capture_output=True, text=True,
+                                timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def dataset_size():
+    return {
+        model._meta.model_name: model.objects.count()
+        for model in (User, Course, Assignment, Submission, Notice, Notification, ActivityLog)
+    }
+
+
+def run_info(**options):
+    return {
+        'created_at': timezone.now().isoformat(),
+        'git_commit': git_commit(),
+        'database': connection.vendor,
+        **options,
+        'dataset': dataset_size(),
+    }
+
+
+def run_benchmark(requests=50, warmup=5, cold_cache=False, only=None, context=None):
+    """엔드포인트별 측정 결과와 실행 정보를 JSON으로 저장할 수 있는 dict로 돌려줍니다."""
+    context = context or build_context()
+    if context is None:
+        raise ValueError('No data to benchmark. Run "manage.py seed_data" first.')
+    client = APIClient(SERVER_NAME=server_name())
+    results = {}
+    for endpoint in ENDPOINTS:
+        if only and endpoint.name not in only:
+            continue
+        token = ClaimsTokenObtainPairSerializer.get_token(context.user(endpoint.role)).access_token
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        results[endpoint.name] = measure(client, endpoint.path(context), requests, warmup, cold_cache)
+    return {
+        'meta': run_info(requests=requests, warmup=warmup, cold_cache=cold_cache),
+        'endpoints': results,
+    }
+
+
+def compare_results(previous, current, threshold):
+    """
+    두 실행 결과를 엔드포인트별로 비교합니다.
+    p95가 threshold(%)보다 많이 늘었거나 쿼리 수가 늘었으면 regressed입니다.
+    """
+    rows = []
+    for name, now in current['endpoints'].items():
+        before = previous.get('endpoints', {}).get(name)
+        if before is None:
+            continue
+        change = (now['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100 if before['p95_ms'] else 0.0
+        rows.append({
+            'name': name,
+            'p95_before': before['p95_ms'], 'p95_after': now['p95_ms'], 'p95_change': round(change, 1),
+            'queries_before': before['queries'], 'queries_after': now['queries'],
+            'regressed': change > threshold or now['queries'] > before['queries'],
+        })
+    return rows
+
+
+# --- WSGI / ASGI 처리량 비교 ---
+THROUGHPUT_ENDPOINTS = ['courses.list', 'assignments.list', 'my-submissions.list', 'notifications.list']
+SERVER_URLCONFS = {'wsgi': 'backend.urls', 'asgi': 'backend.asgi_urls'}
+
+
+def throughput_jobs(context, requests, only=None):
+    """엔드포인트를 번갈아 가며 호출할 (경로, 헤더) 목록입니다."""
+    targets = []
+    for endpoint in ENDPOINTS:
+        if endpoint.name in THROUGHPUT_ENDPOINTS and (not only or endpoint.name in only):
+            token = ClaimsTokenObtainPairSerializer.get_token(context.user(endpoint.role)).access_token
+            targets.append((endpoint.path(context), {'Authorization': f'Bearer {token}'}))
+    return [targets[i % len(targets)] for i in range(requests)]
+
+
+def wsgi_load(jobs, concurrency):
+    """jobs를 concurrency개의 스레드에서 나눠 호출하고 (지연 시간 목록, 상태 코드 목록)을 돌려줍니다."""
+    timings, status_codes = [], []
+    lock = threading.Lock()
+    jobs = iter(jobs)
+
+    def next_job():
+        with lock:
+            return next(jobs, None)
+
+    def worker():
+        client = Client()
+        try:
+            while (job := next_job()) is not None:
+                started = time.perf_counter()
+                response = client.get(job[0], headers=job[1])
+                with lock:
+                    timings.append((time.perf_counter() - started) * 1000)
+                    status_codes.append(response.status_code)
+        finally:
+            if threading.current_thread() is not threading.main_thread():
+                connections.close_all()
+
+    if concurrency == 1:
+        worker()
+    else:
+        threads = [threading.Thread(target=worker, name=f'bench-wsgi-{i}') for i in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return timings, status_codes
+
+
+async def asgi_load(jobs, concurrency):
+    """jobs를 이벤트 루프 하나에서 concurrency개씩 동시에 호출하고 (지연 시간 목록, 상태 코드 목록)을 돌려줍니다."""
+    client = AsyncClient()
+    timings, status_codes = [], []
+    jobs = iter(jobs)
+
+    async def worker():
+        for path, headers in jobs:
+            started = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            timings.append((time.perf_counter() - started) * 1000)
+            status_codes.append(response.status_code)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return timings, status_codes
+
+
+def run_throughput(requests=400, concurrency=16, warmup=5, only=None, servers=('wsgi', 'asgi'), context=None):
+    """서버 방식별 처리량(요청/초)과 지연 시간을 JSON으로 저장할 수 있는 dict로 돌려줍니다."""
+    context = context or build_context()
+    if context is None:
+        raise ValueError('No data to benchmark. Run "manage.py seed_data" first.')
+    jobs = throughput_jobs(context, requests, only)
+    warmup_jobs = throughput_jobs(context, warmup * len(THROUGHPUT_ENDPOINTS), only)
+    results = {}
+    # AsyncClient는 Host 헤더를 항상 testserver로 보내므로 두 방식 모두 testserver로 호출합니다.
+    allowed_hosts = [*settings.ALLOWED_HOSTS, 'testserver']
+    for server in servers:
+        with override_settings(ROOT_URLCONF=SERVER_URLCONFS[server], ALLOWED_HOSTS=allowed_hosts):
+            if server == 'wsgi':
+                wsgi_load(warmup_jobs, 1)
+                started = time.perf_counter()
+                timings, status_codes = wsgi_load(jobs, concurrency)
+            else:
+                async_to_sync(asgi_load)(warmup_jobs, 1)
+                started = time.perf_counter()
+                timings, status_codes = async_to_sync(asgi_load)(jobs, concurrency)
+            elapsed = time.perf_counter() - started
+        timings.sort()
+        results[server] = {
+            'requests': len(timings),
+            'seconds': round(elapsed, 3),
+            'requests_per_second': round(len(timings) / elapsed, 1),
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p95_ms': round(percentile(timings, 95), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+            'errors': sum(1 for code in status_codes if code != 200),
+        }
+    return {
+        'meta': run_info(requests=requests, concurrency=concurrency, warmup=warmup,
+                         endpoints=sorted({path for path, _ in jobs})),
+        'servers': results,
+    }
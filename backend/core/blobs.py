@@ -0,0 +1,93 @@
+"""
+내용 주소 저장소(core/storage.py) 파일의 참조 수 관리와 가비지 컬렉션입니다.
+참조 수는 제출물 저장/삭제 시그널(core/signals.py)에서 같은 트랜잭션 안에서 증감합니다.
+"""
+import os
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import FileBlob, Submission
+from .storage import PREFIX, blob_name, blob_sha256, submission_storage
+
+
+def acquire_blob(name, size=None):
+    sha256 = blob_sha256(name)
+    if sha256 is None:
+        return
+    FileBlob.objects.get_or_create(sha256=sha256, defaults={'size': size or 0})
+    FileBlob.objects.filter(sha256=sha256).update(ref_count=F('ref_count') + 1, updated_at=timezone.now())
+
+
+def reserve_blob(sha256):
+    """
+    저장소(core/storage.py)가 이미 있는 파일을 다시 쓰지 않고 재사용하기 전에 호출합니다.
+    행을 잠그고 updated_at을 갱신하므로, 가비지 컬렉션은 유예 시간이 지나기 전에는 이 파일을 지우지 않습니다.
+    """
+    FileBlob.objects.filter(sha256=sha256).update(updated_at=timezone.now())
+
+
+def release_blob(name):
+    sha256 = blob_sha256(name)
+    if sha256 is None:
+        return
+    FileBlob.objects.filter(sha256=sha256).update(ref_count=F('ref_count') - 1, updated_at=timezone.now())
+
+
+def collect_garbage(grace=timedelta(hours=1), dry_run=False, scan=False):
+    """
+    아무 제출물도 가리키지 않는 파일을 지웁니다. 지운(또는 dry_run이면 지울) 파일 이름 목록을 돌려줍니다.
+
+    grace: 방금 참조가 0이 된 파일은 진행 중인 재제출이 다시 가리킬 수 있으므로 이 시간이 지난 뒤에 지웁니다.
+    scan: 저장소 디렉터리를 훑어 FileBlob 행이 없는 파일(저장 직후 비정상 종료 등)도 지웁니다.
+    """
+    storage = submission_storage()
+    cutoff = timezone.now() - grace
+    removed = []
+
+    for blob in FileBlob.objects.filter(ref_count__lte=0, updated_at__lt=cutoff):
+        name = blob_name(blob.sha256)
+        if dry_run:
+            removed.append(name)
+            continue
+        with transaction.atomic():
+            # 행을 잠근 뒤 다시 확인합니다. 그 사이에 다시 참조되었거나 저장소가 재사용하려고 갱신한(reserve_blob) 파일은 두고,
+            # 파일도 잠금을 잡은 채로 지워서 저장소가 지워지는 중인 파일을 재사용하지 않게 합니다.
+            locked = FileBlob.objects.select_for_update().filter(
+                pk=blob.pk, ref_count__lte=0, updated_at__lt=cutoff).first()
+            if locked is None:
+                continue
+            locked.delete()
+            storage.delete(name)
+        removed.append(name)
+
+    if scan:
+        known = set(FileBlob.objects.values_list('sha256', flat=True))
+        root = storage.path(PREFIX)
+        for directory, _, filenames in os.walk(root):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                if filename in known or os.path.getmtime(path) > time.time() - grace.total_seconds():
+                    continue
+                removed.append(os.path.relpath(path, storage.location).replace(os.sep, '/'))
+                if not dry_run:
+                    os.remove(path)
+    return removed
+
+
+def recount_blobs():
+    """제출물 테이블에서 참조 수를 다시 계산합니다. 시그널을 거치지 않은 대량 변경 뒤에 사용합니다."""
+    counts = {}
+    for name, size in Submission.objects.filter(file__startswith=PREFIX + '/').values_list('file', 'file_size'):
+        sha256 = blob_sha256(name)
+        count, known_size = counts.get(sha256, (0, size))
+        counts[sha256] = (count + 1, known_size or size)
+
+    now = timezone.now()
+    for sha256, (count, size) in counts.items():
+        FileBlob.objects.update_or_create(sha256=sha256, defaults={'size': size or 0, 'ref_count': count, 'updated_at': now})
+    FileBlob.objects.exclude(sha256__in=counts).exclude(ref_count=0).update(ref_count=0, updated_at=now)
+    return len(counts)
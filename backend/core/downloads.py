@@ -0,0 +1,146 @@
+"""
+제출 파일 다운로드입니다.
+
+권한 확인은 Django가 하고, 실제 파일 전송은 가능하면 앞단 프록시(nginx)에 맡깁니다.
+- SUBMISSION_X_ACCEL_REDIRECT_PREFIX가 설정되어 있으면 본문 없이 X-Accel-Redirect 헤더만 돌려주고,
+  nginx가 internal location에서 파일을 직접 보냅니다(Range 요청도 nginx가 처리).
+- 설정되어 있지 않으면(개발 환경 등) FileResponse로 조각 단위 스트리밍하며, Range 요청은 206으로 응답합니다.
+어느 경우든 Python 워커가 파일 전체를 메모리에 읽지 않습니다.
+
+브라우저의 <a href> 링크에는 Authorization 헤더가 붙지 않으므로, 다운로드 URL에는
+사용자와 제출물에 묶인 서명 토큰(?token=)을 붙여 줍니다. 토큰은 SUBMISSION_DOWNLOAD_URL_MAX_AGE초 동안 유효합니다.
+"""
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core import signing
+from django.http import FileResponse, HttpResponse
+from django.urls import reverse
+from django.utils.http import content_disposition_header
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+from .models import User
+
+TOKEN_SALT = 'core.submission-download'
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+# --- 서명된 다운로드 링크 ---
+def make_download_token(user, submission):
+    return signing.dumps({'u': user.pk, 's': submission.pk}, salt=TOKEN_SALT, compress=True)
+
+
+def download_url(request, submission):
+    url = reverse('submission-file', kwargs={'pk': submission.pk})
+    return request.build_absolute_uri(f'{url}?token={make_download_token(request.user, submission)}')
+
+
+class DownloadTokenAuthentication(BaseAuthentication):
+    """?token= 으로 전달된 서명 토큰으로 인증합니다. 토큰은 발급된 제출물에만 쓸 수 있습니다."""
+    def authenticate(self, request):
+        token = request.query_params.get('token')
+        if not token:
+            return None
+        try:
+            payload = signing.loads(token, salt=TOKEN_SALT, max_age=settings.SUBMISSION_DOWNLOAD_URL_MAX_AGE)
+        except signing.BadSignature:
+            raise AuthenticationFailed('The download link is invalid or has expired.')
+        if str(payload.get('s')) != str(request.parser_context['kwargs'].get('pk')):
+            raise AuthenticationFailed('The download link is invalid or has expired.')
+        user = User.objects.filter(pk=payload.get('u'), is_active=True).first()
+        if user is None:
+            raise AuthenticationFailed('The download link is invalid or has expired.')
+        return user, None
+
+    def authenticate_header(self, request):
+        # 토큰이 없거나 잘못되었을 때도 JWT 인증과 같이 401로 응답하도록 합니다.
+        return 'Bearer realm="api"'
+
+
+# --- 파일 응답 ---
+class FileRange:
+    """파일의 [start, start + length) 구간만 읽히도록 감싼 객체입니다. FileResponse가 조각 단위로 읽어 갑니다."""
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """
+    단일 바이트 범위(`bytes=a-b`, `bytes=a-`, `bytes=-n`)를 (start, end)로 돌려줍니다.
+    헤더가 없거나 여러 범위면 None(전체 전송), 만족할 수 없는 범위면 ValueError를 냅니다.
+    """
+    match = RANGE_RE.match(header.replace(' ', '')) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError
+    return start, end
+
+
+def serve_submission_file(request, submission):
+    field = submission.file
+    filename = submission.file_name or os.path.basename(field.name)
+    etag = f'"{submission.file_sha256}"' if submission.file_sha256 else None
+
+    if etag and etag in [tag.strip() for tag in request.headers.get('If-None-Match', '').split(',')]:
+        response = HttpResponse(status=304)
+        response['ETag'] = etag
+        return response
+
+    prefix = settings.SUBMISSION_X_ACCEL_REDIRECT_PREFIX
+    if prefix:
+        response = HttpResponse(content_type=mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+        response['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + quote(field.name)
+        response['Content-Disposition'] = content_disposition_header(False, filename)
+    else:
+        size = field.size
+        byte_range = None
+        # If-Range가 현재 파일과 다르면(파일이 바뀌었으면) 범위 요청을 무시하고 전체를 보냅니다.
+        if etag is None or request.headers.get('If-Range', etag) == etag:
+            try:
+                byte_range = parse_range(request.headers.get('Range'), size)
+            except ValueError:
+                response = HttpResponse(status=416)
+                response['Content-Range'] = f'bytes */{size}'
+                return response
+
+        file = field.storage.open(field.name, 'rb')
+        if byte_range is None:
+            response = FileResponse(file, filename=filename)
+        else:
+            start, end = byte_range
+            response = FileResponse(FileRange(file, start, end - start + 1), filename=filename, status=206)
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            response['Content-Length'] = end - start + 1
+        response['Accept-Ranges'] = 'bytes'
+
+    if etag:
+        response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
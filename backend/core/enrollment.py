@@ -0,0 +1,113 @@
+"""
+과목 수강생 등록/해제입니다.
+
+수강 테이블(Course.students.through)에 바뀐 행만 bulk_create / delete로 씁니다. 수천 명도 쿼리 몇 번으로 처리합니다.
+- 이미 수강 중인 학생은 건너뛰므로 같은 요청을 다시 보내도(코드로 두 번 참여 등) 결과가 같습니다.
+  동시에 같은 학생을 등록해도 유니크 제약 충돌은 무시됩니다(ignore_conflicts).
+- bulk_create / QuerySet.delete는 m2m_changed 시그널을 보내지 않으므로, 과목/사용자 네임스페이스
+  (응답 캐시, 소속 정보 캐시: core/response_cache.py, core/permissions.py)는 여기서 직접 갱신합니다.
+"""
+import csv
+import io
+
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from .models import Course, User
+from .response_cache import course_namespace, invalidate, user_namespace
+
+BATCH_SIZE = 1000
+Enrollment = Course.students.through
+
+
+def invalidate_enrollment(course, user_ids):
+    # 담당 교수의 과목 목록에도 수강생 수가 들어 있으므로 교수 네임스페이스도 갱신합니다.
+    namespaces = [course_namespace(course.pk), user_namespace(course.professor_id)] \
+        + [user_namespace(user_id) for user_id in user_ids]
+    transaction.on_commit(lambda: invalidate(namespaces))
+
+
+def find_students(ids=(), usernames=()):
+    """학생 id / 사용자 이름을 학생 id 집합으로 바꿉니다. (학생 id 집합, 찾지 못한 값 목록)을 돌려줍니다."""
+    ids = {str(value).strip() for value in ids if str(value).strip()}
+    usernames = {str(value).strip() for value in usernames if str(value).strip()}
+    invalid = sorted(value for value in ids if not value.isdigit())
+    ids = {int(value) for value in ids if value.isdigit()}
+    found = {}
+    students = User.objects.filter(role='student')
+    if ids:
+        found.update(students.filter(id__in=ids).values_list('id', 'username'))
+    if usernames:
+        found.update(students.filter(username__in=usernames).values_list('id', 'username'))
+    unknown = invalid + sorted(str(i) for i in ids - found.keys()) + sorted(usernames - set(found.values()))
+    return set(found), unknown
+
+
+def insert_enrollments(course, student_ids):
+    student_ids = sorted(student_ids)
+    Enrollment.objects.bulk_create(
+        [Enrollment(course_id=course.pk, user_id=user_id) for user_id in student_ids],
+        batch_size=BATCH_SIZE, ignore_conflicts=True,
+    )
+    if student_ids:
+        invalidate_enrollment(course, student_ids)
+    return student_ids
+
+
+def delete_enrollments(course, student_ids):
+    student_ids = sorted(student_ids)
+    if student_ids:
+        Enrollment.objects.filter(course_id=course.pk, user_id__in=student_ids).delete()
+        invalidate_enrollment(course, student_ids)
+    return student_ids
+
+
+def enroll_students(course, student_ids):
+    """수강 중이 아닌 학생만 등록하고, 새로 등록한 학생 id 목록을 돌려줍니다."""
+    student_ids = set(student_ids)
+    if not student_ids:
+        return []
+    existing = set(
+        Enrollment.objects.filter(course_id=course.pk, user_id__in=student_ids).values_list('user_id', flat=True)
+    )
+    return insert_enrollments(course, student_ids - existing)
+
+
+def unenroll_students(course, student_ids):
+    """수강 중인 학생의 등록을 지우고, 지운 학생 id 목록을 돌려줍니다."""
+    student_ids = set(student_ids)
+    if not student_ids:
+        return []
+    removed = Enrollment.objects.filter(course_id=course.pk, user_id__in=student_ids).values_list('user_id', flat=True)
+    return delete_enrollments(course, removed)
+
+
+def set_students(course, student_ids):
+    """수강생 명단을 student_ids로 맞춥니다. 차이만 등록/해제하고 (등록한 id, 해제한 id)를 돌려줍니다."""
+    student_ids = set(student_ids)
+    current = set(Enrollment.objects.filter(course_id=course.pk).values_list('user_id', flat=True))
+    return insert_enrollments(course, student_ids - current), delete_enrollments(course, current - student_ids)
+
+
+def read_roster_csv(upload):
+    """
+    수강생 명단 CSV(헤더: username 또는 student_id)를 (학생 id 목록, 사용자 이름 목록)으로 읽습니다.
+    id 열은 student_id와 같이 봅니다. 행마다 student_id가 있으면 그것을, 없으면 username을 씁니다.
+    """
+    try:
+        reader = csv.DictReader(io.TextIOWrapper(upload, encoding='utf-8-sig', newline=''))
+        rows = list(reader)
+    except (UnicodeDecodeError, csv.Error):
+        raise ValidationError({"file": "The file must be a UTF-8 encoded CSV."})
+    columns = set(reader.fieldnames or ())
+    if not {'username', 'student_id', 'id'} & columns:
+        raise ValidationError({"file": "The CSV needs a 'username' or 'student_id' column."})
+
+    ids, usernames = [], []
+    for row in rows:
+        student_id = row.get('student_id') or row.get('id')
+        if student_id:
+            ids.append(student_id)
+        elif row.get('username'):
+            usernames.append(row['username'])
+    return ids, usernames
@@ -0,0 +1,110 @@
+"""
+목록 API의 쿼리 파라미터 필터와 정렬입니다.
+
+- 필터는 각 View의 get_queryset에서 filter_* 함수로 적용합니다. 알 수 없는 값은 400(ValidationError)입니다.
+- 정렬은 ?ordering=<필드>(내림차순은 -<필드>)이며, View의 ordering_fields에 있는 필드만 허용합니다.
+  커서 페이지네이션(core/pagination.py)이 같은 값으로 정렬하므로, 값이 NULL일 수 있는 컬럼(grade 등)은 넣지 않습니다.
+"""
+from datetime import datetime, time
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter
+
+TRUE_VALUES = ('1', 'true', 'yes')
+FALSE_VALUES = ('0', 'false', 'no')
+
+
+def parse_time_param(request, name):
+    """?since=/?until= 값을 datetime으로 읽습니다. 날짜(YYYY-MM-DD)만 주면 그날 0시(현지 시각)로 봅니다."""
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValidationError({name: "Use an ISO 8601 date or datetime."})
+        parsed = datetime.combine(day, time.min)
+    return timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
+
+
+def parse_bool_param(request, name):
+    """true/false(1/0, yes/no) 값을 읽습니다. 주지 않았으면 None입니다."""
+    value = request.query_params.get(name, '').lower()
+    if not value:
+        return None
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    raise ValidationError({name: "Use true or false."})
+
+
+def parse_int_param(request, name):
+    """정수 id 값을 읽습니다. 주지 않았으면 None입니다."""
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValidationError({name: "Use an integer id."})
+
+
+def filter_time_range(queryset, request, field, prefix):
+    """?<prefix>_since=(포함) / ?<prefix>_until=(미포함)으로 field의 범위를 거릅니다."""
+    since, until = parse_time_param(request, f'{prefix}_since'), parse_time_param(request, f'{prefix}_until')
+    if since:
+        queryset = queryset.filter(**{f'{field}__gte': since})
+    if until:
+        queryset = queryset.filter(**{f'{field}__lt': until})
+    return queryset
+
+
+# SubmissionSerializer.status와 같은 기준입니다.
+SUBMISSION_STATUSES = {
+    'graded': {'grade__isnull': False},
+    'late': {'grade__isnull': True, 'is_late': True},
+    'submitted': {'grade__isnull': True, 'is_late': False},
+}
+
+
+def filter_submissions(queryset, request):
+    """?status=graded|late|submitted, ?is_late=, ?graded=, ?submitted_since=, ?submitted_until="""
+    status = request.query_params.get('status')
+    if status:
+        if status not in SUBMISSION_STATUSES:
+            raise ValidationError({"status": f"Use one of: {', '.join(SUBMISSION_STATUSES)}."})
+        queryset = queryset.filter(**SUBMISSION_STATUSES[status])
+    is_late = parse_bool_param(request, 'is_late')
+    if is_late is not None:
+        queryset = queryset.filter(is_late=is_late)
+    graded = parse_bool_param(request, 'graded')
+    if graded is not None:
+        queryset = queryset.filter(grade__isnull=not graded)
+    return filter_time_range(queryset, request, 'submitted_at', 'submitted')
+
+
+def filter_assignments(queryset, request):
+    """?course_id=, ?allow_late=, ?due_since=, ?due_until="""
+    course_id = parse_int_param(request, 'course_id')
+    if course_id is not None:
+        queryset = queryset.filter(course_id=course_id)
+    allow_late = parse_bool_param(request, 'allow_late')
+    if allow_late is not None:
+        queryset = queryset.filter(allow_late=allow_late)
+    return filter_time_range(queryset, request, 'due_date', 'due')
+
+
+class StableOrderingFilter(OrderingFilter):
+    """
+    ?ordering=으로 고른 정렬 뒤에 id를 붙여, 값이 같은 행이 많아도 순서(와 커서 위치)가 고정되게 합니다.
+    ?ordering=이 없으면 View의 ordering을 그대로 사용합니다.
+    """
+    def get_ordering(self, request, queryset, view):
+        ordering = list(super().get_ordering(request, queryset, view) or ())
+        if ordering and not {'id', '-id', 'pk', '-pk'} & set(ordering):
+            ordering.append('-id' if ordering[0].startswith('-') else 'id')
+        return tuple(ordering)
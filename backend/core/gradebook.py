@@ -0,0 +1,118 @@
+"""
+과목 성적부(학생 × 과제 행렬)와 과제별 통계입니다.
+
+과목의 과제 수·학생 수와 관계없이 다섯 번의 쿼리로 만듭니다.
+과제 목록, 수강생 목록, 제출물(셀), 과제별 집계(제출/채점/지연 수, 평균), 과제별 중앙값입니다.
+MySQL에는 MEDIAN 함수가 없으므로 중앙값은 ROW_NUMBER() 윈도 함수로 가운데 한두 행만 골라 계산합니다.
+
+수강을 취소한 학생의 제출물은 성적부와 통계에서 제외합니다.
+응답은 CourseGradebookView가 캐시하며(core/response_cache.py), 제출/채점이 바뀌면
+gradebook_namespace가 갱신되어 무효화됩니다.
+"""
+from django.db.models import Avg, Count, F, Q, Window
+from django.db.models.functions import Floor, RowNumber
+
+from .models import Assignment, Submission
+
+STATUS_GRADED = "평가 완료"
+STATUS_LATE = "지연 제출"
+STATUS_SUBMITTED = "제출 완료"
+STATUS_MISSING = "제출 전"
+
+
+def submission_status(submitted, is_late, grade):
+    """SubmissionSerializer.status와 성적부 셀이 함께 쓰는 상태 문자열입니다."""
+    if grade is not None:
+        return STATUS_GRADED
+    if is_late:
+        return STATUS_LATE
+    if submitted:
+        return STATUS_SUBMITTED
+    return STATUS_MISSING
+
+
+def assignment_medians(submissions):
+    """
+    채점된 제출물의 과제별 중앙값입니다.
+    점수순 번호(position)가 floor((n+1)/2) ~ floor((n+2)/2)인 행, 즉 가운데 한 행(홀수) 또는 두 행(짝수)만 가져옵니다.
+    """
+    middle = (
+        submissions.filter(grade__isnull=False)
+        .annotate(
+            position=Window(RowNumber(), partition_by=F('assignment_id'), order_by=[F('grade').asc(), F('id').asc()]),
+            graded=Window(Count('id'), partition_by=F('assignment_id')),
+        )
+        .filter(position__gte=Floor((F('graded') + 1) / 2), position__lte=Floor((F('graded') + 2) / 2))
+        .values_list('assignment_id', 'grade')
+    )
+    values = {}
+    for assignment_id, grade in middle:
+        values.setdefault(assignment_id, []).append(grade)
+    return {assignment_id: sum(grades) / len(grades) for assignment_id, grades in values.items()}
+
+
+def build_gradebook(course):
+    assignments = list(
+        Assignment.objects.filter(course=course).order_by('due_date', 'id').values('id', 'title', 'due_date')
+    )
+    students = list(course.students.order_by('username', 'id').values('id', 'username'))
+    submissions = Submission.objects.filter(assignment__course=course, student__courses=course)
+
+    cells = {
+        (row['student_id'], row['assignment_id']): row
+        for row in submissions.values('id', 'student_id', 'assignment_id', 'grade', 'is_late')
+    }
+    totals = {
+        row['assignment_id']: row
+        for row in submissions.values('assignment_id').annotate(
+            submitted=Count('id'),
+            graded=Count('grade'),
+            late=Count('id', filter=Q(is_late=True)),
+            mean=Avg('grade'),
+        ).order_by()
+    }
+    medians = assignment_medians(submissions)
+
+    enrolled = len(students)
+    assignment_rows = []
+    for assignment in assignments:
+        total = totals.get(assignment['id'], {})
+        submitted = total.get('submitted', 0)
+        assignment_rows.append({
+            **assignment,
+            'submitted': submitted,
+            'graded': total.get('graded', 0),
+            'late': total.get('late', 0),
+            'submission_rate': round(submitted / enrolled, 4) if enrolled else None,
+            'mean': round(total['mean'], 2) if total.get('mean') is not None else None,
+            'median': medians.get(assignment['id']),
+        })
+
+    student_rows = []
+    for student in students:
+        row_cells, grades = [], []
+        for assignment in assignments:
+            cell = cells.get((student['id'], assignment['id']))
+            if cell is None:
+                row_cells.append({'submission_id': None, 'grade': None, 'is_late': False,
+                                  'status': submission_status(False, False, None)})
+                continue
+            if cell['grade'] is not None:
+                grades.append(cell['grade'])
+            row_cells.append({
+                'submission_id': cell['id'], 'grade': cell['grade'], 'is_late': cell['is_late'],
+                'status': submission_status(True, cell['is_late'], cell['grade']),
+            })
+        student_rows.append({
+            **student,
+            'submitted': sum(cell['submission_id'] is not None for cell in row_cells),
+            'average': round(sum(grades) / len(grades), 2) if grades else None,
+            # 셀 순서는 assignments 순서와 같습니다.
+            'cells': row_cells,
+        })
+
+    return {
+        'course': {'id': course.id, 'name': course.name},
+        'assignments': assignment_rows,
+        'students': student_rows,
+    }
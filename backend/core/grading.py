@@ -0,0 +1,97 @@
+"""
+과제 단위 일괄 채점입니다.
+
+한 요청으로 여러 제출물의 점수/피드백을 저장합니다. 권한은 과제 단위로 한 번만 확인하고,
+제출물 조회(잠금) 1회 + bulk_update 1회 + 알림/활동 로그 bulk_create 각 1회로
+학생 수와 관계없이 일정한 수의 쿼리로 처리합니다.
+bulk_update/bulk_create는 시그널을 보내지 않으므로 대시보드의 미채점 카운터, 성적부 캐시와 검색 색인은 여기서 직접 갱신합니다.
+"""
+import csv
+import io
+
+from django.db import transaction
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+from . import stats
+from .models import ActivityLog, Notification, Submission
+from .realtime import publish_notifications_on_commit
+from .response_cache import gradebook_namespace, invalidate
+from .search import index_documents
+
+BATCH_SIZE = 500
+
+
+def read_grades_csv(upload):
+    """
+    CSV(헤더: submission_id 또는 username, grade, feedback)를 채점 항목 목록으로 읽습니다.
+    ZIP 내보내기(core/exports.py)의 manifest.csv를 고쳐서 그대로 올릴 수 있습니다.
+    """
+    try:
+        reader = csv.DictReader(io.TextIOWrapper(upload, encoding='utf-8-sig', newline=''))
+        rows = list(reader)
+    except (UnicodeDecodeError, csv.Error):
+        raise ValidationError({"file": "The file must be a UTF-8 encoded CSV."})
+    if not reader.fieldnames or 'grade' not in reader.fieldnames or not (
+            {'submission_id', 'username'} & set(reader.fieldnames)):
+        raise ValidationError({"file": "The CSV needs a 'grade' column and a 'submission_id' or 'username' column."})
+
+    entries = []
+    for row in rows:
+        entry = {'grade': (row.get('grade') or '').strip() or None}
+        if row.get('submission_id'):
+            entry['submission_id'] = row['submission_id'].strip()
+        elif row.get('username'):
+            entry['username'] = row['username'].strip()
+        if 'feedback' in row:
+            entry['feedback'] = row['feedback'] or ''
+        entries.append(entry)
+    return entries
+
+
+def apply_grades(assignment, professor, entries):
+    """
+    검증된 채점 항목(submission_id 또는 username, grade, [feedback])을 한 트랜잭션으로 저장합니다.
+    과제에 속하지 않는 제출물이 하나라도 있으면 아무것도 저장하지 않고 ValidationError를 냅니다.
+    """
+    by_id = {entry['submission_id']: entry for entry in entries if entry.get('submission_id') is not None}
+    by_username = {entry['username']: entry for entry in entries if entry.get('submission_id') is None}
+
+    with transaction.atomic():
+        submissions = list(
+            Submission.objects.select_for_update().select_related('student')
+            .filter(assignment=assignment)
+            .filter(Q(pk__in=by_id.keys()) | Q(student__username__in=by_username.keys()))
+        )
+        found_ids = {s.pk for s in submissions}
+        found_usernames = {s.student.username for s in submissions}
+        missing = [str(pk) for pk in by_id if pk not in found_ids] + [u for u in by_username if u not in found_usernames]
+        if missing:
+            raise ValidationError({"grades": f"No submission for this assignment: {', '.join(missing)}."})
+
+        ungraded_delta = 0
+        for submission in submissions:
+            entry = by_id.get(submission.pk) or by_username[submission.student.username]
+            ungraded_delta += (entry['grade'] is None) - (submission.grade is None)
+            submission.grade = entry['grade']
+            if 'feedback' in entry:
+                submission.feedback = entry['feedback']
+        Submission.objects.bulk_update(submissions, ['grade', 'feedback'], batch_size=BATCH_SIZE)
+        stats.increment({stats.SUBMISSIONS_UNGRADED: ungraded_delta})
+        transaction.on_commit(lambda: invalidate([gradebook_namespace(assignment.course_id)]))
+
+        message = f"'{assignment.course.name}' 과목의 '{assignment.title}' 과제에 새로운 피드백이 등록되었습니다."
+        notifications = Notification.objects.bulk_create(
+            [Notification(recipient_id=s.student_id, message=message) for s in submissions], batch_size=BATCH_SIZE
+        )
+        publish_notifications_on_commit(notifications)
+        logs = ActivityLog.objects.bulk_create([
+            ActivityLog(
+                actor=professor,
+                action_type="GRADED_SUBMISSION",
+                details=f"Submission for '{assignment.title}' by {s.student.username} was graded with score {s.grade}.",
+            )
+            for s in submissions
+        ], batch_size=BATCH_SIZE)
+        index_documents('log', logs, created=True)
+    return submissions
@@ -0,0 +1,104 @@
+"""
+ActivityLog 월 단위 보관(아카이브)입니다.
+
+MySQL의 네이티브 파티셔닝은 외래 키를 쓸 수 없고 모든 유니크 키(PK 포함)에 파티션 컬럼이 들어가야 해서
+actor FK가 있는 ActivityLog 모델에는 맞지 않습니다. 대신 오래된 달(cold partition)의 행을
+`activitylog-YYYY-MM-<시각>.jsonl.gz` 파일로 내보내고, 보관 기록(ActivityLogArchive)을 남긴 뒤
+운영 테이블에서 지웁니다. 그래서 운영 테이블에는 최근 ACTIVITY_LOG_HOT_MONTHS개월치만 남습니다.
+
+파일을 끝까지 쓰고 이름을 바꾼(os.replace) 다음에만 행을 지우며, 지우는 범위는 내보낸 id까지로 제한하므로
+도중에 실패하거나 그 사이 같은 달의 로그가 늦게 기록되어도 유실되지 않습니다.
+"""
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import ActivityLog, ActivityLogArchive
+from .search import unindex_documents
+
+EXPORT_CHUNK_SIZE = 2000
+DELETE_BATCH_SIZE = 1000
+
+
+def month_start(value):
+    """value가 속한 달의 1일 0시(현지 시각)입니다."""
+    local = timezone.localtime(value)
+    return local.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(value, months):
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def cold_months(hot_months, now=None):
+    """운영 테이블에 남겨 둘 기간보다 오래된, 로그가 있는 달의 시작 시각 목록입니다."""
+    cutoff = add_months(month_start(now or timezone.now()), -hot_months)
+    oldest = ActivityLog.objects.filter(created_at__lt=cutoff).order_by('created_at').values_list('created_at', flat=True).first()
+    months = []
+    if oldest is not None:
+        month = month_start(oldest)
+        while month < cutoff:
+            months.append(month)
+            month = add_months(month, 1)
+    return months
+
+
+def log_record(log):
+    return {
+        'id': log.id,
+        'actor_id': log.actor_id,
+        'actor_username': log.actor.username,
+        'action_type': log.action_type,
+        'details': log.details,
+        'created_at': log.created_at.isoformat(),
+    }
+
+
+def archive_month(month, output_dir=None):
+    """
+    한 달치 로그를 jsonl.gz로 내보내고 운영 테이블에서 지웁니다.
+    내보낼 로그가 없으면 None, 있으면 만든 ActivityLogArchive를 돌려줍니다.
+    """
+    output_dir = Path(output_dir or settings.ACTIVITY_LOG_ARCHIVE_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    logs = ActivityLog.objects.filter(created_at__gte=month, created_at__lt=add_months(month, 1))
+
+    last_id = logs.order_by('-id').values_list('id', flat=True).first()
+    if last_id is None:
+        return None
+    logs = logs.filter(id__lte=last_id)
+
+    stamp = datetime.now().strftime('%Y%m%d%H%M%S')
+    path = output_dir / f'activitylog-{month:%Y-%m}-{stamp}.jsonl.gz'
+    tmp_path = path.with_suffix('.tmp')
+    rows, first_id = 0, None
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as archive:
+        for log in logs.select_related('actor').order_by('id').iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            archive.write(json.dumps(log_record(log), ensure_ascii=False) + '\n')
+            first_id = log.id if first_id is None else first_id
+            rows += 1
+    hasher = hashlib.sha256()
+    with open(tmp_path, 'rb') as f:
+        os.fsync(f.fileno())
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            hasher.update(chunk)
+    os.replace(tmp_path, path)
+
+    record = ActivityLogArchive.objects.create(
+        month=month.date(), path=str(path), rows=rows, first_id=first_id, last_id=last_id, sha256=hasher.hexdigest(),
+    )
+    # 한 번에 큰 DELETE를 하지 않도록 id 범위를 나누어 지웁니다.
+    while True:
+        ids = list(logs.order_by('id').values_list('id', flat=True)[:DELETE_BATCH_SIZE])
+        if not ids:
+            break
+        ActivityLog.objects.filter(id__in=ids).delete()
+        unindex_documents('log', ids)
+    return record
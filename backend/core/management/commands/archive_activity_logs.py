@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from core.log_archive import add_months, archive_month, cold_months
+from core.models import ActivityLog
+
+
+class Command(BaseCommand):
+    help = 'Exports activity logs older than the hot window to compressed JSONL files, one per month, and deletes them.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hot-months', type=int, default=settings.ACTIVITY_LOG_HOT_MONTHS,
+                            help='운영 테이블에 남겨 둘 최근 개월 수입니다. 기본값은 ACTIVITY_LOG_HOT_MONTHS입니다.')
+        parser.add_argument('--output-dir', default=None,
+                            help='보관 파일을 저장할 디렉터리입니다. 기본값은 ACTIVITY_LOG_ARCHIVE_DIR입니다.')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='내보내거나 지우지 않고 달별 대상 수만 출력합니다.')
+
+    def handle(self, *args, **options):
+        months = cold_months(options['hot_months'])
+        if not months:
+            self.stdout.write('No activity logs to archive.')
+            return
+
+        total = 0
+        for month in months:
+            if options['dry_run']:
+                count = ActivityLog.objects.filter(created_at__gte=month, created_at__lt=add_months(month, 1)).count()
+                self.stdout.write(f'[dry-run] {month:%Y-%m}: {count} logs')
+                continue
+            record = archive_month(month, options['output_dir'])
+            if record is not None:
+                total += record.rows
+                self.stdout.write(f'{month:%Y-%m}: {record.rows} logs -> {record.path}')
+
+        if not options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'Archived {total} activity logs from {len(months)} months.'))
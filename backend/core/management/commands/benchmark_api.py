@@ -0,0 +1,50 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark import ENDPOINTS, compare_results, run_benchmark
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks the API endpoints in-process and reports p50/p95/p99 latency and query counts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50, help='엔드포인트별 측정 요청 수입니다.')
+        parser.add_argument('--warmup', type=int, default=5, help='측정 전에 버리는 요청 수입니다.')
+        parser.add_argument('--cold-cache', action='store_true',
+                            help='요청마다 캐시를 비워 응답 캐시 없이 측정합니다.')
+        parser.add_argument('--endpoint', action='append', dest='endpoints',
+                            choices=[endpoint.name for endpoint in ENDPOINTS],
+                            help='측정할 엔드포인트입니다. 여러 번 줄 수 있으며, 생략하면 전부 측정합니다.')
+        parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로입니다.')
+        parser.add_argument('--compare', help='비교할 이전 결과 JSON 파일 경로입니다.')
+        parser.add_argument('--threshold', type=float, default=20.0,
+                            help='p95가 이 비율(%%)보다 많이 늘면 회귀로 봅니다.')
+
+    def handle(self, *args, **options):
+        try:
+            result = run_benchmark(options['requests'], options['warmup'], options['cold_cache'], options['endpoints'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(f'{"endpoint":<28}{"p50":>10}{"p95":>10}{"p99":>10}{"queries":>9}  status')
+        for name, row in result['endpoints'].items():
+            self.stdout.write(f'{name:<28}{row["p50_ms"]:>9.2f}ms{row["p95_ms"]:>8.2f}ms{row["p99_ms"]:>8.2f}ms'
+                              f'{row["queries"]:>9}  {",".join(map(str, row["status"]))}')
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f'Results written to {options["output"]}.')
+
+        if options['compare']:
+            with open(options['compare'], encoding='utf-8') as f:
+                previous = json.load(f)
+            rows = compare_results(previous, result, options['threshold'])
+            for row in rows:
+                line = (f'{row["name"]:<28} p95 {row["p95_before"]:.2f} -> {row["p95_after"]:.2f}ms '
+                        f'({row["p95_change"]:+.1f}%)  queries {row["queries_before"]} -> {row["queries_after"]}')
+                self.stdout.write(self.style.ERROR(line) if row['regressed'] else line)
+            regressed = [row['name'] for row in rows if row['regressed']]
+            if regressed:
+                raise CommandError(f'{len(regressed)} endpoint(s) regressed: {", ".join(regressed)}')
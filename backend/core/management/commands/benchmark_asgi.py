@@ -0,0 +1,46 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark import SERVER_URLCONFS, THROUGHPUT_ENDPOINTS, run_throughput
+
+
+class Command(BaseCommand):
+    help = 'Compares WSGI (sync views) and ASGI (async views) throughput on the hot list endpoints in-process.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=400, help='서버 방식별 전체 요청 수입니다.')
+        parser.add_argument('--concurrency', type=int, default=16,
+                            help='동시 요청 수입니다. WSGI는 스레드 수, ASGI는 동시에 실행하는 코루틴 수입니다.')
+        parser.add_argument('--warmup', type=int, default=5, help='측정 전에 엔드포인트별로 버리는 요청 수입니다.')
+        parser.add_argument('--endpoint', action='append', dest='endpoints', choices=THROUGHPUT_ENDPOINTS,
+                            help='측정할 엔드포인트입니다. 여러 번 줄 수 있으며, 생략하면 전부 번갈아 호출합니다.')
+        parser.add_argument('--server', action='append', dest='servers', choices=list(SERVER_URLCONFS),
+                            help='측정할 서버 방식입니다. 생략하면 wsgi와 asgi를 모두 측정합니다.')
+        parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로입니다.')
+
+    def handle(self, *args, **options):
+        if options['concurrency'] < 1 or options['requests'] < 1:
+            raise CommandError('--requests and --concurrency must be positive.')
+        try:
+            result = run_throughput(options['requests'], options['concurrency'], options['warmup'],
+                                    options['endpoints'], options['servers'] or list(SERVER_URLCONFS))
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(f'{"server":<8}{"req/s":>10}{"p50":>10}{"p95":>10}{"p99":>10}{"errors":>8}')
+        for server, row in result['servers'].items():
+            self.stdout.write(f'{server:<8}{row["requests_per_second"]:>10.1f}{row["p50_ms"]:>8.2f}ms'
+                              f'{row["p95_ms"]:>8.2f}ms{row["p99_ms"]:>8.2f}ms{row["errors"]:>8}')
+        servers = result['servers']
+        if {'wsgi', 'asgi'} <= servers.keys():
+            ratio = servers['asgi']['requests_per_second'] / servers['wsgi']['requests_per_second']
+            self.stdout.write(f'ASGI/WSGI throughput: {ratio:.2f}x '
+                              f'(concurrency {options["concurrency"]}, {options["requests"]} requests)')
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f'Results written to {options["output"]}.')
+        if any(row['errors'] for row in servers.values()):
+            raise CommandError('Some requests did not return 200.')
@@ -0,0 +1,90 @@
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from core.models import User, Assignment, Submission, Notification, ActivityLog
+from core.seed import SeedOptions, seed_dataset
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Seeds a synthetic dataset and prints the query plan and timings of the hot lookup paths.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=2000)
+        parser.add_argument('--courses', type=int, default=20)
+        parser.add_argument('--assignments-per-course', type=int, default=10)
+        parser.add_argument('--notifications-per-student', type=int, default=10)
+        parser.add_argument('--logs', type=int, default=20000)
+        parser.add_argument('--repeat', type=int, default=50, help='쿼리별 반복 실행 횟수입니다.')
+        parser.add_argument('--no-seed', action='store_true',
+                            help='데이터를 만들지 않고 현재 데이터베이스에 그대로 실행합니다.')
+        parser.add_argument('--keep', action='store_true',
+                            help='생성한 데이터를 롤백하지 않고 남겨 둡니다.')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                if not options['no_seed']:
+                    started = time.perf_counter()
+                    self.seed(options)
+                    self.stdout.write(f'Seeded dataset in {time.perf_counter() - started:.2f}s\n')
+                self.run_benchmarks(options['repeat'])
+                if not options['keep']:
+                    raise Rollback
+        except Rollback:
+            self.stdout.write('Benchmark transaction rolled back.')
+
+    def seed(self, options):
+        # 롤백하는 실행이므로 저장소에 남는 제출 파일은 만들지 않습니다.
+        seed_dataset(SeedOptions(
+            professors=options['courses'], students=options['students'], courses=options['courses'],
+            courses_per_student=max(1, options['courses'] // 4),
+            assignments_per_course=options['assignments_per_course'],
+            notifications_per_student=options['notifications_per_student'], logs=options['logs'], files=0,
+        ))
+
+    def hot_queries(self):
+        now = timezone.now()
+        submission = Submission.objects.order_by('?').first()
+        assignment = Assignment.objects.order_by('?').first()
+        user = User.objects.filter(role='student').order_by('?').first()
+        if not (submission and assignment and user):
+            return []
+
+        return [
+            ('submission duplicate check (student, assignment)',
+             Submission.objects.filter(student_id=submission.student_id, assignment_id=submission.assignment_id)),
+            ('submissions by assignment, newest first',
+             Submission.objects.filter(assignment=assignment).order_by('-submitted_at', '-id')[:20]),
+            ('unread notifications of a user',
+             Notification.objects.filter(recipient=user, is_read=False).order_by('-created_at')[:20]),
+            ('recent activity logs',
+             ActivityLog.objects.order_by('-created_at', '-id')[:20]),
+            ('activity logs of an actor',
+             ActivityLog.objects.filter(actor=user).order_by('-created_at')[:20]),
+            ('assignments of a course by due date',
+             Assignment.objects.filter(course_id=assignment.course_id).order_by('due_date')),
+            ('reminder scan (due in 24h)',
+             Assignment.objects.filter(due_date__gt=now, due_date__lte=now + timedelta(days=1))),
+        ]
+
+    def run_benchmarks(self, repeat):
+        for label, queryset in self.hot_queries():
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            self.stdout.write(queryset.explain())
+            self.stdout.write(f'  median {statistics.median(timings):.3f}ms  p95 {p95:.3f}ms  ({repeat} runs)\n')
@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from core.blobs import collect_garbage, recount_blobs
+
+
+class Command(BaseCommand):
+    help = 'Deletes content-addressed submission files that are no longer referenced by any submission.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-minutes', type=int, default=60, help='Only delete files unreferenced for at least this long.')
+        parser.add_argument('--scan', action='store_true', help='Also delete files on disk that have no FileBlob row.')
+        parser.add_argument('--recount', action='store_true', help='Recompute reference counts from submissions first.')
+        parser.add_argument('--dry-run', action='store_true', help='List the files without deleting them.')
+
+    def handle(self, *args, **options):
+        if options['recount']:
+            blobs = recount_blobs()
+            self.stdout.write(f'Recounted references for {blobs} blobs.')
+
+        removed = collect_garbage(
+            grace=timedelta(minutes=options['grace_minutes']),
+            dry_run=options['dry_run'],
+            scan=options['scan'],
+        )
+        for name in removed:
+            self.stdout.write(name)
+        verb = 'Would delete' if options['dry_run'] else 'Deleted'
+        self.stdout.write(self.style.SUCCESS(f'{verb} {len(removed)} unreferenced files.'))
@@ -0,0 +1,40 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from core.models import Notification
+
+
+class Command(BaseCommand):
+    help = 'Deletes read notifications older than the retention period, in small batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.NOTIFICATION_RETENTION_DAYS,
+                            help='읽은 뒤 보존할 기간(일)입니다. 기본값은 NOTIFICATION_RETENTION_DAYS입니다.')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='DELETE 한 번에 지울 알림 수입니다. 테이블 잠금 시간을 짧게 유지합니다.')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='지우지 않고 대상 수만 출력합니다.')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        expired = Notification.objects.filter(is_read=True, created_at__lt=cutoff)
+
+        if options['dry_run']:
+            self.stdout.write(f'[dry-run] {expired.count()} read notifications older than {options["days"]} days.')
+            return
+
+        deleted = 0
+        while True:
+            # MySQL은 DELETE ... LIMIT에 서브쿼리를 쓸 수 없으므로 id를 먼저 가져옵니다.
+            ids = list(expired.order_by('id').values_list('id', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+            deleted += Notification.objects.filter(id__in=ids).delete()[0]
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Deleted {deleted} read notifications older than {options["days"]} days '
+            f'({(time.perf_counter() - started) * 1000:.1f}ms).'))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.search import DOCUMENT_TYPES, rebuild_index, use_fulltext
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the search index (SearchIndexEntry) used when the database has no FULLTEXT support.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--type', choices=sorted(DOCUMENT_TYPES), action='append', dest='types',
+                            help='다시 만들 문서 종류입니다. 여러 번 줄 수 있으며, 생략하면 전부 다시 만듭니다.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if use_fulltext():
+            self.stdout.write('MySQL FULLTEXT 인덱스를 사용하므로 다시 만들 색인이 없습니다.')
+            return
+        for doc_type in options['types'] or DOCUMENT_TYPES:
+            with transaction.atomic():
+                total = rebuild_index(doc_type, batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'{doc_type}: {total}개 문서의 색인을 만들었습니다.'))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from core.stats import rebuild_counters
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the admin dashboard counters from the source tables.'
+
+    def handle(self, *args, **options):
+        counters = rebuild_counters()
+        for name, value in sorted(counters.items()):
+            self.stdout.write(f'{name}: {value}')
+        self.stdout.write(self.style.SUCCESS('Successfully rebuilt dashboard statistics.'))
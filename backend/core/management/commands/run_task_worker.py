@@ -0,0 +1,37 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+from core.task_queue import enqueue_scheduled, get_backend, get_queue_settings
+
+
+class Command(BaseCommand):
+    help = 'Runs background task workers and enqueues the periodic tasks in TASK_QUEUE["SCHEDULE"].'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help='이번 주기의 예약 작업을 넣고, 지금 실행할 수 있는 작업을 모두 실행한 뒤 끝냅니다. (cron용)')
+
+    def handle(self, *args, **options):
+        backend = get_backend()
+        if options['once']:
+            scheduled = enqueue_scheduled()
+            # ImmediateBackend는 큐에 넣는 즉시 실행합니다. ThreadPoolBackend는 이 프로세스의 스레드가 끝낼 때까지 기다립니다.
+            ran = backend.run_pending() if hasattr(backend, 'run_pending') else len(scheduled)
+            self.stdout.write(self.style.SUCCESS(f'Scheduled {len(scheduled)} periodic tasks, ran {ran} tasks.'))
+            return
+
+        stop_event = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *args: stop_event.set())
+        threading.Thread(target=self.schedule, args=(stop_event,), name='task-scheduler', daemon=True).start()
+        self.stdout.write(f'Task worker started ({type(backend).__name__}).')
+        backend.work(stop_event)
+        self.stdout.write('Task worker stopped.')
+
+    def schedule(self, stop_event):
+        interval = get_queue_settings()['POLL_INTERVAL_SECONDS']
+        while not stop_event.is_set():
+            for name in enqueue_scheduled():
+                self.stdout.write(f'Queued periodic task {name}.')
+            stop_event.wait(interval)
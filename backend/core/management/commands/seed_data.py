@@ -0,0 +1,40 @@
+import time
+from dataclasses import fields
+
+from django.core.management.base import BaseCommand
+
+from core.seed import SeedOptions, seed_dataset
+
+
+class Command(BaseCommand):
+    help = 'Seeds a realistic synthetic dataset for load testing and benchmark_api.'
+
+    def add_arguments(self, parser):
+        defaults = SeedOptions()
+        parser.add_argument('--admins', type=int, default=defaults.admins)
+        parser.add_argument('--professors', type=int, default=defaults.professors)
+        parser.add_argument('--students', type=int, default=defaults.students)
+        parser.add_argument('--courses', type=int, default=defaults.courses)
+        parser.add_argument('--courses-per-student', type=int, default=defaults.courses_per_student,
+                            help='학생 한 명이 수강하는 과목 수입니다.')
+        parser.add_argument('--assignments-per-course', type=int, default=defaults.assignments_per_course)
+        parser.add_argument('--submission-rate', type=float, default=defaults.submission_rate,
+                            help='과제마다 수강생이 제출할 확률입니다.')
+        parser.add_argument('--graded-rate', type=float, default=defaults.graded_rate)
+        parser.add_argument('--late-rate', type=float, default=defaults.late_rate)
+        parser.add_argument('--notices', type=int, default=defaults.notices)
+        parser.add_argument('--notifications-per-student', type=int, default=defaults.notifications_per_student)
+        parser.add_argument('--logs', type=int, default=defaults.logs)
+        parser.add_argument('--files', type=int, default=defaults.files,
+                            help='서로 다른 제출 파일 수입니다. 제출물은 이 중 하나를 공유합니다(내용 주소 저장소).')
+        parser.add_argument('--seed', type=int, default=defaults.seed, help='난수 seed입니다. 같으면 같은 모양의 데이터가 만들어집니다.')
+        parser.add_argument('--prefix', default='', help='사용자 이름 접두어입니다. 기본값은 seed<시각>입니다.')
+        parser.add_argument('--password', default='',
+                            help='생성한 사용자의 비밀번호입니다. 주지 않으면 로그인할 수 없는 사용자로 만듭니다.')
+
+    def handle(self, *args, **options):
+        seed_options = SeedOptions(**{field.name: options[field.name] for field in fields(SeedOptions)})
+        started = time.perf_counter()
+        counts = seed_dataset(seed_options)
+        summary = ', '.join(f'{name} {count}' for name, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(f'Seeded {summary} in {time.perf_counter() - started:.1f}s.'))
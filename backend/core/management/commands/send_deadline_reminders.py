@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from core.task_queue import DatabaseBackend, get_backend
+from core.tasks import build_deadline_reminders, send_deadline_reminders
+
+
+class Command(BaseCommand):
+    help = 'Finds assignments with deadlines in the next N hours and sends notifications to students who have not submitted.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=24,
+                            help='마감까지 남은 시간(시간 단위)의 범위입니다. 기본값은 24시간입니다.')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='bulk_create 한 번에 저장할 알림 수입니다.')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='알림을 저장하지 않고 보낼 대상 수만 출력합니다.')
+        parser.add_argument('--enqueue', action='store_true',
+                            help='바로 보내지 않고 작업 큐(core/task_queue.py)에 넣습니다. DatabaseBackend에서만 사용할 수 있습니다.')
+
+    def handle(self, *args, **options):
+        # 보통은 run_task_worker가 TASK_QUEUE["SCHEDULE"]에 따라 매시간 실행합니다. 이 명령은 수동 실행/cron용입니다.
+        started = time.perf_counter()
+        hours = options['hours']
+
+        if options['dry_run']:
+            count = len(build_deadline_reminders(timezone.now(), hours))
+            self.stdout.write(
+                f'[dry-run] {count} deadline reminder notifications would be sent '
+                f'(query {(time.perf_counter() - started) * 1000:.1f}ms).')
+            return
+
+        if options['enqueue']:
+            # 다른 백엔드는 이 프로세스 안에서 실행하므로, 명령이 끝나면 작업도 함께 사라집니다.
+            if not isinstance(get_backend(), DatabaseBackend):
+                raise CommandError('--enqueue requires TASK_QUEUE["BACKEND"] to be core.task_queue.DatabaseBackend.')
+            send_deadline_reminders.enqueue(hours=hours, batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS('Deadline reminders were queued.'))
+            return
+
+        sent = send_deadline_reminders(hours=hours, batch_size=options['batch_size'])
+        total_time = time.perf_counter() - started
+
+        # 터미널에 성공 메시지를 출력합니다.
+        self.stdout.write(self.style.SUCCESS(
+            f'Successfully sent {sent} deadline reminder notifications (total {total_time * 1000:.1f}ms).'))
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_course_join_code'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='assignment',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='core.assignment'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='kind',
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(fields=('recipient', 'assignment', 'kind'), name='unique_notification_per_assignment_kind'),
+        ),
+    ]
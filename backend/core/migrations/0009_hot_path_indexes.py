@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:17
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def remove_duplicate_submissions(apps, schema_editor):
+    """
+    유니크 제약을 추가하기 전에, 동시 제출로 생긴 중복 제출물을 정리합니다.
+    채점(점수/피드백)된 행, 최종 제출(is_final) 행, 가장 최근 행 순으로 하나를 남기고, 채점되지 않은 나머지 행만 지웁니다.
+    지운 행의 파일은 저장소에 그대로 남고 경로를 출력합니다.
+    채점된 행이 둘 이상인 (학생, 과제)가 있으면 어느 것을 남길지 사람이 정해야 하므로 목록을 보여 주고 중단합니다.
+    """
+    Submission = apps.get_model('core', 'Submission')
+    duplicates = (
+        Submission.objects.values('student_id', 'assignment_id')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+    )
+    removals, conflicts = [], []
+    for row in duplicates:
+        rows = list(
+            Submission.objects.filter(student_id=row['student_id'], assignment_id=row['assignment_id'])
+            .order_by('-is_final', '-id').values('id', 'grade', 'feedback', 'file')
+        )
+        graded = [r for r in rows if r['grade'] is not None or r['feedback']]
+        if len(graded) > 1:
+            conflicts.append((row['student_id'], row['assignment_id'], [r['id'] for r in graded]))
+            continue
+        keep = graded[0] if graded else rows[0]
+        removals.extend(r for r in rows if r is not keep)
+
+    if conflicts:
+        raise RuntimeError(
+            'Resolve duplicate graded submissions before applying this migration '
+            '(student id, assignment id, submission ids):\n'
+            + '\n'.join(f'  {student_id}, {assignment_id}, {ids}' for student_id, assignment_id, ids in conflicts)
+        )
+    for r in removals:
+        print(f'\n  Removing duplicate ungraded submission {r["id"]} (file kept: {r["file"]})')
+    Submission.objects.filter(id__in=[r['id'] for r in removals]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_notification_assignment_notification_kind_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['created_at'], name='activitylog_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['actor', 'created_at'], name='activitylog_actor_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['course', 'due_date'], name='assignment_course_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['due_date'], name='assignment_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'is_read', 'created_at'], name='notification_inbox_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['assignment', 'submitted_at'], name='submission_assignment_time_idx'),
+        ),
+        migrations.RunPython(remove_duplicate_submissions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='submission',
+            constraint=models.UniqueConstraint(fields=('student', 'assignment'), name='unique_submission_per_student'),
+        ),
+    ]
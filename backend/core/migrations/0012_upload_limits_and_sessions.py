@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:22
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_statcounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assignment',
+            name='allowed_extensions',
+            field=models.CharField(blank=True, help_text='허용 확장자 목록, 쉼표로 구분 (예: pdf,docx,hwp)', max_length=200),
+        ),
+        migrations.AddField(
+            model_name='assignment',
+            name='max_upload_size',
+            field=models.PositiveBigIntegerField(blank=True, help_text='제출 파일 최대 크기(바이트)', null=True),
+        ),
+        migrations.AddField(
+            model_name='submission',
+            name='file_sha256',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='submission',
+            name='file_size',
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=255)),
+                ('size', models.PositiveBigIntegerField()),
+                ('received', models.PositiveBigIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('assignment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to='core.assignment')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
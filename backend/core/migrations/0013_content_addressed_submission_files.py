@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:25
+
+import core.storage
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_upload_limits_and_sessions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='submission',
+            name='file_name',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='submission',
+            name='file',
+            field=models.FileField(max_length=255, storage=core.storage.submission_storage, upload_to='submissions/%Y/%m/%d/'),
+        ),
+        migrations.CreateModel(
+            name='FileBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('size', models.PositiveBigIntegerField(default=0)),
+                ('ref_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['ref_count', 'updated_at'], name='fileblob_gc_idx')],
+            },
+        ),
+    ]
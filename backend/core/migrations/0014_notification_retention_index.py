@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_content_addressed_submission_files'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['is_read', 'created_at'], name='notification_retention_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:35
+
+from django.db import migrations, models
+
+# MySQL에서는 ngram 파서(FULLTEXT WITH PARSER ngram)로 한국어를 2글자 단위로 색인합니다. (core/search.py)
+FULLTEXT_INDEXES = [
+    ('core_notice', 'notice_fulltext', 'title, content'),
+    ('core_assignment', 'assignment_fulltext', 'title, description'),
+    ('core_activitylog', 'activitylog_fulltext', 'details'),
+]
+
+
+def add_fulltext_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    for table, name, columns in FULLTEXT_INDEXES:
+        schema_editor.execute(f'ALTER TABLE {table} ADD FULLTEXT INDEX {name} ({columns}) WITH PARSER ngram')
+
+
+def remove_fulltext_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    for table, name, columns in FULLTEXT_INDEXES:
+        schema_editor.execute(f'ALTER TABLE {table} DROP INDEX {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_activitylog_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('doc_type', models.CharField(max_length=16)),
+                ('doc_id', models.BigIntegerField()),
+                ('term', models.CharField(max_length=32)),
+                ('weight', models.PositiveIntegerField(default=1)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'doc_type', 'doc_id'], name='searchindex_term_idx'), models.Index(fields=['doc_type', 'doc_id'], name='searchindex_doc_idx')],
+            },
+        ),
+        migrations.RunPython(add_fulltext_indexes, remove_fulltext_indexes),
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations, models
+
+
+def fill_file_sizes(apps, schema_editor):
+    """file_size가 비어 있는 예전 제출물의 크기를 저장소에서 읽어 채웁니다. 파일이 없으면 0으로 둡니다."""
+    from core.storage import submission_storage
+
+    Submission = apps.get_model('core', 'Submission')
+    storage = submission_storage()
+    pending = []
+    for submission in Submission.objects.filter(file_size__isnull=True).only('id', 'file').iterator():
+        try:
+            submission.file_size = storage.size(submission.file.name) if submission.file.name else 0
+        except OSError:
+            submission.file_size = 0
+        pending.append(submission)
+        if len(pending) >= 500:
+            Submission.objects.bulk_update(pending, ['file_size'])
+            pending = []
+    Submission.objects.bulk_update(pending, ['file_size'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_background_task'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_file_sizes, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='submission',
+            name='file_size',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
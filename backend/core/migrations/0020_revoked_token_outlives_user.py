@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_submission_file_size_not_null'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='revokedtoken',
+            name='user',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='revoked_tokens', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -1,6 +1,10 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils import timezone
 import secrets # ✅ 참여 코드를 생성하기 위해 import 합니다.
+import uuid
+
+from .storage import submission_storage
 
 # ✅ 참여 코드를 생성하는 함수
 def generate_join_code():
@@ -41,18 +45,44 @@ class Assignment(models.Model):
     description = models.TextField(blank=True)
     due_date = models.DateTimeField()
     allow_late = models.BooleanField(default=False)
+    # ✅ 제출 파일 제한입니다. 비워 두면 settings.SUBMISSION_MAX_UPLOAD_SIZE / 모든 확장자를 허용합니다.
+    max_upload_size = models.PositiveBigIntegerField(null=True, blank=True, help_text="제출 파일 최대 크기(바이트)")
+    allowed_extensions = models.CharField(max_length=200, blank=True, help_text="허용 확장자 목록, 쉼표로 구분 (예: pdf,docx,hwp)")
+    class Meta:
+        indexes = [
+            # 과목별 과제 목록 / 마감일 순 정렬
+            models.Index(fields=['course', 'due_date'], name='assignment_course_due_idx'),
+            # 마감 임박 과제 검색 (send_deadline_reminders)
+            models.Index(fields=['due_date'], name='assignment_due_idx'),
+        ]
     def __str__(self): return f"{self.course.name} - {self.title}"
 
 class Submission(models.Model):
     assignment = models.ForeignKey(Assignment, on_delete=models.CASCADE, related_name="submissions")
     student = models.ForeignKey(User, on_delete=models.CASCADE, limit_choices_to={"role": "student"})
-    file = models.FileField(upload_to="submissions/%Y/%m/%d/")
+    # ✅ 파일은 내용 주소 저장소(core/storage.py)에 저장되며, 원래 파일 이름은 file_name에 보관합니다.
+    file = models.FileField(upload_to="submissions/%Y/%m/%d/", storage=submission_storage, max_length=255)
+    file_name = models.CharField(max_length=255, blank=True)
     description = models.TextField(blank=True, help_text="학생이 제출 시 작성하는 설명입니다.")
     submitted_at = models.DateTimeField(auto_now_add=True)
     is_late = models.BooleanField(default=False)
     is_final = models.BooleanField(default=True)
     grade = models.IntegerField(null=True, blank=True)
     feedback = models.TextField(blank=True)
+    # ✅ 업로드하면서 계산한 파일 크기와 SHA-256 해시입니다. (core/uploads.py)
+    # 목록 정렬 키(?ordering=file_size)로 쓰므로 NULL을 두지 않습니다. (예전 제출물은 0019에서 채웠습니다)
+    file_size = models.PositiveBigIntegerField(default=0)
+    file_sha256 = models.CharField(max_length=64, blank=True)
+    class Meta:
+        constraints = [
+            # 학생당 과제 하나에 제출물은 하나만 존재합니다. (동시 제출 시 중복 방지)
+            # (student, assignment) 중복 확인 조회도 이 유니크 인덱스를 사용합니다.
+            models.UniqueConstraint(fields=['student', 'assignment'], name='unique_submission_per_student'),
+        ]
+        indexes = [
+            # 과제별 제출물 목록 (제출 시각 순)
+            models.Index(fields=['assignment', 'submitted_at'], name='submission_assignment_time_idx'),
+        ]
     def __str__(self): return f"{self.student.username} - {self.assignment.title}"
 
 class Notice(models.Model):
@@ -67,16 +97,146 @@ class Notification(models.Model):
     message = models.CharField(max_length=255)
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    # ✅ 마감 알림처럼 중복되면 안 되는 알림은 (과제, 종류)로 구분합니다.
+    # 일반 알림은 두 값을 비워 두며, NULL은 유니크 제약에 걸리지 않습니다.
+    assignment = models.ForeignKey(Assignment, on_delete=models.CASCADE, null=True, blank=True,
+                                   related_name="notifications")
+    kind = models.CharField(max_length=32, null=True, blank=True)
     class Meta:
         ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['recipient', 'assignment', 'kind'], name='unique_notification_per_assignment_kind'),
+        ]
+        indexes = [
+            # 사용자별 (안 읽은) 알림 목록, 최신순
+            # 안 읽은 알림 수(recipient, is_read)도 이 인덱스만으로 셉니다.
+            models.Index(fields=['recipient', 'is_read', 'created_at'], name='notification_inbox_idx'),
+            # 보존 기간이 지난 읽은 알림 정리(prune_notifications)
+            models.Index(fields=['is_read', 'created_at'], name='notification_retention_idx'),
+        ]
     def __str__(self): return f"Notification for {self.recipient.username}"
 
 class ActivityLog(models.Model):
     actor = models.ForeignKey(User, on_delete=models.CASCADE, related_name="actions")
     action_type = models.CharField(max_length=100)
     details = models.TextField(blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # 비동기 기록기(core/activity.py)가 이벤트 발생 시각을 그대로 저장할 수 있도록 default를 사용합니다.
+    created_at = models.DateTimeField(default=timezone.now)
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at'], name='activitylog_created_idx'),
+            models.Index(fields=['actor', 'created_at'], name='activitylog_actor_created_idx'),
+            models.Index(fields=['action_type', 'created_at'], name='activitylog_action_created_idx'),
+        ]
     def __str__(self): return f"{self.actor.username} - {self.action_type}"
 
+
+class ActivityLogArchive(models.Model):
+    """
+    ActivityLog에서 옮겨 간 한 달치 기록의 보관 파일(jsonl.gz)입니다. (core/log_archive.py)
+    같은 달을 다시 보관하면(늦게 기록된 로그 등) 행이 하나 더 생깁니다.
+    """
+    month = models.DateField()
+    path = models.CharField(max_length=500)
+    rows = models.PositiveIntegerField()
+    first_id = models.BigIntegerField()
+    last_id = models.BigIntegerField()
+    sha256 = models.CharField(max_length=64)
+    created_at = models.DateTimeField(auto_now_add=True)
+    class Meta:
+        ordering = ['-month', '-id']
+    def __str__(self): return f"{self.month:%Y-%m} ({self.rows} rows)"
+
+
+
+class StatCounter(models.Model):
+    """관리자 대시보드 통계용 카운터입니다. 모델 시그널(core/signals.py)이 증감하고, rebuild_stats 명령으로 다시 계산합니다."""
+    name = models.CharField(max_length=50, unique=True)
+    value = models.BigIntegerField(default=0)
+    def __str__(self): return f"{self.name} = {self.value}"
+
+
+class UploadSession(models.Model):
+    """큰 파일을 여러 조각으로 나누어 올리는(이어 올리기 가능한) 업로드 세션입니다. (core/uploads.py)"""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="upload_sessions")
+    assignment = models.ForeignKey(Assignment, on_delete=models.CASCADE, related_name="upload_sessions")
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    received = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    @property
+    def is_complete(self): return self.received == self.size
+    def __str__(self): return f"{self.owner.username} - {self.filename} ({self.received}/{self.size})"
+
+
+class FileBlob(models.Model):
+    """내용 주소 저장소의 파일 하나와, 그 파일을 가리키는 제출물 수입니다. (core/storage.py)"""
+    sha256 = models.CharField(max_length=64, unique=True)
+    size = models.PositiveBigIntegerField(default=0)
+    ref_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+    class Meta:
+        indexes = [
+            # 가비지 컬렉션 대상(ref_count <= 0) 검색
+            models.Index(fields=['ref_count', 'updated_at'], name='fileblob_gc_idx'),
+        ]
+    def __str__(self): return f"{self.sha256} (refs: {self.ref_count})"
+
+
+class SearchIndexEntry(models.Model):
+    """
+    MySQL FULLTEXT를 쓸 수 없는 DB(SQLite 등)를 위한 역색인 항목입니다. (core/search.py)
+    문서(doc_type, doc_id)에 들어 있는 토큰(term)과, 필드 가중치를 합한 점수(weight)를 저장합니다.
+    """
+    doc_type = models.CharField(max_length=16)
+    doc_id = models.BigIntegerField()
+    term = models.CharField(max_length=32)
+    weight = models.PositiveIntegerField(default=1)
+    class Meta:
+        indexes = [
+            models.Index(fields=['term', 'doc_type', 'doc_id'], name='searchindex_term_idx'),
+            models.Index(fields=['doc_type', 'doc_id'], name='searchindex_doc_idx'),
+        ]
+    def __str__(self): return f"{self.doc_type}:{self.doc_id} {self.term}"
+
+
+class RevokedToken(models.Model):
+    """
+    폐기된 JWT입니다. (core/authentication.py)
+    jti가 있으면 그 토큰 하나를, 비어 있으면 revoked_at 이전에 발급된 그 사용자의 모든 토큰을 거부합니다.
+    expires_at이 지나면 토큰이 어차피 만료되므로 지워도 됩니다.
+    """
+    # 사용자를 지운 뒤에도 그 사용자의 토큰을 계속 거부해야 하므로, 사용자와 함께 지우지 않고 외래 키 제약도 두지 않습니다.
+    user = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, related_name="revoked_tokens")
+    jti = models.CharField(max_length=255, blank=True)
+    revoked_at = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField(db_index=True)
+    def __str__(self): return f"{self.user_id}: {self.jti or 'all tokens'} (until {self.expires_at})"
+
+
+class BackgroundTask(models.Model):
+    """
+    DatabaseBackend의 작업 큐 항목입니다. (core/task_queue.py)
+    성공한 작업은 지우고, 재시도 횟수를 넘겨 실패한 작업은 status=failed로 남깁니다.
+    """
+    QUEUED, RUNNING, FAILED = 'queued', 'running', 'failed'
+    STATUS_CHOICES = ((QUEUED, 'Queued'), (RUNNING, 'Running'), (FAILED, 'Failed'))
+    name = models.CharField(max_length=100)
+    args = models.JSONField(default=list)
+    kwargs = models.JSONField(default=dict)
+    priority = models.PositiveSmallIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # 실행 중인 작업의 임대 만료 시각입니다. 이때까지 끝나지 않으면(워커 종료 등) 다른 워커가 다시 가져갑니다.
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    class Meta:
+        indexes = [
+            # 워커가 다음 작업을 고르는 조건/순서
+            models.Index(fields=['status', 'priority', 'run_at'], name='backgroundtask_claim_idx'),
+        ]
+    def __str__(self): return f"{self.name} ({self.status}, attempts: {self.attempts})"
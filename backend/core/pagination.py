@@ -0,0 +1,201 @@
+from base64 import b64decode, b64encode
+from urllib import parse
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import Cursor, CursorPagination, _reverse_ordering
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    모든 목록 API에서 사용하는 커서(keyset) 기반 페이지네이션입니다.
+
+    - 정렬 키는 각 View의 `ordering` 속성(예: ('-created_at', '-id'))을 사용합니다.
+      마지막 키가 `id`가 아니면 `id`를 붙여, 정렬 키 전체가 행마다 고유하게 합니다.
+    - 커서에는 페이지 끝 행의 정렬 키 값을 모두 넣고, 다음 페이지는 그 값 "뒤"의 행을 찾습니다.
+      예: ('title', 'id')이면 `title > v OR (title = v AND id > last_id)`
+      (DRF CursorPagination은 첫 번째 키와 offset만 쓰므로, 같은 값이 많은 title/due_date 정렬에서
+      페이지를 넘기는 사이에 행이 추가/삭제되면 행이 빠지거나 두 번 나옵니다. 이 클래스는 offset을 쓰지 않습니다.)
+    - 정렬 키에는 NULL이 될 수 있는 컬럼을 쓰지 않습니다. (core/filters.py)
+    - `?page_size=`로 페이지 크기를 조절할 수 있습니다. (최대 `max_page_size`)
+    - `?include_total=true`를 주면 응답에 전체 개수(`count`)를 포함합니다.
+      COUNT(*) 비용이 있으므로 필요할 때만 요청합니다.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-id',)
+    include_total_query_param = 'include_total'
+
+    def get_ordering(self, request, queryset, view):
+        # OrderingFilter가 붙은 View는 DRF 기본 동작(필터의 정렬)을 그대로 따릅니다.
+        if any(issubclass(backend, OrderingFilter) for backend in getattr(view, 'filter_backends', [])):
+            return super().get_ordering(request, queryset, view)
+
+        ordering = getattr(view, 'ordering', None) or self.ordering
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.total_count = None
+        if self.include_total_requested(request):
+            self.total_count = queryset.count()
+        page_queryset = self.get_page_queryset(queryset, request, view)
+        if page_queryset is None:
+            return None
+        return self.set_page(list(page_queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset의 비동기 버전입니다. 비동기 ORM(acount, async for)으로 조회합니다. (core/async_views.py)"""
+        self.total_count = None
+        if self.include_total_requested(request):
+            self.total_count = await queryset.acount()
+        page_queryset = self.get_page_queryset(queryset, request, view)
+        if page_queryset is None:
+            return None
+        return self.set_page([obj async for obj in page_queryset])
+
+    # CursorPagination.paginate_queryset을 조회 전(get_page_queryset)과 조회 후(set_page)로 나눈 것입니다.
+    def get_page_queryset(self, queryset, request, view=None):
+        """커서 위치로 거르고 정렬한, 이번 페이지 + 다음 페이지 확인용 1행의 쿼리셋입니다. 아직 조회하지 않습니다."""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = with_unique_key(self.get_ordering(request, queryset, view))
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (self.reverse, self.current_position) = (False, None)
+        else:
+            (self.reverse, self.current_position) = (self.cursor.reverse, self.cursor.position)
+
+        if self.reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if self.current_position is not None:
+            queryset = queryset.filter(self.keyset_condition(queryset.model, self.current_position))
+        return queryset[:self.page_size + 1]
+
+    def keyset_condition(self, model, position):
+        """
+        정렬 순서(역방향 커서이면 반대 순서)에서 position 뒤에 오는 행의 조건입니다.
+        (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ... 내림차순 키는 <로 비교합니다.
+        """
+        if len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        condition, equal = Q(), Q()
+        for order, raw_value in zip(self.ordering, position):
+            name = order.lstrip('-')
+            field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+            try:
+                value = field.to_python(raw_value)
+            except DjangoValidationError:
+                raise NotFound(self.invalid_cursor_message)
+            lookup = 'lt' if order.startswith('-') != self.reverse else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def set_page(self, results):
+        """조회한 행으로 이번 페이지와 이전/다음 커서 위치(페이지 양 끝 행의 정렬 키 값)를 정합니다."""
+        self.page = list(results[:self.page_size])
+        has_more = len(results) > len(self.page)
+        if self.reverse:
+            # 역방향으로 조회했으므로 페이지를 다시 뒤집습니다.
+            self.page = list(reversed(self.page))
+            self.has_next = self.current_position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.current_position is not None
+
+        if self.page:
+            self.previous_position = self._get_position_from_instance(self.page[0], self.ordering)
+            self.next_position = self._get_position_from_instance(self.page[-1], self.ordering)
+        else:
+            # 커서 뒤의 행이 모두 지워진 경우 등: 커서 위치에서 다시 시작합니다.
+            self.previous_position = self.next_position = self.current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=self.next_position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=self.previous_position))
+
+    def decode_cursor(self, request):
+        """커서 문자열을 Cursor로 읽습니다. position은 정렬 키마다 하나씩인 문자열 튜플입니다."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            querystring = b64decode(encoded.encode('ascii')).decode('utf-8')
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            reverse = bool(int(tokens.get('r', ['0'])[0]))
+            position = tokens.get('p')
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not position:
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(offset=0, reverse=reverse, position=tuple(position))
+
+    def encode_cursor(self, cursor):
+        tokens = {'p': list(cursor.position)}
+        if cursor.reverse:
+            tokens['r'] = '1'
+        querystring = parse.urlencode(tokens, doseq=True)
+        encoded = b64encode(querystring.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for order in ordering:
+            name = order.lstrip('-')
+            values.append(str(instance[name] if isinstance(instance, dict) else getattr(instance, name)))
+        return tuple(values)
+
+    def include_total_requested(self, request):
+        value = request.query_params.get(self.include_total_query_param, '')
+        return value.lower() in ('1', 'true', 'yes')
+
+    def get_paginated_response(self, data):
+        payload = {
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        }
+        if self.total_count is not None:
+            payload['count'] = self.total_count
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count'] = {
+            'type': 'integer',
+            'example': 123,
+        }
+        return response_schema
+
+
+def with_unique_key(ordering):
+    """정렬 키 전체가 행마다 고유하도록, id가 없으면 마지막 키와 같은 방향으로 붙입니다."""
+    if {'id', '-id', 'pk', '-pk'} & set(ordering):
+        return tuple(ordering)
+    return (*ordering, '-id' if ordering and ordering[-1].startswith('-') else 'id')
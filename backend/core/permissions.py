@@ -1,5 +1,88 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Value
 from rest_framework import permissions
 
+from .models import Assignment, Course, Submission
+from .response_cache import get_versions, user_namespace
+
+
+# --- ✅ 과목 소속(담당/수강) 정보: 요청마다 한 번만, 또는 짧은 캐시에서 읽습니다 ---
+class Membership:
+    """
+    사용자가 담당하는 과목, 수강하는 과목, 그 과목들의 과제 id입니다.
+    객체 권한 확인(추가 쿼리 없음)과 쿼리셋 필터가 같은 집합을 사용하므로 두 규칙이 어긋나지 않습니다.
+    """
+    def __init__(self, taught_course_ids, enrolled_course_ids, assignment_courses):
+        self.taught_course_ids = frozenset(taught_course_ids)
+        self.enrolled_course_ids = frozenset(enrolled_course_ids)
+        self.course_ids = self.taught_course_ids | self.enrolled_course_ids
+        # {과제 id: 과목 id}
+        self.assignment_courses = dict(assignment_courses)
+
+    def teaches(self, course_id):
+        return course_id in self.taught_course_ids
+
+    def attends(self, course_id):
+        return course_id in self.enrolled_course_ids
+
+    def is_member(self, course_id):
+        return course_id in self.course_ids
+
+    def course_of(self, obj):
+        """Course / Assignment / Submission 객체가 속한 과목 id입니다. 관련 객체를 불러오지 않습니다."""
+        if isinstance(obj, Course):
+            return obj.pk
+        if isinstance(obj, Assignment):
+            return obj.course_id
+        if isinstance(obj, Submission):
+            return self.assignment_courses.get(obj.assignment_id)
+        raise TypeError(f'Unsupported object: {type(obj).__name__}')
+
+    # 쿼리셋 필터 (객체 권한과 같은 규칙)
+    def member_courses(self, queryset):
+        return queryset.filter(pk__in=self.course_ids)
+
+    def member_assignments(self, queryset):
+        return queryset.filter(course_id__in=self.course_ids)
+
+    def taught_submissions(self, queryset):
+        return queryset.filter(assignment__course_id__in=self.taught_course_ids)
+
+
+def load_membership(user_id):
+    """두 번의 쿼리로 읽습니다. 담당/수강 과목(UNION 한 번)과 그 과목들의 과제입니다."""
+    taught = Course.objects.filter(professor_id=user_id).annotate(taught=Value(True)).values_list('id', 'taught')
+    enrolled = Course.students.through.objects.filter(user_id=user_id) \
+        .annotate(taught=Value(False)).values_list('course_id', 'taught')
+    rows = list(taught.union(enrolled, all=True))
+    taught_ids = [course_id for course_id, is_taught in rows if is_taught]
+    enrolled_ids = [course_id for course_id, is_taught in rows if not is_taught]
+    assignments = list(
+        Assignment.objects.filter(course_id__in=taught_ids + enrolled_ids).values_list('id', 'course_id')
+    ) if rows else []
+    return taught_ids, enrolled_ids, assignments
+
+
+def get_membership(request):
+    """
+    요청의 사용자 소속 정보입니다. 요청 객체에 한 번 저장하고, 캐시에는 MEMBERSHIP_CACHE_TTL초 동안 둡니다.
+    캐시 키에 user:<id> 네임스페이스 버전(core/response_cache.py)을 넣으므로, 과목 생성/삭제, 수강 변경,
+    과제 생성/삭제 시(core/signals.py) 바로 새로 읽습니다.
+    """
+    membership = getattr(request, '_membership', None)
+    if membership is None:
+        user_id = request.user.pk
+        version = get_versions([user_namespace(user_id)])[0]
+        key = f'membership:{user_id}:{version!r}'
+        data = cache.get(key)
+        if data is None:
+            data = load_membership(user_id)
+            cache.set(key, data, getattr(settings, 'MEMBERSHIP_CACHE_TTL', 60))
+        membership = request._membership = Membership(*data)
+    return membership
+
+
 # --- 기존 권한 클래스들은 그대로 둡니다 ---
 class IsProfessor(permissions.BasePermission):
     def has_permission(self, request, view):
@@ -23,7 +106,23 @@ class IsProfessorOrAdminUser(permissions.BasePermission):
 
 class IsOwnerOfSubmission(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
-        return obj.student == request.user
+        return obj.student_id == request.user.id
+
+class CanViewSubmission(permissions.BasePermission):
+    """제출한 학생 본인, 과목 담당 교수, 관리자만 제출물(파일)을 볼 수 있습니다."""
+    def has_object_permission(self, request, view, obj):
+        user = request.user
+        if user.role == 'admin' or obj.student_id == user.id:
+            return True
+        membership = get_membership(request)
+        return membership.teaches(membership.course_of(obj))
+
+class TeachesCourse(permissions.BasePermission):
+    """과목 / 과제 / 제출물 객체에 대해, 그 과목의 담당 교수만 허용합니다. (추가 쿼리 없음)"""
+    message = "You are not the professor of this course."
+    def has_object_permission(self, request, view, obj):
+        membership = get_membership(request)
+        return membership.teaches(membership.course_of(obj))
 
 # --- ✅ 아래에 '과목 담당 교수'인지 확인하는 권한 클래스를 새로 추가합니다 ---
 class IsCourseProfessor(permissions.BasePermission):
@@ -31,6 +130,11 @@ class IsCourseProfessor(permissions.BasePermission):
     객체 수준 권한으로, 요청을 보낸 사용자가 해당 과목의 담당 교수인지 확인합니다.
     """
     def has_object_permission(self, request, view, obj):
-        # obj는 데이터베이스에서 조회한 Course 객체입니다.
-        return obj.professor == request.user
+        # obj는 데이터베이스에서 조회한 Course 객체입니다. professor를 불러오지 않도록 id로 비교합니다.
+        return obj.professor_id == request.user.id
+
+class IsCourseProfessorOrAdmin(permissions.BasePermission):
+    """과목(Course) 객체에 대해 담당 교수와 관리자만 허용합니다."""
+    def has_object_permission(self, request, view, obj):
+        return request.user.role == 'admin' or obj.professor_id == request.user.id
 
@@ -0,0 +1,282 @@
+"""
+요청 단위 프로파일링 / 쿼리 계측 미들웨어입니다. settings.REQUEST_PROFILING["ENABLED"]일 때만 동작합니다.
+
+요청마다 다음을 측정합니다. View는 고치지 않으며, 미들웨어가 모든 View(core/views.py)를 감쌉니다.
+- total: 미들웨어에 들어와서 응답이 나갈 때까지의 시간
+- db: connection.execute_wrapper로 잰 SQL 실행 시간과 쿼리 수
+- 중복 쿼리: 같은 SQL(파라미터 제외)이 DUPLICATE_QUERY_THRESHOLD번 이상 실행된 경우(N+1 의심)
+- serialize: DRF Serializer/ListSerializer.to_representation 시간
+  (직렬화 중 지연 로딩되는 쿼리 시간도 포함되므로 db와 겹칠 수 있습니다.)
+- render: 응답 렌더링(JSON 인코딩) 시간
+
+결과는 Server-Timing 헤더(브라우저 개발자 도구의 Timing 탭)와 /api/metrics/(Prometheus 텍스트 형식)로 봅니다.
+지표는 프로세스별로 모이므로 워커가 여러 개면 워커마다 수집해야 합니다.
+SAMPLE_RATE 비율의 요청은 cProfile로 측정하고, SLOW_REQUEST_MS보다 느리면 PROFILE_DIR에 .prof 파일을 남깁니다.
+(python -m pstats <파일> 또는 snakeviz로 봅니다.)
+
+스트리밍 응답(ZIP 내보내기, SSE)은 응답 객체를 돌려줄 때까지만 측정합니다.
+"""
+import cProfile
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils.text import get_valid_filename
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ENABLED': False,
+    'SERVER_TIMING': True,
+    'DUPLICATE_QUERY_THRESHOLD': 2,
+    'SLOW_REQUEST_MS': 500,
+    'SAMPLE_RATE': 0.0,
+    'PROFILE_DIR': None,
+    # 비워 두면 /api/metrics/는 같은 호스트(127.0.0.1, ::1)에서만 볼 수 있습니다.
+    'METRICS_TOKEN': '',
+}
+
+_current = ContextVar('request_profile', default=None)
+
+
+def get_profiling_settings():
+    return {**DEFAULTS, **getattr(settings, 'REQUEST_PROFILING', {})}
+
+
+def view_name(view_func):
+    view_class = getattr(view_func, 'view_class', None) or getattr(view_func, 'cls', None)
+    return (view_class or view_func).__name__
+
+
+class RequestProfile:
+    def __init__(self, duplicate_threshold):
+        self.started = time.perf_counter()
+        self.duplicate_threshold = duplicate_threshold
+        self.view = 'unresolved'
+        self.total = 0.0
+        self.db_time = 0.0
+        self.queries = Counter()
+        self.serialize_time = 0.0
+        self.render_time = 0.0
+        self.serializing = False
+        self.render_started = None
+
+    # connection.execute_wrapper
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.queries[sql] += 1
+
+    @property
+    def query_count(self):
+        return sum(self.queries.values())
+
+    def duplicates(self):
+        return {sql: count for sql, count in self.queries.items() if count >= self.duplicate_threshold}
+
+    @property
+    def duplicate_count(self):
+        # 처음 한 번을 뺀 나머지 실행 횟수입니다.
+        return sum(count - 1 for count in self.duplicates().values())
+
+    def render_finished(self, response):
+        if self.render_started is not None:
+            self.render_time += time.perf_counter() - self.render_started
+            self.render_started = None
+
+    def server_timing(self):
+        db_desc = f'{self.query_count} queries'
+        if self.duplicate_count:
+            db_desc += f', {self.duplicate_count} duplicate'
+        return ', '.join([
+            f'total;dur={self.total * 1000:.1f}',
+            f'db;dur={self.db_time * 1000:.1f};desc="{db_desc}"',
+            f'serialize;dur={self.serialize_time * 1000:.1f}',
+            f'render;dur={self.render_time * 1000:.1f}',
+        ])
+
+
+# --- Serializer 시간 ---
+_serializers_instrumented = False
+
+
+def timed_representation(method):
+    @wraps(method)
+    def to_representation(self, instance):
+        profile = _current.get()
+        # 중첩 serializer는 바깥 serializer 시간에 포함되므로 가장 바깥 호출만 잽니다.
+        if profile is None or profile.serializing:
+            return method(self, instance)
+        profile.serializing = True
+        started = time.perf_counter()
+        try:
+            return method(self, instance)
+        finally:
+            profile.serialize_time += time.perf_counter() - started
+            profile.serializing = False
+    return to_representation
+
+
+def instrument_serializers():
+    global _serializers_instrumented
+    if _serializers_instrumented:
+        return
+    for cls in (serializers.Serializer, serializers.ListSerializer):
+        cls.to_representation = timed_representation(cls.to_representation)
+    _serializers_instrumented = True
+
+
+# --- Prometheus 지표 ---
+class Metrics:
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.requests = Counter()
+        self.buckets = {}
+        self.duration_sum = Counter()
+        self.db_seconds = Counter()
+        self.queries = Counter()
+        self.duplicates = Counter()
+        self.serialize_seconds = Counter()
+
+    def observe(self, profile, method, status):
+        view = profile.view
+        with self.lock:
+            self.requests[(view, method, str(status))] += 1
+            buckets = self.buckets.setdefault(view, [0] * (len(self.BUCKETS) + 1))
+            for i, bound in enumerate(self.BUCKETS):
+                if profile.total <= bound:
+                    buckets[i] += 1
+            buckets[-1] += 1
+            self.duration_sum[view] += profile.total
+            self.db_seconds[view] += profile.db_time
+            self.queries[view] += profile.query_count
+            self.duplicates[view] += profile.duplicate_count
+            self.serialize_seconds[view] += profile.serialize_time
+
+    def render(self):
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for labels, value in samples:
+                label_text = ','.join(f'{key}="{val}"' for key, val in labels)
+                lines.append(f'{name}{{{label_text}}} {value}')
+
+        with self.lock:
+            family('lms_http_requests_total', 'counter', 'Requests by view, method and status.',
+                   [((('view', v), ('method', m), ('status', s)), n) for (v, m, s), n in sorted(self.requests.items())])
+            samples = []
+            for view, buckets in sorted(self.buckets.items()):
+                samples += [((('view', view), ('le', str(bound))), buckets[i]) for i, bound in enumerate(self.BUCKETS)]
+                samples.append(((('view', view), ('le', '+Inf')), buckets[-1]))
+            lines.append('# HELP lms_http_request_duration_seconds Request duration by view.')
+            lines.append('# TYPE lms_http_request_duration_seconds histogram')
+            for labels, value in samples:
+                label_text = ','.join(f'{key}="{val}"' for key, val in labels)
+                lines.append(f'lms_http_request_duration_seconds_bucket{{{label_text}}} {value}')
+            for view, buckets in sorted(self.buckets.items()):
+                lines.append(f'lms_http_request_duration_seconds_sum{{view="{view}"}} {self.duration_sum[view]:.6f}')
+                lines.append(f'lms_http_request_duration_seconds_count{{view="{view}"}} {buckets[-1]}')
+            for name, help_text, counter in [
+                ('lms_db_query_seconds_total', 'Time spent executing SQL.', self.db_seconds),
+                ('lms_db_queries_total', 'SQL queries executed.', self.queries),
+                ('lms_db_duplicate_queries_total', 'Repeated executions of the same SQL within a request.',
+                 self.duplicates),
+                ('lms_serializer_seconds_total', 'Time spent in DRF serializers.', self.serialize_seconds),
+            ]:
+                family(name, 'counter', help_text, [((('view', view),), f'{value:g}') for view, value in sorted(counter.items())])
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
+
+
+# --- 미들웨어 ---
+class RequestProfilingMiddleware:
+    def __init__(self, get_response):
+        config = get_profiling_settings()
+        if not config['ENABLED']:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.config = config
+        self.profile_dir = Path(config['PROFILE_DIR'] or settings.BASE_DIR / 'var' / 'profiles')
+        instrument_serializers()
+
+    def __call__(self, request):
+        profile = RequestProfile(self.config['DUPLICATE_QUERY_THRESHOLD'])
+        token = _current.set(profile)
+        profiler = cProfile.Profile() if random.random() < self.config['SAMPLE_RATE'] else None
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(profile))
+                if profiler is not None:
+                    try:
+                        profiler.enable()
+                    except ValueError:
+                        # 이미 다른 프로파일러가 동작 중인 스레드입니다.
+                        profiler = None
+                try:
+                    response = self.get_response(request)
+                finally:
+                    if profiler is not None:
+                        profiler.disable()
+        finally:
+            _current.reset(token)
+
+        profile.total = time.perf_counter() - profile.started
+        if self.config['SERVER_TIMING']:
+            response['Server-Timing'] = profile.server_timing()
+        metrics.observe(profile, request.method, response.status_code)
+        if profile.total * 1000 >= self.config['SLOW_REQUEST_MS']:
+            self.report_slow_request(request, profile, profiler)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        profile = _current.get()
+        if profile is not None:
+            profile.view = view_name(view_func)
+
+    def process_template_response(self, request, response):
+        # DRF Response는 이 다음에 렌더링되므로 렌더링이 끝날 때 콜백으로 시간을 잽니다.
+        profile = _current.get()
+        if profile is not None:
+            profile.render_started = time.perf_counter()
+            response.add_post_render_callback(profile.render_finished)
+        return response
+
+    def report_slow_request(self, request, profile, profiler):
+        path = None
+        if profiler is not None:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            stamp = time.strftime('%Y%m%d-%H%M%S')
+            name = get_valid_filename(f'{stamp}-{profile.view}-{profile.total * 1000:.0f}ms.prof')
+            path = self.profile_dir / name
+            profiler.dump_stats(path)
+        duplicates = sorted(profile.duplicates().items(), key=lambda item: -item[1])[:3]
+        logger.warning(
+            'Slow request %s %s (%s): %.1fms, %d queries (%.1fms), %d duplicate%s%s',
+            request.method, request.path, profile.view, profile.total * 1000, profile.query_count,
+            profile.db_time * 1000, profile.duplicate_count,
+            ''.join(f'\n  {count}x {sql[:200]}' for sql, count in duplicates),
+            f'\n  profile: {path}' if path else '',
+        )
@@ -0,0 +1,222 @@
+"""
+실시간 알림 푸시(SSE)입니다.
+
+Notification이 저장되면 트랜잭션 커밋 후 브로커의 `notifications:<user id>` 채널로 발행하고,
+ASGI로 실행 중인 서버의 `/api/notifications/stream/`(Server-Sent Events)이 이를 구독해 브라우저로 보냅니다.
+
+브로커는 settings.REALTIME_BROKER["BACKEND"]로 바꿀 수 있습니다.
+- InMemoryBroker: 같은 프로세스 안에서만 전달됩니다. 개발 서버 한 대나 테스트용입니다.
+- RedisBroker: Redis pub/sub을 사용합니다. 워커가 여러 개이거나, cron으로 도는
+  run_task_worker(작업 큐 워커)처럼 다른 프로세스에서 만든 알림도 전달하려면 이것을 사용하세요.
+
+EventSource는 Authorization 헤더를 보낼 수 없으므로, 먼저 `/api/notifications/stream-token/`에서
+짧게(REALTIME_STREAM_TOKEN_MAX_AGE) 유효한 서명 토큰을 받아 `?token=`으로 연결합니다.
+연결할 때 JWT와 같은 폐기 목록(core/authentication.py)으로 확인하므로, 로그아웃하거나 역할이 바뀐 사용자는
+새로 연결할 수 없습니다. 폐기 목록은 캐시되어 있어 보통은 DB를 조회하지 않습니다.
+"""
+import asyncio
+import json
+import threading
+import time
+from functools import lru_cache
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+from djangorestframework_camel_case.util import camelize
+
+from .authentication import is_user_revoked
+from .models import Notification
+
+TOKEN_SALT = 'core.notification-stream'
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+def notification_channel(user_id):
+    return f'notifications:{user_id}'
+
+
+# --- 브로커 ---
+class InMemoryBroker:
+    """프로세스 안의 구독자(asyncio 큐)에게 메시지를 전달합니다. publish는 어느 스레드에서 불러도 됩니다."""
+    def __init__(self, **options):
+        self.lock = threading.Lock()
+        self.subscribers = {}
+
+    def publish(self, channel, message):
+        with self.lock:
+            subscriptions = list(self.subscribers.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.deliver(message)
+
+    def subscribe(self, channel):
+        subscription = InMemorySubscription(self, channel)
+        with self.lock:
+            self.subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            channel_subscribers = self.subscribers.get(subscription.channel, set())
+            channel_subscribers.discard(subscription)
+            if not channel_subscribers:
+                self.subscribers.pop(subscription.channel, None)
+
+
+class InMemorySubscription:
+    def __init__(self, broker, channel):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def deliver(self, message):
+        def put():
+            # 읽지 못하고 쌓인 메시지가 너무 많으면 가장 오래된 것을 버립니다.
+            if self.queue.full():
+                self.queue.get_nowait()
+            self.queue.put_nowait(message)
+        try:
+            self.loop.call_soon_threadsafe(put)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힌 구독입니다.
+            self.broker.unsubscribe(self)
+
+    async def get(self, timeout):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self):
+        self.broker.unsubscribe(self)
+
+
+class RedisBroker:
+    """Redis pub/sub 브로커입니다. redis 패키지가 필요합니다."""
+    def __init__(self, url=None, **options):
+        try:
+            import redis
+            import redis.asyncio
+        except ImportError:
+            raise ImproperlyConfigured('RedisBroker requires the "redis" package.')
+        self.url = url or settings.CACHES['default'].get('LOCATION')
+        self.client = redis.Redis.from_url(self.url)
+        self.async_client = redis.asyncio.Redis.from_url(self.url)
+
+    def publish(self, channel, message):
+        self.client.publish(channel, json.dumps(message))
+
+    def subscribe(self, channel):
+        return RedisSubscription(self.async_client.pubsub(), channel)
+
+
+class RedisSubscription:
+    def __init__(self, pubsub, channel):
+        self.pubsub = pubsub
+        self.channel = channel
+        self.subscribed = False
+
+    async def get(self, timeout):
+        if not self.subscribed:
+            await self.pubsub.subscribe(self.channel)
+            self.subscribed = True
+        message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        return json.loads(message['data']) if message else None
+
+    async def close(self):
+        if self.subscribed:
+            await self.pubsub.unsubscribe(self.channel)
+        await self.pubsub.aclose()
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    config = dict(settings.REALTIME_BROKER)
+    backend = import_string(config.pop('BACKEND'))
+    return backend(**{key.lower(): value for key, value in config.items()})
+
+
+@receiver(setting_changed)
+def reset_broker(setting, **kwargs):
+    if setting == 'REALTIME_BROKER':
+        get_broker.cache_clear()
+
+
+# --- 발행 ---
+def notification_payload(notification):
+    from .serializers import NotificationSerializer
+    # REST API 응답과 같은 모양(camelCase)으로 보냅니다.
+    return camelize(NotificationSerializer(notification).data)
+
+
+def publish_notifications(notifications):
+    broker = get_broker()
+    for notification in notifications:
+        broker.publish(notification_channel(notification.recipient_id), notification_payload(notification))
+
+
+def with_saved_ids(notifications):
+    """
+    MySQL에서는 bulk_create한 객체에 id가 채워지지 않으므로, 저장된 행을 다시 읽어 id가 있는 알림으로 바꿉니다.
+    (수신자, 생성 시각, 내용)으로 찾습니다. 생성 시각은 bulk_create가 객체에도 채워 둡니다.
+    """
+    missing = [n for n in notifications if n.pk is None]
+    if not missing:
+        return notifications
+    saved = Notification.objects.filter(
+        recipient_id__in={n.recipient_id for n in missing},
+        created_at__gte=min(n.created_at for n in missing),
+        created_at__lte=max(n.created_at for n in missing),
+    ).order_by()
+    by_key = {(n.recipient_id, n.created_at, n.message): n for n in saved}
+    return [by_key.get((n.recipient_id, n.created_at, n.message), n) if n.pk is None else n for n in notifications]
+
+
+def publish_notifications_on_commit(notifications):
+    """
+    커밋된 알림만 보내도록 트랜잭션 커밋 후에 발행합니다.
+    bulk_create는 시그널을 보내지 않으므로 일괄 생성하는 쪽에서 직접 호출합니다.
+    id가 없는 알림(MySQL의 bulk_create)은 같은 트랜잭션 안에서 다시 읽어 id와 함께 보냅니다.
+    """
+    notifications = with_saved_ids(list(notifications))
+    if notifications:
+        transaction.on_commit(lambda: publish_notifications(notifications))
+
+
+# --- 구독 토큰 ---
+def make_stream_token(user, jti=None):
+    """jti: 토큰을 요청할 때 쓴 액세스 토큰의 jti입니다. 그 토큰이 폐기되면 스트림 토큰도 쓸 수 없습니다."""
+    return signing.dumps({'u': user.pk, 'j': jti, 't': time.time()}, salt=TOKEN_SALT)
+
+
+def read_stream_token(token):
+    """유효하고 폐기되지 않은 토큰이면 사용자 id를, 아니면 None을 돌려줍니다."""
+    try:
+        payload = signing.loads(token, salt=TOKEN_SALT, max_age=settings.REALTIME_STREAM_TOKEN_MAX_AGE)
+        user_id, jti, issued_at = payload['u'], payload.get('j'), payload['t']
+    except (signing.BadSignature, KeyError, TypeError):
+        return None
+    if is_user_revoked(user_id, issued_at, jti):
+        return None
+    return user_id
+
+
+async def event_stream(channel, heartbeat):
+    """채널을 구독해 메시지를 SSE 형식으로 내보냅니다. 연결이 끊기면(취소되면) 구독을 정리합니다."""
+    subscription = get_broker().subscribe(channel)
+    try:
+        yield 'retry: 5000\n\n'
+        while True:
+            message = await subscription.get(timeout=heartbeat)
+            if message is None:
+                # 프록시가 유휴 연결을 끊지 않도록 주기적으로 주석 줄을 보냅니다.
+                yield ': keep-alive\n\n'
+            else:
+                yield f'event: notification\ndata: {json.dumps(message, ensure_ascii=False)}\n\n'
+    finally:
+        await subscription.close()
@@ -0,0 +1,149 @@
+"""
+읽기 위주 API(과목, 과제, 공지 목록)의 응답 캐시입니다.
+
+캐시 키를 직접 지우는 대신 "네임스페이스 버전"을 사용합니다.
+- `course:<id>`  : 과목 정보/과제가 바뀌면 갱신
+- `user:<id>`    : 그 사용자가 볼 수 있는 과목/과제 목록이 바뀌면 갱신
+- `notices`      : 공지가 바뀌면 갱신
+- `gradebook:<id>`: 과목의 제출물/채점이 바뀌면 갱신 (성적부)
+버전 값은 갱신 시각(time.time())이며, 응답 캐시 키·ETag·Last-Modified 모두 이 값으로 만듭니다.
+그래서 키 목록을 훑지 않아도 되고, locmem/Redis 등 어떤 Django 캐시 백엔드에서도 동작합니다.
+무효화는 core/signals.py에서 트랜잭션 커밋 후에 호출합니다.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+VERSION_PREFIX = 'respcache:version:'
+RESPONSE_PREFIX = 'respcache:response:'
+
+
+def course_namespace(course_id):
+    return f'course:{course_id}'
+
+
+def user_namespace(user_id):
+    return f'user:{user_id}'
+
+
+def gradebook_namespace(course_id):
+    return f'gradebook:{course_id}'
+
+
+NOTICES_NAMESPACE = 'notices'
+
+
+def get_ttl():
+    return getattr(settings, 'RESPONSE_CACHE_TTL', 300)
+
+
+def get_versions(namespaces):
+    keys = [VERSION_PREFIX + ns for ns in namespaces]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # 처음 보는 네임스페이스(또는 캐시에서 밀려난 경우)는 지금 시각으로 시작합니다.
+            cache.add(key, time.time(), timeout=None)
+            versions[key] = cache.get(key) or time.time()
+    return [versions[key] for key in keys]
+
+
+async def aget_versions(namespaces):
+    """get_versions의 비동기 버전입니다. (core/async_views.py)"""
+    keys = [VERSION_PREFIX + ns for ns in namespaces]
+    versions = await cache.aget_many(keys)
+    for key in keys:
+        if key not in versions:
+            await cache.aadd(key, time.time(), timeout=None)
+            versions[key] = await cache.aget(key) or time.time()
+    return [versions[key] for key in keys]
+
+
+def invalidate(namespaces):
+    """네임스페이스 버전을 올려, 해당 네임스페이스에 의존하는 응답 캐시를 모두 무효화합니다."""
+    now = time.time()
+    cache.set_many({VERSION_PREFIX + ns: now for ns in set(namespaces)}, timeout=None)
+
+
+def not_modified(request, etag, last_modified):
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match is not None:
+        return etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+    # Last-Modified/If-Modified-Since는 초 단위입니다. 버전에 초 미만 값이 있으면 같은 초 안에 다시 바뀌었는지
+    # 구분할 수 없어 오래된 응답에 304를 줄 수 있으므로, 그때는 ETag(If-None-Match)로만 판단합니다.
+    if last_modified != int(last_modified):
+        return False
+    if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+    return if_modified_since is not None and last_modified <= if_modified_since
+
+
+class CachedResponseMixin:
+    """
+    GET 응답(list/retrieve)을 캐시하고 ETag / Last-Modified로 조건부 요청(304)을 처리합니다.
+    View는 get_cache_namespaces()로 응답이 의존하는 네임스페이스를 알려 줍니다.
+    """
+    cache_per_user = True
+
+    def get_cache_namespaces(self):
+        raise NotImplementedError
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def cache_validators(self, request, versions):
+        """(캐시 키 해시, ETag, Last-Modified 시각)입니다."""
+        user_part = str(request.user.pk) if self.cache_per_user else '*'
+        key_material = '|'.join([type(self).__name__, request.get_full_path(), user_part] + [repr(v) for v in versions])
+        digest = hashlib.md5(key_material.encode()).hexdigest()
+        return digest, f'"{digest}"', max(versions)
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        digest, etag, last_modified = self.cache_validators(request, get_versions(self.get_cache_namespaces()))
+
+        if not_modified(request, etag, last_modified):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            data = cache.get(RESPONSE_PREFIX + digest)
+            if data is not None:
+                response = Response(data)
+            else:
+                response = handler(request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                cache.set(RESPONSE_PREFIX + digest, response.data, get_ttl())
+        return set_validators(response, etag, last_modified)
+
+    async def acached_response(self, handler, request, *args, **kwargs):
+        """cached_response의 비동기 버전입니다. handler도 코루틴 함수입니다. (core/async_views.py)"""
+        digest, etag, last_modified = self.cache_validators(request, await aget_versions(self.get_cache_namespaces()))
+
+        if not_modified(request, etag, last_modified):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            data = await cache.aget(RESPONSE_PREFIX + digest)
+            if data is not None:
+                response = Response(data)
+            else:
+                response = await handler(request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                await cache.aset(RESPONSE_PREFIX + digest, response.data, get_ttl())
+        return set_validators(response, etag, last_modified)
+
+
+def set_validators(response, etag, last_modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(int(last_modified))
+    # 브라우저는 매번 서버에 재검증(304 가능)하고, 공유 캐시에는 저장하지 않습니다.
+    response['Cache-Control'] = 'private, no-cache'
+    patch_vary_headers(response, ['Authorization'])
+    return response
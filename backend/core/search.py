@@ -0,0 +1,217 @@
+"""
+공지 / 과제 / 활동 로그 전문 검색입니다.
+
+- MySQL: FULLTEXT 인덱스(ngram 파서, 마이그레이션 0016)를 MATCH ... AGAINST로 조회합니다.
+  검색어의 각 단어를 구(phrase)로 묶어 BOOLEAN MODE로 거르고, NATURAL LANGUAGE MODE 점수로 정렬합니다.
+- 그 밖의 DB(SQLite 테스트 등): SearchIndexEntry 역색인을 사용합니다. 문서 저장/삭제 시그널과
+  ActivityLog 일괄 저장(core/activity.py)에서 색인을 갱신하며, rebuild_search_index 명령으로 다시 만들 수 있습니다.
+
+한국어는 띄어쓰기 단위가 아니라 음절 2-gram으로 나눕니다("과제제출" -> 과제, 제제, 제출).
+조사가 붙거나 붙여 쓴 말도 찾을 수 있고, MySQL ngram 파서(ngram_token_size=2)와 같은 방식입니다.
+한 음절짜리 한국어 검색어는 두 방식 모두 찾지 못합니다.
+"""
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+from django.db import connection
+from django.db.models import Count, Sum
+from django.db.models.expressions import RawSQL
+
+from .models import ActivityLog, Assignment, Notice, SearchIndexEntry
+
+HANGUL_RE = re.compile(r'[가-힣]+')
+WORD_RE = re.compile(r'[a-z0-9]+')
+MAX_TERM_LENGTH = 32
+SNIPPET_LENGTH = 120
+
+
+@dataclass(frozen=True)
+class DocumentType:
+    model: type
+    # (필드 이름, 가중치). 제목에 나온 단어가 본문보다 높은 점수를 받습니다.
+    fields: tuple
+
+
+DOCUMENT_TYPES = {
+    'notice': DocumentType(Notice, (('title', 3), ('content', 1))),
+    'assignment': DocumentType(Assignment, (('title', 3), ('description', 1))),
+    'log': DocumentType(ActivityLog, (('details', 1),)),
+}
+
+
+def use_fulltext():
+    return connection.vendor == 'mysql'
+
+
+# --- 토큰화 ---
+def tokenize(text):
+    """소문자 영문/숫자 단어와 한국어 음절 2-gram 목록입니다. (같은 토큰이 여러 번 나올 수 있습니다.)"""
+    text = (text or '').lower()
+    terms = [word[:MAX_TERM_LENGTH] for word in WORD_RE.findall(text)]
+    for run in HANGUL_RE.findall(text):
+        if len(run) == 1:
+            terms.append(run)
+        else:
+            terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return terms
+
+
+def document_terms(document_type, obj):
+    weights = Counter()
+    for field, weight in document_type.fields:
+        for term in tokenize(getattr(obj, field)):
+            weights[term] += weight
+    return weights
+
+
+# --- 역색인 갱신 ---
+def index_documents(doc_type, objects, created=False):
+    """
+    문서들의 색인을 다시 만듭니다. 새로 만든 문서면(created) 기존 색인을 지우는 쿼리를 생략합니다.
+    MySQL에서는 FULLTEXT 인덱스가 자동으로 갱신되므로 하지 않습니다.
+    """
+    if use_fulltext():
+        return
+    document_type = DOCUMENT_TYPES[doc_type]
+    objects = [obj for obj in objects if obj.pk is not None]
+    if not objects:
+        return
+    if not created:
+        SearchIndexEntry.objects.filter(doc_type=doc_type, doc_id__in=[obj.pk for obj in objects]).delete()
+    SearchIndexEntry.objects.bulk_create([
+        SearchIndexEntry(doc_type=doc_type, doc_id=obj.pk, term=term, weight=weight)
+        for obj in objects
+        for term, weight in document_terms(document_type, obj).items()
+    ], batch_size=1000)
+
+
+def unindex_documents(doc_type, ids):
+    if use_fulltext():
+        return
+    SearchIndexEntry.objects.filter(doc_type=doc_type, doc_id__in=list(ids)).delete()
+
+
+def rebuild_index(doc_type, batch_size=1000):
+    """문서 종류 하나의 색인을 처음부터 다시 만들고 문서 수를 돌려줍니다."""
+    SearchIndexEntry.objects.filter(doc_type=doc_type).delete()
+    batch, total = [], 0
+    for obj in DOCUMENT_TYPES[doc_type].model.objects.order_by('pk').iterator(chunk_size=batch_size):
+        batch.append(obj)
+        if len(batch) == batch_size:
+            index_documents(doc_type, batch, created=True)
+            total += len(batch)
+            batch = []
+    index_documents(doc_type, batch, created=True)
+    return total + len(batch)
+
+
+# --- 검색 ---
+def fulltext_query(query):
+    """BOOLEAN MODE 검색식입니다. 각 단어를 구로 감싸 모든 단어가 들어 있는 문서만 찾습니다."""
+    words = [re.sub(r'["+\-<>()~*@]', ' ', word).strip() for word in query.split()]
+    return ' '.join(f'+"{word}"' for word in words if word)
+
+
+def ranked(doc_type, queryset, query):
+    """
+    queryset(보이는 문서만)에서 query와 맞는 문서를 (score, id) 순으로 정렬한 values 쿼리셋입니다.
+    같은 점수면 최근 문서(id가 큰 것)가 먼저입니다.
+    """
+    document_type = DOCUMENT_TYPES[doc_type]
+    if use_fulltext():
+        table = document_type.model._meta.db_table
+        columns = ', '.join(f'{table}.{field}' for field, _ in document_type.fields)
+        boolean_query = fulltext_query(query)
+        if not boolean_query:
+            return queryset.none().values('id')
+        return (
+            queryset
+            .alias(matched=RawSQL(f'MATCH ({columns}) AGAINST (%s IN BOOLEAN MODE)', [boolean_query]))
+            .filter(matched__gt=0)
+            .annotate(score=RawSQL(f'MATCH ({columns}) AGAINST (%s IN NATURAL LANGUAGE MODE)', [query]))
+            .order_by('-score', '-id')
+            .values('id', 'score')
+        )
+
+    terms = set(tokenize(query))
+    if not terms:
+        return SearchIndexEntry.objects.none().values('doc_id')
+    return (
+        SearchIndexEntry.objects
+        .filter(doc_type=doc_type, term__in=terms, doc_id__in=queryset.values('pk'))
+        .values('doc_id')
+        .annotate(matched=Count('term', distinct=True), score=Sum('weight'))
+        # 검색어의 모든 토큰이 들어 있는 문서만 찾습니다.
+        .filter(matched=len(terms))
+        .order_by('-score', '-doc_id')
+        .values('doc_id', 'score')
+    )
+
+
+def ranked_ids(doc_type, queryset, query, limit):
+    """상위 limit개의 (score, doc_type, id)와 전체 일치 수를 돌려줍니다."""
+    rows = ranked(doc_type, queryset, query)
+    key = 'id' if use_fulltext() else 'doc_id'
+    top = [(float(row['score']), doc_type, row[key]) for row in rows[:limit]]
+    return top, rows.count()
+
+
+def make_snippet(text, query):
+    """본문에서 검색어가 처음 나오는 부분 앞뒤를 잘라 보여 줍니다."""
+    text = ' '.join((text or '').split())
+    lowered = text.lower()
+    positions = [lowered.find(word.lower()) for word in query.split()]
+    positions = [p for p in positions if p >= 0]
+    start = max(min(positions) - SNIPPET_LENGTH // 4, 0) if positions else 0
+    snippet = text[start:start + SNIPPET_LENGTH]
+    return ('…' if start > 0 else '') + snippet + ('…' if start + SNIPPET_LENGTH < len(text) else '')
+
+
+def visible_querysets(user, membership):
+    """사용자가 검색할 수 있는 문서 종류와 범위입니다. 과제는 담당/수강 과목의 것만 찾습니다. (core.permissions.Membership)"""
+    querysets = {'notice': Notice.objects.all()}
+    if user.role in ('student', 'professor'):
+        querysets['assignment'] = membership.member_assignments(Assignment.objects.all())
+    if user.role == 'admin':
+        querysets['log'] = ActivityLog.objects.all()
+    return querysets
+
+
+def search_result(doc_type, obj, score, query):
+    if doc_type == 'notice':
+        title, context, body, date = obj.title, obj.author.username, obj.content, obj.created_at
+    elif doc_type == 'assignment':
+        title, context, body, date = obj.title, obj.course.name, obj.description, obj.due_date
+    else:
+        title, context, body, date = obj.action_type, obj.actor.username, obj.details, obj.created_at
+    return {
+        'type': doc_type, 'id': obj.pk, 'title': title, 'context': context,
+        'snippet': make_snippet(body, query), 'date': date, 'score': score,
+    }
+
+
+def search(user, membership, query, doc_types, offset, limit):
+    """
+    여러 종류의 문서를 점수순으로 합쳐 [offset, offset + limit) 구간과 전체 일치 수를 돌려줍니다.
+    종류마다 상위 offset + limit개의 id/점수만 가져와 합치고, 실제 객체는 그 페이지의 것만 불러옵니다.
+    """
+    querysets = visible_querysets(user, membership)
+    hits, total = [], 0
+    for doc_type in doc_types:
+        if doc_type in querysets:
+            top, count = ranked_ids(doc_type, querysets[doc_type], query, offset + limit)
+            hits.extend(top)
+            total += count
+    hits.sort(key=lambda hit: (-hit[0], hit[1], -hit[2]))
+    page = hits[offset:offset + limit]
+
+    related = {'notice': 'author', 'assignment': 'course', 'log': 'actor'}
+    objects = {}
+    for doc_type in {hit[1] for hit in page}:
+        ids = [hit[2] for hit in page if hit[1] == doc_type]
+        model = DOCUMENT_TYPES[doc_type].model
+        objects[doc_type] = model.objects.select_related(related[doc_type]).in_bulk(ids)
+    results = [search_result(doc_type, objects[doc_type][pk], score, query)
+               for score, doc_type, pk in page if pk in objects[doc_type]]
+    return results, total
@@ -0,0 +1,163 @@
+"""
+성능 측정용 합성 데이터 생성기입니다. (seed_data, explain_hot_queries 명령)
+
+관리자, 교수, 학생, 과목과 수강(M:N), 과제, 작은 파일이 붙은 제출물, 공지, 알림, 활동 로그를 bulk_create로 만듭니다.
+같은 seed면 같은 모양의 데이터가 만들어지므로 커밋 사이의 벤치마크 결과를 비교할 수 있습니다.
+
+MySQL은 bulk_create한 객체에 pk를 채우지 않으므로, 다른 행이 가리키는 사용자/과목/과제는 만든 뒤 다시 읽습니다.
+bulk_create는 시그널을 보내지 않으므로 마지막에 시그널이 하던 일을 한 번에 다시 계산합니다.
+파일 참조 수(recount_blobs), 대시보드 카운터(rebuild_counters), 검색 색인(rebuild_index)입니다.
+"""
+import random
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.utils import timezone
+
+from . import stats
+from .blobs import recount_blobs
+from .models import User, Course, Assignment, Submission, Notice, Notification, ActivityLog
+from .search import DOCUMENT_TYPES, rebuild_index, use_fulltext
+from .storage import submission_storage
+
+BATCH_SIZE = 2000
+TOPICS = ['데이터베이스', '운영체제', '네트워크', '알고리즘', '자료구조', '컴퓨터구조', '소프트웨어공학', '인공지능']
+
+
+@dataclass
+class SeedOptions:
+    admins: int = 1
+    professors: int = 20
+    students: int = 2000
+    courses: int = 40
+    courses_per_student: int = 4
+    assignments_per_course: int = 10
+    submission_rate: float = 0.7
+    graded_rate: float = 0.5
+    late_rate: float = 0.1
+    notices: int = 50
+    notifications_per_student: int = 10
+    logs: int = 20000
+    files: int = 50
+    seed: int = 42
+    prefix: str = ''
+    password: str = ''
+
+
+def seed_files(rng, count):
+    """서로 다른 내용의 작은 제출 파일을 저장소에 만들고 (이름, 크기) 목록을 돌려줍니다."""
+    files = []
+    for i in range(count):
+        content = f'제출 파일 {i}\n'.encode() + rng.randbytes(rng.randint(256, 4096))
+        files.append((submission_storage().save(f'seed-{i}.txt', ContentFile(content)), len(content)))
+    return files
+
+
+def fetch_created(objects, queryset, key):
+    """
+    bulk_create로 만든 objects를 pk가 채워진 객체로 바꿔 같은 순서로 돌려줍니다.
+    queryset: 이번에 만든 행만 고르는 쿼리셋, key: 행마다 고유한 값
+    """
+    if all(obj.pk is not None for obj in objects):
+        return objects
+    created = {key(obj): obj for obj in queryset}
+    return [created[key(obj)] for obj in objects]
+
+
+def seed_dataset(options):
+    """
+    합성 데이터를 만들고 모델별 생성 수를 돌려줍니다.
+    사용자 이름은 options.prefix(없으면 seed<시각>)로 시작하므로 기존 데이터와 겹치지 않습니다.
+    """
+    rng = random.Random(options.seed)
+    now = timezone.now()
+    prefix = options.prefix or f'seed{int(time.time())}'
+    # 사용자마다 해시를 계산하면 수천 명에 몇 분이 걸리므로 한 번만 계산합니다.
+    password = make_password(options.password) if options.password else '!'
+
+    with transaction.atomic():
+        admins = User.objects.bulk_create([
+            User(username=f'{prefix}_admin{i}', role='admin', password=password) for i in range(options.admins)
+        ])
+        professors = User.objects.bulk_create([
+            User(username=f'{prefix}_prof{i}', role='professor', password=password)
+            for i in range(options.professors)
+        ], batch_size=BATCH_SIZE)
+        professors = fetch_created(professors, User.objects.filter(username__startswith=f'{prefix}_prof'),
+                                   key=lambda user: user.username)
+        students = User.objects.bulk_create([
+            User(username=f'{prefix}_student{i}', role='student', password=password)
+            for i in range(options.students)
+        ], batch_size=BATCH_SIZE)
+        students = fetch_created(students, User.objects.filter(username__startswith=f'{prefix}_student'),
+                                 key=lambda user: user.username)
+        courses = Course.objects.bulk_create([
+            Course(name=f'{rng.choice(TOPICS)} {i + 1}분반', professor=professors[i % len(professors)],
+                   join_code=f'{prefix}{i}'[-16:])
+            for i in range(options.courses)
+        ], batch_size=BATCH_SIZE)
+        courses = fetch_created(courses, Course.objects.filter(join_code__in=[course.join_code for course in courses]),
+                                key=lambda course: course.join_code)
+
+        roster = {course.id: [] for course in courses}
+        enrollments = []
+        for student in students:
+            for course in rng.sample(courses, k=min(len(courses), options.courses_per_student)):
+                roster[course.id].append(student)
+                enrollments.append(Course.students.through(course_id=course.id, user_id=student.id))
+        Course.students.through.objects.bulk_create(enrollments, batch_size=BATCH_SIZE)
+
+        assignments = Assignment.objects.bulk_create([
+            Assignment(course=course, title=f'{course.name} 과제 {i + 1}',
+                       description=f'{course.name} 수업 내용을 정리해 제출하세요. 분량은 자유입니다.',
+                       due_date=now + timedelta(hours=rng.randint(-24 * 60, 24 * 30)), allow_late=rng.random() < 0.5)
+            for course in courses for i in range(options.assignments_per_course)
+        ], batch_size=BATCH_SIZE)
+        assignments = fetch_created(assignments, Assignment.objects.filter(course__in=courses),
+                                    key=lambda assignment: (assignment.course_id, assignment.title))
+
+        files = seed_files(rng, options.files) if options.files else [('', None)]
+        submissions = []
+        for assignment in assignments:
+            for student in roster[assignment.course_id]:
+                if rng.random() >= options.submission_rate:
+                    continue
+                name, size = rng.choice(files)
+                graded = rng.random() < options.graded_rate
+                submissions.append(Submission(
+                    assignment=assignment, student=student, file=name, file_name=f'report-{student.id}.txt',
+                    file_size=size, is_late=rng.random() < options.late_rate,
+                    grade=rng.randint(40, 100) if graded else None, feedback='수고했습니다.' if graded else '',
+                ))
+        Submission.objects.bulk_create(submissions, batch_size=BATCH_SIZE)
+
+        notices = Notice.objects.bulk_create([
+            Notice(title=f'{rng.choice(TOPICS)} 관련 공지 {i + 1}', content='수업 일정과 과제 제출 방법을 안내합니다.',
+                   author=rng.choice(professors))
+            for i in range(options.notices)
+        ], batch_size=BATCH_SIZE)
+        notifications = Notification.objects.bulk_create([
+            Notification(recipient=student, message=f'{prefix} 과제 마감 알림 {i}', is_read=rng.random() < 0.8)
+            for student in students for i in range(options.notifications_per_student)
+        ], batch_size=BATCH_SIZE)
+        logs = ActivityLog.objects.bulk_create([
+            ActivityLog(actor=rng.choice(students), action_type='SUBMITTED_ASSIGNMENT',
+                        details=f'Submitted assignment {rng.choice(assignments).title}')
+            for _ in range(options.logs)
+        ], batch_size=BATCH_SIZE) if students and assignments else []
+
+        recount_blobs()
+        stats.rebuild_counters()
+        if not use_fulltext():
+            for doc_type in DOCUMENT_TYPES:
+                rebuild_index(doc_type)
+
+    return {
+        'admins': len(admins), 'professors': len(professors), 'students': len(students), 'courses': len(courses),
+        'enrollments': len(enrollments), 'assignments': len(assignments), 'submissions': len(submissions),
+        'notices': len(notices), 'notifications': len(notifications), 'logs': len(logs),
+    }
@@ -1,8 +1,57 @@
-from rest_framework import serializers
-from .models import User, Course, Assignment, Submission, Notice, Notification, ActivityLog
+import os
+
+from django.conf import settings
+from djangorestframework_camel_case.util import camel_to_underscore
+from rest_framework import permissions, serializers
+from .downloads import download_url
+from .gradebook import submission_status
+from .models import User, Course, Assignment, Submission, Notice, Notification, ActivityLog, ActivityLogArchive, UploadSession
+
+def query_list(request, name):
+    """?name=a,b 형태의 쿼리 파라미터를 목록으로 읽습니다."""
+    return [value.strip() for value in request.query_params.get(name, '').split(',') if value.strip()]
+
+
+def requested_expansions(request, view=None):
+    """?expand=로 요청했거나 View의 default_expand에 있는 필드 이름들입니다."""
+    return set(query_list(request, 'expand')) | set(getattr(view, 'default_expand', ()))
+
+
+# ✅ 조회 응답에서 필요한 필드만 보내도록 합니다. (?fields= / ?expand=)
+class SparseFieldsetMixin:
+    """
+    - ?fields=id,name : 나열한 필드만 보냅니다. 응답과 같은 camelCase 이름으로 써도 됩니다.
+    - Meta.expandable_fields : 크거나 추가 쿼리가 드는 필드입니다. ?expand=<필드>로 요청하거나
+      View의 default_expand에 있을 때만 보냅니다.
+    GET 요청의 최상위 serializer에만 적용하므로 중첩 serializer와 쓰기 요청의 입력 필드는 그대로입니다.
+    """
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        if request is None or request.method not in permissions.SAFE_METHODS or not self.is_top_level():
+            return fields
+
+        expand = requested_expansions(request, self.context.get('view'))
+        for name in getattr(self.Meta, 'expandable_fields', ()):
+            if name not in expand:
+                fields.pop(name)
+
+        wanted = query_list(request, 'fields')
+        if not wanted:
+            return fields
+        names = {name if name in fields else camel_to_underscore(name) for name in wanted}
+        unknown = [name for name in wanted if name not in fields and camel_to_underscore(name) not in fields]
+        if unknown:
+            raise serializers.ValidationError({"fields": f"Unknown fields: {', '.join(unknown)}."})
+        return {name: field for name, field in fields.items() if name in names}
+
+    def is_top_level(self):
+        parent = self.parent
+        return parent is None or (isinstance(parent, serializers.ListSerializer) and parent.parent is None)
+
 
 # --- UserSerializer를 먼저 정의해야 다른 Serializer에서 재사용할 수 있습니다. ---
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'role']
@@ -28,48 +77,67 @@ class UserAdminUpdateSerializer(serializers.ModelSerializer):
         model = User
         fields = ['role']
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     students = UserSerializer(many=True, read_only=True)
+    student_count = serializers.SerializerMethodField()
     class Meta:
         model = Course
-        fields = ['id', 'name', 'professor', 'students', 'join_code']
+        fields = ['id', 'name', 'professor', 'students', 'student_count', 'join_code']
         read_only_fields = ['professor', 'students', 'join_code']
+        # ✅ 수강생 목록은 ?expand=students일 때만 보냅니다. 목록 화면에는 student_count면 충분합니다.
+        expandable_fields = ['students']
+    def get_student_count(self, obj):
+        # 목록 View는 서브쿼리로 미리 계산해 둡니다. (views.with_student_count)
+        count = getattr(obj, 'student_count', None)
+        return obj.students.count() if count is None else count
 
-class AssignmentSerializer(serializers.ModelSerializer):
+class AssignmentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Assignment
-        fields = ['id', 'course', 'title', 'description', 'due_date', 'allow_late']
+        fields = ['id', 'course', 'title', 'description', 'due_date', 'allow_late', 'max_upload_size', 'allowed_extensions']
         read_only_fields = ['course']
 
-class SubmissionSerializer(serializers.ModelSerializer):
+class SubmissionSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     studentUsername = serializers.CharField(source='student.username', read_only=True)
     assignment_title = serializers.CharField(source='assignment.title', read_only=True)
     file_url = serializers.SerializerMethodField()
     status = serializers.SerializerMethodField()
+    # ✅ 조각 업로드(core/uploads.py)로 미리 올린 파일을 제출할 때 file 대신 사용합니다.
+    upload_id = serializers.UUIDField(write_only=True, required=False)
     class Meta:
         model = Submission
-        fields = ['id', 'assignment', 'assignment_title', 'student', 'studentUsername', 'file', 'file_url', 'description', 'submitted_at', 'is_late', 'grade', 'feedback', 'status']
-        read_only_fields = ['id', 'assignment', 'assignment_title', 'student', 'studentUsername', 'submitted_at', 'is_late', 'grade', 'feedback', 'file_url', 'status']
-        extra_kwargs = { 'file': {'write_only': True} }
+        fields = ['id', 'assignment', 'assignment_title', 'student', 'studentUsername', 'file', 'upload_id', 'file_url', 'file_name', 'file_size', 'description', 'submitted_at', 'is_late', 'grade', 'feedback', 'status']
+        read_only_fields = ['id', 'assignment', 'assignment_title', 'student', 'studentUsername', 'submitted_at', 'is_late', 'grade', 'feedback', 'file_url', 'file_name', 'file_size', 'status']
+        extra_kwargs = { 'file': {'write_only': True, 'required': False} }
+    def validate(self, attrs):
+        if self.instance is None and not attrs.get('file') and not attrs.get('upload_id'):
+            raise serializers.ValidationError({"file": "A file or a completed upload_id is required."})
+        return attrs
     def get_file_url(self, obj):
+        # ✅ 저장소 URL 대신 권한을 확인하는 다운로드 API 주소(서명 토큰 포함)를 돌려줍니다.
         request = self.context.get('request')
-        if obj.file and hasattr(obj.file, 'url'):
-            return request.build_absolute_uri(obj.file.url)
+        if obj.file and obj.pk and request is not None and request.user.is_authenticated:
+            return download_url(request, obj)
         return None
     def get_status(self, obj):
-        if obj.grade is not None:
-            return "평가 완료"
-        if obj.is_late:
-            return "지연 제출"
-        if obj.id is not None:
-            return "제출 완료"
-        return "제출 전"
+        return submission_status(obj.id is not None, obj.is_late, obj.grade)
 
 class SubmissionGradingSerializer(serializers.ModelSerializer):
     class Meta:
         model = Submission
         fields = ['grade', 'feedback']
 
+# ✅ 일괄 채점(core/grading.py)의 항목 하나입니다. 제출물은 submission_id 또는 학생 username으로 지정합니다.
+class BulkGradeEntrySerializer(serializers.Serializer):
+    submission_id = serializers.IntegerField(required=False)
+    username = serializers.CharField(required=False)
+    grade = serializers.IntegerField(allow_null=True)
+    feedback = serializers.CharField(required=False, allow_blank=True)
+    def validate(self, attrs):
+        if attrs.get('submission_id') is None and not attrs.get('username'):
+            raise serializers.ValidationError("Either submission_id or username is required.")
+        return attrs
+
 class NoticeSerializer(serializers.ModelSerializer):
     author_username = serializers.CharField(source='author.username', read_only=True)
     class Meta:
@@ -87,3 +155,21 @@ class ActivityLogSerializer(serializers.ModelSerializer):
     class Meta:
         model = ActivityLog
         fields = ['id', 'actor_username', 'action_type', 'details', 'created_at']
+
+class ActivityLogArchiveSerializer(serializers.ModelSerializer):
+    # 서버의 절대 경로는 노출하지 않고 파일 이름만 보여 줍니다.
+    file_name = serializers.SerializerMethodField()
+    class Meta:
+        model = ActivityLogArchive
+        fields = ['id', 'month', 'file_name', 'rows', 'first_id', 'last_id', 'sha256', 'created_at']
+    def get_file_name(self, obj):
+        return os.path.basename(obj.path)
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    chunk_size = serializers.SerializerMethodField()
+    class Meta:
+        model = UploadSession
+        fields = ['id', 'assignment', 'filename', 'size', 'received', 'chunk_size', 'created_at']
+        read_only_fields = ['id', 'received', 'created_at']
+    def get_chunk_size(self, obj):
+        return settings.SUBMISSION_UPLOAD_CHUNK_SIZE
@@ -0,0 +1,225 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from . import stats
+from .authentication import revoke_user_tokens
+from .blobs import acquire_blob, release_blob
+from .models import User, Course, Assignment, Submission, Notice, Notification, ActivityLog
+from .realtime import publish_notifications_on_commit
+from .search import index_documents, unindex_documents
+from .response_cache import NOTICES_NAMESPACE, course_namespace, gradebook_namespace, invalidate, user_namespace
+
+
+# --- 관리자 대시보드 카운터 (core/stats.py) ---
+@receiver(post_save, sender=Course)
+def count_course_created(sender, instance, created, **kwargs):
+    if created:
+        stats.increment({stats.COURSES: 1})
+
+
+@receiver(post_delete, sender=Course)
+def count_course_deleted(sender, instance, **kwargs):
+    stats.increment({stats.COURSES: -1})
+
+
+@receiver(post_save, sender=Assignment)
+def count_assignment_created(sender, instance, created, **kwargs):
+    if created:
+        stats.increment({stats.ASSIGNMENTS: 1})
+
+
+@receiver(post_delete, sender=Assignment)
+def count_assignment_deleted(sender, instance, **kwargs):
+    stats.increment({stats.ASSIGNMENTS: -1})
+
+
+def submission_counters(is_late, grade, sign):
+    return {
+        stats.SUBMISSIONS_LATE: sign if is_late else 0,
+        stats.SUBMISSIONS_UNGRADED: sign if grade is None else 0,
+    }
+
+
+@receiver(pre_save, sender=Submission)
+def remember_submission_state(sender, instance, **kwargs):
+    # 채점/지연 여부와 파일이 바뀌었는지 알기 위해 저장 전 값을 한 번에 기억해 둡니다.
+    instance._stats_previous = None
+    instance._previous_file = None
+    if instance.pk:
+        previous = Submission.objects.filter(pk=instance.pk).values_list('is_late', 'grade', 'file').first()
+        if previous is not None:
+            instance._stats_previous = previous[:2]
+            instance._previous_file = previous[2]
+
+
+@receiver(post_save, sender=Submission)
+def count_submission_saved(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_stats_previous', None)
+    deltas = submission_counters(instance.is_late, instance.grade, 1)
+    if created or previous is None:
+        deltas[stats.SUBMISSIONS] = 1
+    else:
+        for name, delta in submission_counters(*previous, -1).items():
+            deltas[name] += delta
+    stats.increment(deltas)
+
+
+@receiver(post_delete, sender=Submission)
+def count_submission_deleted(sender, instance, **kwargs):
+    deltas = submission_counters(instance.is_late, instance.grade, -1)
+    deltas[stats.SUBMISSIONS] = -1
+    stats.increment(deltas)
+
+
+# --- 제출 파일 참조 수 (core/blobs.py) ---
+@receiver(post_save, sender=Submission)
+def count_file_references(sender, instance, **kwargs):
+    previous_file = getattr(instance, '_previous_file', None)
+    if instance.file.name == previous_file:
+        return
+    if instance.file.name:
+        acquire_blob(instance.file.name, instance.file_size)
+    if previous_file:
+        release_blob(previous_file)
+
+
+@receiver(post_delete, sender=Submission)
+def release_file_reference(sender, instance, **kwargs):
+    if instance.file.name:
+        release_blob(instance.file.name)
+
+
+# 바뀌면 기존 JWT를 폐기하는 필드입니다. (core/authentication.py)
+TOKEN_SENSITIVE_FIELDS = ('role', 'is_active', 'password')
+
+
+@receiver(pre_save, sender=User)
+def remember_user_role(sender, instance, update_fields=None, **kwargs):
+    # 역할 카운터와 토큰 폐기에 쓰도록 저장 전 값을 한 번에 기억해 둡니다.
+    instance._stats_previous_role = None
+    instance._previous_credentials = None
+    if instance.pk and (update_fields is None or set(TOKEN_SENSITIVE_FIELDS) & set(update_fields)):
+        previous = User.objects.filter(pk=instance.pk).values_list(*TOKEN_SENSITIVE_FIELDS).first()
+        if previous is not None:
+            instance._stats_previous_role = previous[0]
+            instance._previous_credentials = previous
+
+
+@receiver(post_save, sender=User)
+def count_user_saved(sender, instance, created, **kwargs):
+    if created:
+        stats.increment({stats.USERS: 1, stats.role_counter(instance.role): 1})
+        return
+    previous_role = getattr(instance, '_stats_previous_role', None)
+    if previous_role and previous_role != instance.role:
+        stats.increment({stats.role_counter(previous_role): -1, stats.role_counter(instance.role): 1})
+
+
+@receiver(post_save, sender=User)
+def revoke_outdated_tokens(sender, instance, created, update_fields=None, **kwargs):
+    previous = getattr(instance, '_previous_credentials', None)
+    if created or previous is None:
+        return
+    # 지연 로딩된 사용자(불러오지 않은 필드는 저장되지 않음)를 위해 저장된 필드만 비교합니다.
+    fields = [f for f in TOKEN_SENSITIVE_FIELDS if update_fields is None or f in update_fields]
+    if any(previous[TOKEN_SENSITIVE_FIELDS.index(f)] != getattr(instance, f) for f in fields):
+        revoke_user_tokens(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def count_user_deleted(sender, instance, **kwargs):
+    stats.increment({stats.USERS: -1, stats.role_counter(instance.role): -1})
+
+
+@receiver(post_delete, sender=User)
+def revoke_deleted_user_tokens(sender, instance, **kwargs):
+    # 토큰의 클레임만으로 인증하므로(core/authentication.py), 지운 사용자의 토큰은 직접 폐기해야 거부됩니다.
+    revoke_user_tokens(instance.pk)
+
+
+# --- 응답 캐시 무효화 (core/response_cache.py) ---
+def course_audience_namespaces(course_id, professor_id):
+    """과목과, 그 과목을 목록에서 보는 모든 사용자(담당 교수 + 수강생)의 네임스페이스입니다."""
+    member_ids = Course.students.through.objects.filter(course_id=course_id).values_list('user_id', flat=True)
+    return [course_namespace(course_id), user_namespace(professor_id)] + [user_namespace(i) for i in member_ids]
+
+
+def invalidate_on_commit(namespaces):
+    transaction.on_commit(lambda: invalidate(namespaces))
+
+
+@receiver(post_save, sender=Course)
+def invalidate_course_saved(sender, instance, **kwargs):
+    invalidate_on_commit(course_audience_namespaces(instance.pk, instance.professor_id))
+
+
+@receiver(pre_delete, sender=Course)
+def invalidate_course_deleted(sender, instance, **kwargs):
+    # 삭제되면 수강생 목록을 더 이상 조회할 수 없으므로 삭제 전에 대상을 구합니다.
+    invalidate_on_commit(course_audience_namespaces(instance.pk, instance.professor_id))
+
+
+@receiver(m2m_changed, sender=Course.students.through)
+def invalidate_enrollment_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    # 과목 목록(student_count, ?expand=students)은 담당 교수의 네임스페이스에도 캐시되므로 함께 갱신합니다.
+    if reverse:
+        # user.courses.add(...) 처럼 학생 쪽에서 변경한 경우
+        course_ids = list(pk_set if pk_set is not None else instance.courses.values_list('id', flat=True))
+        professor_ids = Course.objects.filter(pk__in=course_ids).values_list('professor_id', flat=True)
+        namespaces = [user_namespace(instance.pk)] + [course_namespace(i) for i in course_ids] \
+            + [user_namespace(i) for i in set(professor_ids)]
+    else:
+        user_ids = pk_set if pk_set is not None else instance.students.values_list('id', flat=True)
+        namespaces = [course_namespace(instance.pk), user_namespace(instance.professor_id)] \
+            + [user_namespace(i) for i in user_ids]
+    invalidate_on_commit(list(namespaces))
+
+
+@receiver(post_save, sender=Assignment)
+@receiver(post_delete, sender=Assignment)
+def invalidate_assignment_changed(sender, instance, **kwargs):
+    professor_id = Course.objects.filter(pk=instance.course_id).values_list('professor_id', flat=True).first()
+    if professor_id is not None:
+        invalidate_on_commit(course_audience_namespaces(instance.course_id, professor_id))
+
+
+@receiver(post_save, sender=Submission)
+@receiver(post_delete, sender=Submission)
+def invalidate_gradebook(sender, instance, **kwargs):
+    course_id = Assignment.objects.filter(pk=instance.assignment_id).values_list('course_id', flat=True).first()
+    if course_id is not None:
+        invalidate_on_commit([gradebook_namespace(course_id)])
+
+
+@receiver(post_save, sender=Notice)
+@receiver(post_delete, sender=Notice)
+def invalidate_notices(sender, instance, **kwargs):
+    invalidate_on_commit([NOTICES_NAMESPACE])
+
+
+# --- 실시간 알림 푸시 (core/realtime.py) ---
+@receiver(post_save, sender=Notification)
+def push_notification(sender, instance, created, **kwargs):
+    if created:
+        publish_notifications_on_commit([instance])
+
+
+# --- 검색 색인 (core/search.py) ---
+SEARCH_DOCUMENT_TYPES = {Notice: 'notice', Assignment: 'assignment', ActivityLog: 'log'}
+
+
+@receiver(post_save, sender=Notice)
+@receiver(post_save, sender=Assignment)
+@receiver(post_save, sender=ActivityLog)
+def index_search_document(sender, instance, created, **kwargs):
+    index_documents(SEARCH_DOCUMENT_TYPES[sender], [instance], created=created)
+
+
+@receiver(post_delete, sender=Notice)
+@receiver(post_delete, sender=Assignment)
+@receiver(post_delete, sender=ActivityLog)
+def unindex_search_document(sender, instance, **kwargs):
+    unindex_documents(SEARCH_DOCUMENT_TYPES[sender], [instance.pk])
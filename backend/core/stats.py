@@ -0,0 +1,96 @@
+"""
+관리자 대시보드 통계입니다.
+
+매 요청마다 COUNT(*)를 실행하는 대신, StatCounter 테이블의 카운터를
+모델 시그널(core/signals.py)로 증감하고, 조회 결과는 캐시에 STATS_CACHE_TTL초 동안 보관합니다.
+카운터가 없거나 어긋났다면 `python manage.py rebuild_stats`로 다시 계산합니다.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from .models import User, Course, Assignment, Submission, StatCounter
+
+CACHE_KEY = 'admin-dashboard-stats'
+
+COURSES = 'courses'
+ASSIGNMENTS = 'assignments'
+SUBMISSIONS = 'submissions'
+SUBMISSIONS_LATE = 'submissions_late'
+SUBMISSIONS_UNGRADED = 'submissions_ungraded'
+USERS = 'users'
+
+
+def role_counter(role):
+    return f'users_role_{role}'
+
+
+ROLES = [role for role, _ in User.ROLE_CHOICES]
+COUNTER_NAMES = [COURSES, ASSIGNMENTS, SUBMISSIONS, SUBMISSIONS_LATE, SUBMISSIONS_UNGRADED, USERS] + \
+    [role_counter(role) for role in ROLES]
+
+
+def increment(deltas):
+    """{카운터 이름: 증감값}을 UPDATE ... SET value = value + n 으로 반영합니다."""
+    for name, delta in deltas.items():
+        if delta:
+            StatCounter.objects.filter(name=name).update(value=F('value') + delta)
+
+
+def compute_counters():
+    """모든 카운터를 테이블별 집계 쿼리 한 번씩으로 다시 계산합니다."""
+    counters = {
+        COURSES: Course.objects.count(),
+        ASSIGNMENTS: Assignment.objects.count(),
+    }
+    submissions = Submission.objects.aggregate(
+        total=Count('id'),
+        late=Count('id', filter=Q(is_late=True)),
+        ungraded=Count('id', filter=Q(grade__isnull=True)),
+    )
+    counters[SUBMISSIONS] = submissions['total']
+    counters[SUBMISSIONS_LATE] = submissions['late']
+    counters[SUBMISSIONS_UNGRADED] = submissions['ungraded']
+
+    by_role = dict(User.objects.values_list('role').annotate(count=Count('id')))
+    counters[USERS] = sum(by_role.values())
+    for role in ROLES:
+        counters[role_counter(role)] = by_role.get(role, 0)
+    return counters
+
+
+def rebuild_counters():
+    counters = compute_counters()
+    with transaction.atomic():
+        for name, value in counters.items():
+            StatCounter.objects.update_or_create(name=name, defaults={'value': value})
+    cache.delete(CACHE_KEY)
+    return counters
+
+
+def get_counters():
+    counters = dict(StatCounter.objects.values_list('name', 'value'))
+    if any(name not in counters for name in COUNTER_NAMES):
+        counters = rebuild_counters()
+    return counters
+
+
+def get_dashboard_stats():
+    stats = cache.get(CACHE_KEY)
+    if stats is not None:
+        return stats
+
+    counters = get_counters()
+    stats = {
+        'totalCourses': counters[COURSES],
+        'totalAssignments': counters[ASSIGNMENTS],
+        'totalSubmissions': counters[SUBMISSIONS],
+        'totalUsers': counters[USERS],
+        'usersByRole': {role: counters[role_counter(role)] for role in ROLES},
+        'lateSubmissions': counters[SUBMISSIONS_LATE],
+        'onTimeSubmissions': counters[SUBMISSIONS] - counters[SUBMISSIONS_LATE],
+        'ungradedSubmissions': counters[SUBMISSIONS_UNGRADED],
+    }
+    cache.set(CACHE_KEY, stats, getattr(settings, 'STATS_CACHE_TTL', 60))
+    return stats
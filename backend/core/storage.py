@@ -0,0 +1,76 @@
+"""
+제출 파일용 내용 주소(content-addressed) 저장소입니다.
+
+파일은 SHA-256 해시로 `cas/ab/cd/<sha256>` 위치에 한 번만 저장됩니다.
+같은 내용의 파일(재제출, 같은 양식 파일 등)은 새로 쓰지 않고 기존 파일을 그대로 가리킵니다.
+몇 개의 제출물이 파일을 가리키는지는 FileBlob.ref_count로 관리하며(core/signals.py),
+아무도 가리키지 않는 파일은 `python manage.py gc_submission_blobs`로 지웁니다.
+"""
+import hashlib
+import os
+import uuid
+
+from django.core.files import File
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage, storages
+
+PREFIX = 'cas'
+
+
+def submission_storage():
+    # FileField(storage=...)에 넘기는 callable입니다. 실제 백엔드는 settings.STORAGES["submissions"]에서 정합니다.
+    return storages['submissions']
+
+
+def blob_name(sha256):
+    return f'{PREFIX}/{sha256[:2]}/{sha256[2:4]}/{sha256}'
+
+
+def blob_sha256(name):
+    """저장소 경로가 내용 주소 경로이면 해시를, 이전 방식(submissions/...) 경로이면 None을 돌려줍니다."""
+    if name and name.startswith(PREFIX + '/'):
+        return os.path.basename(name)
+    return None
+
+
+def hash_content(content):
+    hasher = hashlib.sha256()
+    content.seek(0)
+    for chunk in content.chunks():
+        hasher.update(chunk)
+    content.seek(0)
+    return hasher.hexdigest()
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    def save(self, name, content, max_length=None):
+        if content is None:
+            raise ValueError('Storage.save() requires content.')
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+
+        # 업로드 핸들러(core/uploads.py)가 이미 계산한 해시가 있으면 그대로 사용합니다.
+        sha256 = getattr(content, 'sha256', None) or hash_content(content)
+        name = blob_name(sha256)
+        full_path = self.path(name)
+        # 가비지 컬렉션(core/blobs.py)이 지우는 중인 파일을 재사용하지 않도록, FileBlob 행을 먼저 갱신(잠금)한 뒤 확인합니다.
+        from .blobs import reserve_blob
+        reserve_blob(sha256)
+        if os.path.exists(full_path):
+            # 같은 내용이 이미 있으므로 쓰지 않습니다. (FileBlob 행이 없는 파일도 scan이 지우지 않도록 수정 시각을 갱신합니다)
+            os.utime(full_path)
+            return name
+
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        tmp_path = f'{full_path}.{uuid.uuid4().hex}.tmp'
+        if hasattr(content, 'temporary_file_path'):
+            file_move_safe(content.temporary_file_path(), tmp_path)
+        else:
+            with open(tmp_path, 'wb') as destination:
+                for chunk in content.chunks():
+                    destination.write(chunk)
+        if self.file_permissions_mode is not None:
+            os.chmod(tmp_path, self.file_permissions_mode)
+        # 동시에 같은 내용을 저장하더라도 결과가 같으므로 덮어써도 안전합니다.
+        os.replace(tmp_path, full_path)
+        return name
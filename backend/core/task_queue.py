@@ -0,0 +1,342 @@
+"""
+백그라운드 작업 큐입니다. 응답을 기다리는 사용자와 관계없는 일(알림 생성, 임시 파일 정리, 마감 알림)을
+요청 밖에서 실행합니다. 작업 정의는 core/tasks.py에 있습니다.
+
+    @task(priority=PRIORITY_HIGH)
+    def notify_graded(submission_id): ...
+
+    notify_graded.enqueue(submission.id)                 # 트랜잭션 커밋 후 큐에 넣습니다.
+    notify_graded.enqueue_with(args=[...], delay=60)     # 60초 뒤에 실행
+
+- 인자는 JSON으로 저장할 수 있는 값(모델 객체 대신 id)만 넘깁니다.
+- 우선순위: 숫자가 작을수록 먼저 실행합니다. 실행 시각이 된 작업 중에서 우선순위 순입니다.
+- 재시도: 예외가 나면 RETRY_DELAY_SECONDS × 2^(시도 횟수 - 1) 뒤에 다시 실행하고,
+  MAX_RETRIES번 다시 시도해도 실패하면 로그를 남깁니다. 작업은 여러 번 실행되어도 안전하게 작성하세요.
+- 주기 실행: settings.TASK_QUEUE["SCHEDULE"]의 작업을 run_task_worker 명령이 주기마다 큐에 넣습니다.
+  같은 주기에는 캐시(cache.add)로 한 번만 넣으므로 워커가 여러 개여도 Redis 등 공유 캐시를 쓰면 중복되지 않습니다.
+
+백엔드는 settings.TASK_QUEUE["BACKEND"]로 바꿀 수 있습니다.
+- ImmediateBackend: 큐에 넣는 즉시 같은 스레드에서 실행합니다. 테스트/디버깅용입니다.
+- ThreadPoolBackend: 프로세스 안의 워커 스레드가 실행합니다. 별도 프로세스가 필요 없지만,
+  프로세스가 종료되면 남은 작업은 사라집니다. 관리 명령처럼 곧 끝나는 프로세스에서는 run_pending()으로
+  지금 실행할 수 있는 작업이 끝날 때까지 기다리세요.
+- DatabaseBackend: BackgroundTask 테이블에 저장하고 run_task_worker 명령(별도 프로세스)이 실행합니다.
+  워커가 실행 중에 종료되어도 LEASE_SECONDS가 지나면 다른 워커가 다시 실행합니다.
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+import traceback
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Q
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import BackgroundTask
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 9
+
+DEFAULTS = {
+    'BACKEND': 'core.task_queue.ThreadPoolBackend',
+    'WORKERS': 2,
+    'MAX_RETRIES': 3,
+    'RETRY_DELAY_SECONDS': 10,
+    'POLL_INTERVAL_SECONDS': 1,
+    'LEASE_SECONDS': 300,
+    # {이름: {"task": 작업 이름, "every": 초, "args": [...], "kwargs": {...}}}
+    'SCHEDULE': {},
+}
+
+
+def get_queue_settings():
+    return {**DEFAULTS, **getattr(settings, 'TASK_QUEUE', {})}
+
+
+# --- 작업 등록 ---
+_registry = {}
+
+
+class Task:
+    def __init__(self, func, name, priority, max_retries):
+        self.func = func
+        self.name = name
+        self.priority = priority
+        self.max_retries = max_retries
+        self.__doc__ = func.__doc__
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def enqueue(self, *args, **kwargs):
+        self.enqueue_with(args=args, kwargs=kwargs)
+
+    def enqueue_with(self, args=(), kwargs=None, delay=0, priority=None):
+        """트랜잭션 안에서 부르면 커밋된 뒤에 큐에 넣으므로, 작업은 커밋된 데이터만 봅니다."""
+        message = {
+            'name': self.name,
+            'args': list(args),
+            'kwargs': kwargs or {},
+            'priority': self.priority if priority is None else priority,
+            'run_at': time.time() + delay,
+            'attempts': 0,
+        }
+        transaction.on_commit(lambda: get_backend().enqueue(message))
+
+    def retry_delay(self, attempts):
+        """attempts번 실패한 뒤 다시 실행할 때까지의 시간(초)입니다. 더 시도하지 않으면 None입니다."""
+        max_retries = get_queue_settings()['MAX_RETRIES'] if self.max_retries is None else self.max_retries
+        if attempts > max_retries:
+            return None
+        return get_queue_settings()['RETRY_DELAY_SECONDS'] * 2 ** (attempts - 1)
+
+
+def task(name=None, priority=PRIORITY_NORMAL, max_retries=None):
+    def register(func):
+        task_name = name or f'{func.__module__.split(".")[0]}.{func.__name__}'
+        _registry[task_name] = Task(func, task_name, priority, max_retries)
+        return _registry[task_name]
+    return register
+
+
+def get_task(name):
+    if name not in _registry:
+        from . import tasks  # noqa: F401  (core/tasks.py의 작업을 등록합니다)
+    return _registry[name]
+
+
+def run_message(message):
+    """
+    작업 하나를 실행하고 message['attempts']를 늘립니다.
+    (다시 시도할 때까지의 초 또는 None, 오류 내용)을 돌려줍니다. 성공하면 (None, '')입니다.
+    """
+    message['attempts'] += 1
+    try:
+        current = get_task(message['name'])
+    except KeyError:
+        logger.error('Unknown task %s', message['name'])
+        return None, f"Unknown task {message['name']}"
+    try:
+        current.func(*message['args'], **message['kwargs'])
+    except Exception:
+        error = traceback.format_exc()
+        delay = current.retry_delay(message['attempts'])
+        if delay is None:
+            logger.error('Task %s failed after %d attempts\n%s', current.name, message['attempts'], error)
+        else:
+            logger.warning('Task %s failed (attempt %d), retrying in %ss', current.name, message['attempts'], delay)
+        return delay, error
+    return None, ''
+
+
+# --- 백엔드 ---
+class ImmediateBackend:
+    """큐에 넣는 즉시 실행합니다. 재시도는 기다리지 않고 바로 하며, 끝내 실패하면 예외를 다시 냅니다."""
+    def __init__(self, **options):
+        pass
+
+    def enqueue(self, message):
+        while True:
+            delay, error = run_message(message)
+            if not error:
+                return
+            if delay is None:
+                raise RuntimeError(f"Task {message['name']} failed:\n{error}")
+
+    def work(self, stop_event):
+        stop_event.wait()
+
+
+class ThreadPoolBackend:
+    """
+    프로세스 안의 워커 스레드(WORKERS개)가 실행합니다. 처음 큐에 넣을 때 스레드를 시작합니다.
+    실행 시각이 지난 작업은 ready(우선순위 순), 아직인 작업은 delayed(실행 시각 순) 힙에 둡니다.
+    """
+    def __init__(self, workers=2, poll_interval_seconds=1, **options):
+        self.workers = workers
+        self.poll_interval = poll_interval_seconds
+        self.condition = threading.Condition()
+        self.ready = []
+        self.delayed = []
+        self.sequence = itertools.count()
+        self.threads = []
+        # 실행 중인 작업 수와, 마지막 run_pending() 이후 끝난 작업 수입니다.
+        self.running = 0
+        self.finished = 0
+
+    def enqueue(self, message):
+        with self.condition:
+            heapq.heappush(self.delayed, (message['run_at'], next(self.sequence), message))
+            self.condition.notify()
+        self.start()
+
+    def start(self):
+        with self.condition:
+            if self.threads:
+                return
+            self.threads = [
+                threading.Thread(target=self._run, name=f'task-worker-{i}', daemon=True) for i in range(self.workers)
+            ]
+        for thread in self.threads:
+            thread.start()
+
+    def next_message(self):
+        with self.condition:
+            while True:
+                now = time.time()
+                while self.delayed and self.delayed[0][0] <= now:
+                    _, seq, message = heapq.heappop(self.delayed)
+                    heapq.heappush(self.ready, (message['priority'], seq, message))
+                if self.ready:
+                    self.running += 1
+                    return heapq.heappop(self.ready)[2]
+                timeout = self.delayed[0][0] - now if self.delayed else self.poll_interval
+                self.condition.wait(min(timeout, self.poll_interval))
+
+    def _run(self):
+        while True:
+            message = self.next_message()
+            try:
+                delay, _ = run_message(message)
+            finally:
+                close_old_connections()
+                with self.condition:
+                    self.running -= 1
+                    self.finished += 1
+                    self.condition.notify_all()
+            if delay is not None:
+                message['run_at'] = time.time() + delay
+                self.enqueue(message)
+
+    def run_pending(self):
+        """
+        실행 시각이 된 작업이 모두 끝날 때까지 기다리고, 그동안(마지막 호출 이후) 끝난 작업 수를 돌려줍니다.
+        재시도를 기다리는 작업처럼 실행 시각이 아직인 작업은 기다리지 않습니다.
+        """
+        with self.condition:
+            while self.running or self.ready or (self.delayed and self.delayed[0][0] <= time.time()):
+                self.condition.wait(self.poll_interval)
+            finished, self.finished = self.finished, 0
+        return finished
+
+    def work(self, stop_event):
+        self.start()
+        stop_event.wait()
+
+
+class DatabaseBackend:
+    """BackgroundTask 테이블을 큐로 씁니다. run_task_worker 명령이 실행합니다."""
+    def __init__(self, workers=2, poll_interval_seconds=1, lease_seconds=300, **options):
+        self.workers = workers
+        self.poll_interval = poll_interval_seconds
+        self.lease = timedelta(seconds=lease_seconds)
+
+    def enqueue(self, message):
+        BackgroundTask.objects.create(
+            name=message['name'], args=message['args'], kwargs=message['kwargs'], priority=message['priority'],
+            run_at=timezone.now() + timedelta(seconds=max(0.0, message['run_at'] - time.time())),
+        )
+
+    def claim(self):
+        """실행할 작업 하나를 임대합니다. 여러 워커가 같은 행을 가져가지 않도록 SKIP LOCKED로 고릅니다."""
+        now = timezone.now()
+        with transaction.atomic():
+            row = (
+                BackgroundTask.objects.select_for_update(skip_locked=True)
+                .filter(Q(status=BackgroundTask.QUEUED) | Q(status=BackgroundTask.RUNNING, locked_until__lt=now),
+                        run_at__lte=now)
+                .order_by('priority', 'run_at', 'id')
+                .first()
+            )
+            if row is None:
+                return None
+            row.status = BackgroundTask.RUNNING
+            row.attempts += 1
+            row.locked_until = now + self.lease
+            row.save(update_fields=['status', 'attempts', 'locked_until'])
+        return row
+
+    def run_next(self):
+        """작업 하나를 실행합니다. 실행할 작업이 없으면 False입니다."""
+        row = self.claim()
+        if row is None:
+            return False
+        message = {'name': row.name, 'args': row.args, 'kwargs': row.kwargs, 'attempts': row.attempts - 1}
+        delay, error = run_message(message)
+        if not error:
+            row.delete()
+        elif delay is None:
+            BackgroundTask.objects.filter(pk=row.pk).update(status=BackgroundTask.FAILED, last_error=error)
+        else:
+            BackgroundTask.objects.filter(pk=row.pk).update(
+                status=BackgroundTask.QUEUED, run_at=timezone.now() + timedelta(seconds=delay), last_error=error,
+            )
+        return True
+
+    def run_pending(self):
+        """지금 실행할 수 있는 작업을 모두 실행하고 실행한 개수를 돌려줍니다."""
+        count = 0
+        while self.run_next():
+            count += 1
+        return count
+
+    def _run(self, stop_event):
+        while not stop_event.is_set():
+            try:
+                worked = self.run_next()
+            except Exception:
+                logger.exception('Task worker error')
+                worked = False
+            finally:
+                close_old_connections()
+            if not worked:
+                stop_event.wait(self.poll_interval)
+        connection.close()
+
+    def work(self, stop_event):
+        threads = [threading.Thread(target=self._run, args=(stop_event,), name=f'task-worker-{i}', daemon=True)
+                   for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+
+@lru_cache(maxsize=None)
+def get_backend():
+    config = get_queue_settings()
+    backend = import_string(config.pop('BACKEND'))
+    config.pop('SCHEDULE')
+    return backend(**{key.lower(): value for key, value in config.items()})
+
+
+@receiver(setting_changed)
+def reset_backend(setting, **kwargs):
+    if setting == 'TASK_QUEUE':
+        get_backend.cache_clear()
+
+
+# --- 주기 실행 ---
+def enqueue_scheduled(now=None):
+    """SCHEDULE에서 이번 주기에 아직 넣지 않은 작업을 큐에 넣고, 넣은 이름 목록을 돌려줍니다."""
+    now = time.time() if now is None else now
+    enqueued = []
+    for name, entry in get_queue_settings()['SCHEDULE'].items():
+        period = int(now // entry['every'])
+        if not cache.add(f'tasks:schedule:{name}:{period}', True, timeout=entry['every'] * 2):
+            continue
+        get_task(entry['task']).enqueue_with(args=entry.get('args', ()), kwargs=entry.get('kwargs'))
+        enqueued.append(name)
+    return enqueued
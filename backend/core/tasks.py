@@ -0,0 +1,109 @@
+"""
+백그라운드 작업입니다. (core/task_queue.py)
+요청을 보낸 사용자가 결과를 기다리지 않는 일만 둡니다. 인자는 id로 받고, 여러 번 실행되어도 안전해야 합니다.
+"""
+from datetime import timedelta
+
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
+
+from .models import Assignment, Notification, Submission, UploadSession
+from .realtime import publish_notifications_on_commit
+from .task_queue import PRIORITY_HIGH, PRIORITY_LOW, task
+from .uploads import discard_session
+
+
+@task(priority=PRIORITY_HIGH)
+def notify_graded(submission_id):
+    """채점된 제출물의 학생에게 피드백 알림을 보냅니다. (SubmissionGradeView)"""
+    submission = Submission.objects.select_related('assignment__course').filter(pk=submission_id).first()
+    if submission is None:
+        return
+    Notification.objects.create(
+        recipient_id=submission.student_id,
+        message=f"'{submission.assignment.course.name}' 과목의 '{submission.assignment.title}' 과제에 새로운 피드백이 등록되었습니다."
+    )
+
+
+@task(priority=PRIORITY_LOW)
+def discard_upload_session(session_id):
+    """제출에 사용한 조각 업로드 세션의 임시 파일과 행을 지웁니다."""
+    session = UploadSession.objects.filter(pk=session_id).first()
+    if session is not None:
+        discard_session(session)
+
+
+# --- 마감 알림 ---
+def reminder_kind(hours):
+    return f'deadline_{hours}h'
+
+
+def find_pending_reminders(now, window_end, kind):
+    """
+    마감이 임박한 과제 × 수강생 조합 중, 아직 제출하지 않았고 같은 알림을 받은 적 없는
+    (과제 id, 과제 제목, 학생 id) 목록을 하나의 쿼리로 구합니다.
+    """
+    already_submitted = Submission.objects.filter(
+        assignment=OuterRef('pk'), student=OuterRef('student_id'))
+    already_notified = Notification.objects.filter(
+        assignment=OuterRef('pk'), recipient=OuterRef('student_id'), kind=kind)
+
+    return (
+        Assignment.objects
+        .filter(due_date__gt=now, due_date__lte=window_end)
+        .annotate(student_id=F('course__students'))
+        .filter(student_id__isnull=False)
+        .filter(~Exists(already_submitted), ~Exists(already_notified))
+        .order_by('id', 'student_id')
+        .values_list('id', 'title', 'student_id')
+    )
+
+
+def build_deadline_reminders(now, hours):
+    # 마감일이 지금부터 N시간 이내인 과제가 대상입니다.
+    kind = reminder_kind(hours)
+    return [
+        Notification(
+            recipient_id=student_id,
+            assignment_id=assignment_id,
+            kind=kind,
+            message=f"마감 임박: '{title}' 과제 마감이 {hours}시간 남았습니다.",
+        )
+        for assignment_id, title, student_id in find_pending_reminders(now, now + timedelta(hours=hours), kind)
+    ]
+
+
+def saved_reminders(notifications, kind):
+    """
+    notifications의 (학생, 과제) 조합 중 이미 저장된 알림입니다.
+    (recipient, assignment, kind) 유니크 제약의 인덱스로 찾은 뒤, 조합이 맞지 않는 행은 걸러 냅니다.
+    """
+    pairs = {(n.recipient_id, n.assignment_id) for n in notifications}
+    queryset = Notification.objects.filter(
+        recipient_id__in={recipient_id for recipient_id, _ in pairs},
+        assignment_id__in={assignment_id for _, assignment_id in pairs},
+        kind=kind,
+    ).order_by()
+    return [n for n in queryset if (n.recipient_id, n.assignment_id) in pairs]
+
+
+@task(priority=PRIORITY_LOW)
+def send_deadline_reminders(hours=24, batch_size=500):
+    """
+    마감이 N시간 이내인 과제를 아직 제출하지 않은 수강생에게 알림을 보내고, 실제로 저장한 알림 수를 돌려줍니다.
+    같은 (학생, 과제, 알림 종류) 조합은 유니크 제약으로 한 번만 저장되므로 매시간 실행해도 중복 알림이 생기지 않습니다.
+    """
+    now = timezone.now()
+    kind = reminder_kind(hours)
+    notifications = build_deadline_reminders(now, hours)
+    sent = []
+    for start in range(0, len(notifications), batch_size):
+        batch = notifications[start:start + batch_size]
+        before = {n.id for n in saved_reminders(batch, kind)}
+        # 동시에 실행된 다른 작업이 먼저 저장한 알림은 유니크 제약 충돌로 건너뜁니다.
+        Notification.objects.bulk_create(batch, ignore_conflicts=True)
+        # ignore_conflicts로 저장한 객체에는 id가 없고 건너뛴 행도 알 수 없으므로, 저장 전후를 비교해 새로 생긴 알림만 셉니다.
+        # (두 조회 사이에 다른 작업이 저장한 알림까지 셀 수는 있지만, 그 창은 bulk_create 한 번뿐입니다.)
+        sent += [n for n in saved_reminders(batch, kind) if n.id not in before]
+    publish_notifications_on_commit(sent)
+    return len(sent)
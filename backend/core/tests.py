@@ -1,3 +1,1447 @@
-from django.test import TestCase
+import asyncio
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import zipfile
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.core.cache import cache
+from django.db import DatabaseError, IntegrityError, OperationalError, connection, transaction
+from django.db.models import OuterRef
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from . import benchmark, stats
+from .activity import DEAD_LETTER_NAME, ActivityLogWriter, save_entries
+from .realtime import publish_notifications_on_commit
+from .response_cache import VERSION_PREFIX, course_namespace, user_namespace
+from .authentication import ClaimsTokenObtainPairSerializer
+from .task_queue import BackgroundTask, DatabaseBackend, ThreadPoolBackend, task
+from .tasks import find_pending_reminders
+from .uploads import discard_session, session_part_path
+from .models import User, Course, Assignment, Submission, Notice, ActivityLog, Notification, UploadSession, FileBlob, \
+    ActivityLogArchive, RevokedToken
+
+TEST_MEDIA_ROOT = tempfile.mkdtemp(prefix='lms-test-media-')
+IMMEDIATE_TASKS = {'BACKEND': 'core.task_queue.ImmediateBackend'}
+
+
+class CursorPaginationTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', role='admin')
+        self.student = User.objects.create_user(username='student', role='student')
+
+    def test_list_is_paginated_with_cursor_links(self):
+        ActivityLog.objects.bulk_create(
+            [ActivityLog(actor=self.admin, action_type='TEST', details=str(i)) for i in range(25)]
+        )
+        self.client.force_authenticate(self.admin)
+
+        response = self.client.get('/api/admin/logs/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 20)
+        self.assertIsNotNone(response.data['next'])
+        self.assertNotIn('count', response.data)
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual(len(response.data['results']), 5)
+        self.assertIsNone(response.data['next'])
+
+    def test_page_size_and_total_are_configurable(self):
+        for i in range(7):
+            Notification.objects.create(recipient=self.student, message=f'알림 {i}')
+        self.client.force_authenticate(self.student)
+
+        response = self.client.get('/api/notifications/', {'page_size': 3, 'include_total': 'true'})
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertEqual(response.data['count'], 7)
+
+    def test_cursor_is_stable_under_concurrent_inserts(self):
+        for i in range(4):
+            Notification.objects.create(recipient=self.student, message=f'알림 {i}')
+        self.client.force_authenticate(self.student)
+
+        first = self.client.get('/api/notifications/', {'page_size': 2})
+        # 첫 페이지를 읽은 뒤 새 알림이 추가되어도 다음 페이지가 밀리지 않아야 합니다.
+        Notification.objects.create(recipient=self.student, message='새 알림')
+        second = self.client.get(first.data['next'])
+
+        seen = [n['id'] for n in first.data['results']] + [n['id'] for n in second.data['results']]
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(len(seen), 4)
+
+    def test_cursor_is_stable_among_tied_values(self):
+        professor = User.objects.create_user(username='prof', role='professor')
+        course = Course.objects.create(name='운영체제', professor=professor)
+        due_date = timezone.now()
+        tied = [Assignment.objects.create(course=course, title='같은 제목', due_date=due_date).id for _ in range(5)]
+        self.client.force_authenticate(professor)
+        ids = lambda response: [a['id'] for a in response.data['results']]
+
+        first = self.client.get('/api/assignments/', {'ordering': 'title', 'page_size': 2})
+        self.assertEqual(ids(first), tied[:2])
+        # 페이지를 넘기는 사이에 같은 제목 앞/뒤로 행이 추가되어도 빠지거나 두 번 나오는 행이 없어야 합니다.
+        Assignment.objects.create(course=course, title='가', due_date=due_date)
+        added = Assignment.objects.create(course=course, title='같은 제목', due_date=due_date).id
+        second = self.client.get(first.data['next'])
+        self.assertEqual(ids(second), tied[2:4])
+        self.assertEqual(ids(self.client.get(second.data['next'])), [tied[4], added])
+        self.assertEqual(ids(self.client.get(second.data['previous'])), tied[:2])
+
+        # 같은 기한(due_date)으로 정렬해도 id로 위치를 정합니다.
+        first = self.client.get('/api/assignments/', {'ordering': '-due_date', 'page_size': 4})
+        Assignment.objects.create(course=course, title='새 과제', due_date=due_date)
+        seen = ids(first) + ids(self.client.get(first.data['next']))
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(self.client.get('/api/assignments/', {'cursor': 'not-a-cursor'}).status_code, 404)
+
+
+@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+class QueryCountTests(APITestCase):
+    """
+    각 목록/상세 API가 데이터 양과 관계없이 일정한 수의 쿼리만 실행하는지 고정합니다.
+    행 수를 두 배로 늘려도 쿼리 수가 변하지 않아야 N+1이 없다는 뜻입니다.
+    """
+
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', role='admin')
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        self.course = Course.objects.create(name='자료구조', professor=self.professor)
+        self.assignment = Assignment.objects.create(
+            course=self.course, title='과제 1', due_date=timezone.now() + timedelta(days=1)
+        )
+        self.students = []
+        self.add_rows(3)
+
+    def add_rows(self, count):
+        offset = len(self.students)
+        for i in range(offset, offset + count):
+            student = User.objects.create_user(username=f'student{i}', role='student')
+            self.students.append(student)
+            self.course.students.add(student)
+            Submission.objects.create(
+                assignment=self.assignment, student=student,
+                file=SimpleUploadedFile(f'report{i}.txt', b'hello'),
+            )
+            Notice.objects.create(title=f'공지 {i}', content='내용', author=self.professor)
+            ActivityLog.objects.create(actor=student, action_type='SUBMITTED_ASSIGNMENT')
+            Notification.objects.create(recipient=self.students[0], message=f'알림 {i}')
+
+    def assertConstantQueries(self, user, url, expected):
+        # 응답 캐시가 아닌, 응답을 새로 만들 때의 쿼리 수를 확인합니다.
+        self.client.force_authenticate(user)
+        cache.clear()
+        with self.assertNumQueries(expected):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        self.add_rows(3)
+        cache.clear()
+        with self.assertNumQueries(expected):
+            self.client.get(url)
+
+    def test_assignment_submissions(self):
+        # 소속 정보(담당/수강 과목, 과제) 2번 + 제출물 페이지. 소속 정보는 캐시되면 다음 요청부터 빠집니다.
+        self.assertConstantQueries(self.professor, f'/api/assignments/{self.assignment.id}/submissions/', 3)
+
+    def test_my_submissions(self):
+        self.assertConstantQueries(self.students[0], '/api/my-submissions/', 1)
+
+    def test_course_list(self):
+        # 과목 페이지(수강생 수는 서브쿼리), ?expand=students이면 수강생 prefetch가 더해집니다.
+        self.assertConstantQueries(self.professor, '/api/courses/', 1)
+        self.assertConstantQueries(self.professor, '/api/courses/?expand=students', 2)
+
+    def test_course_detail(self):
+        # 소속 정보 2번 + 과목, 수강생 prefetch
+        self.assertConstantQueries(self.professor, f'/api/courses/{self.course.id}/', 4)
+
+    def test_assignment_list(self):
+        self.assertConstantQueries(self.students[0], '/api/assignments/', 1)
+
+    def test_notice_list(self):
+        self.assertConstantQueries(self.students[0], '/api/notices/', 1)
+
+    def test_notification_list(self):
+        self.assertConstantQueries(self.students[0], '/api/notifications/', 1)
+
+    def test_activity_log_list(self):
+        self.assertConstantQueries(self.admin, '/api/admin/logs/', 1)
+
+    def test_user_list(self):
+        self.assertConstantQueries(self.admin, '/api/admin/users/', 1)
+
+
+@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+class SendDeadlineRemindersTests(APITestCase):
+    def setUp(self):
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        self.course = Course.objects.create(name='운영체제', professor=self.professor)
+        self.students = [User.objects.create_user(username=f'student{i}', role='student') for i in range(3)]
+        self.course.students.add(*self.students)
+        self.assignment = Assignment.objects.create(
+            course=self.course, title='과제 1', due_date=timezone.now() + timedelta(hours=3)
+        )
+        Submission.objects.create(
+            assignment=self.assignment, student=self.students[0],
+            file=SimpleUploadedFile('report.txt', b'hello'),
+        )
+
+    def run_command(self, *args):
+        out = StringIO()
+        call_command('send_deadline_reminders', *args, stdout=out)
+        return out.getvalue()
+
+    def test_notifies_only_students_without_submission(self):
+        self.run_command()
+        recipients = set(Notification.objects.values_list('recipient_id', flat=True))
+        self.assertEqual(recipients, {self.students[1].id, self.students[2].id})
+        self.assertTrue(all(n.kind == 'deadline_24h' and n.assignment_id == self.assignment.id
+                            for n in Notification.objects.all()))
+
+    def test_running_twice_does_not_duplicate(self):
+        self.run_command()
+        output = self.run_command()
+        self.assertIn('Successfully sent 0', output)
+        self.assertEqual(Notification.objects.count(), 2)
+
+    def test_counts_only_notifications_it_saved(self):
+        def racing_find(*args):
+            pending = list(find_pending_reminders(*args))
+            # 대상을 구한 뒤, 동시에 실행된 다른 작업이 같은 알림 하나를 먼저 저장한 상황입니다.
+            Notification.objects.create(recipient=self.students[1], assignment=self.assignment,
+                                        kind='deadline_24h', message='먼저 보낸 알림')
+            return pending
+
+        with patch('core.tasks.find_pending_reminders', side_effect=racing_find):
+            output = self.run_command()
+        self.assertIn('Successfully sent 1', output)
+        self.assertEqual(Notification.objects.count(), 2)
+
+    def test_window_and_dry_run(self):
+        self.assertIn('Successfully sent 0', self.run_command('--hours', '1'))
+        output = self.run_command('--dry-run')
+        self.assertIn('[dry-run] 2', output)
+        self.assertEqual(Notification.objects.count(), 0)
+
+
+class ActivityLogWriterTests(APITestCase):
+    def setUp(self):
+        self.actor = User.objects.create_user(username='prof', role='professor')
+        self.spool_dir = tempfile.mkdtemp(prefix='lms-activity-spool-')
+
+    def make_writer(self, **kwargs):
+        return ActivityLogWriter(batch_size=3, flush_interval_ms=10, spool_dir=self.spool_dir, **kwargs)
+
+    def test_flush_preserves_order(self):
+        writer = self.make_writer()
+        for i in range(7):
+            writer.log(self.actor, 'TEST', f'event {i}')
+        self.assertEqual(ActivityLog.objects.count(), 0)
+
+        self.assertEqual(writer.flush(), 7)
+        logs = list(ActivityLog.objects.order_by('id'))
+        self.assertEqual([log.details for log in logs], [f'event {i}' for i in range(7)])
+        self.assertEqual([log.created_at for log in logs], sorted(log.created_at for log in logs))
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    def test_concurrent_logging_loses_nothing(self):
+        writer = self.make_writer()
+
+        def produce(thread_no):
+            for i in range(50):
+                writer.log(self.actor, 'TEST', f'{thread_no}:{i}')
+
+        threads = [threading.Thread(target=produce, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.flush()
+
+        details = list(ActivityLog.objects.order_by('id').values_list('details', flat=True))
+        self.assertEqual(len(details), 400)
+        for thread_no in range(8):
+            sequence = [int(d.split(':')[1]) for d in details if d.startswith(f'{thread_no}:')]
+            self.assertEqual(sequence, list(range(50)))
+
+    def test_spooled_events_survive_a_crash(self):
+        crashed = self.make_writer()
+        for i in range(5):
+            crashed.log(self.actor, 'TEST', f'event {i}')
+        # flush 없이 프로세스가 종료된 상황: spool 파일만 남고(잠금은 풀림), 한동안 갱신되지 않습니다.
+        crashed.close_spool()
+        an_hour_ago = timezone.now().timestamp() - 3600
+        os.utime(crashed.spool_path, (an_hour_ago, an_hour_ago))
+
+        recovered = self.make_writer().recover()
+        self.assertEqual(recovered, 5)
+        self.assertEqual(ActivityLog.objects.count(), 5)
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    def test_failed_recovery_is_retried(self):
+        crashed = self.make_writer()
+        for i in range(5):
+            crashed.log(self.actor, 'TEST', f'event {i}')
+        crashed.close_spool()
+        an_hour_ago = timezone.now().timestamp() - 3600
+        os.utime(crashed.spool_path, (an_hour_ago, an_hour_ago))
+
+        # 시작할 때 DB가 아직 뜨지 않은 상황: 선점한(이름을 바꾼) 파일은 다음 복구에서 다시 찾습니다.
+        writer = self.make_writer()
+        with patch('core.activity.save_entries', side_effect=OperationalError):
+            with self.assertRaises(OperationalError):
+                writer.recover()
+        self.assertEqual(len(os.listdir(self.spool_dir)), 1)
+        self.assertEqual(writer.recover(), 5)
+        self.assertEqual(ActivityLog.objects.count(), 5)
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    def test_entry_that_keeps_failing_is_dead_lettered(self):
+        def save_or_reject(entries, batch_size):
+            # 삭제된 사용자를 가리키는 로그처럼, 그 로그만 계속 실패하는 상황입니다.
+            if any(entry['details'] == 'bad' for entry in entries):
+                raise IntegrityError
+            save_entries(entries, batch_size)
+
+        writer = self.make_writer(max_attempts=2)
+        for details in ['event 0', 'bad', 'event 1']:
+            writer.log(self.actor, 'TEST', details)
+        with patch('core.activity.save_entries', side_effect=save_or_reject), self.assertLogs('core.activity', 'ERROR'):
+            self.assertEqual(writer.flush(), 2)
+            self.assertEqual(writer.flush(), 0)
+        self.assertEqual(list(ActivityLog.objects.order_by('id').values_list('details', flat=True)), ['event 0', 'event 1'])
+        self.assertEqual(os.listdir(self.spool_dir), [DEAD_LETTER_NAME])
+        with open(os.path.join(self.spool_dir, DEAD_LETTER_NAME), encoding='utf-8') as f:
+            self.assertEqual(json.loads(f.readline())['details'], 'bad')
+
+    def test_live_spool_is_not_recovered_while_saving_fails(self):
+        writer = self.make_writer()
+        writer.log(self.actor, 'TEST', 'event')
+        an_hour_ago = timezone.now().timestamp() - 3600
+        os.utime(writer.spool_path, (an_hour_ago, an_hour_ago))
+
+        # DB 저장이 실패해도 백그라운드 스레드는 spool의 수정 시각을 갱신합니다.
+        with patch('core.activity.save_entries', side_effect=DatabaseError):
+            writer.tick()
+            self.assertGreater(writer.spool_path.stat().st_mtime, an_hour_ago)
+            # 수정 시각이 오래되었더라도 잠겨 있는 spool은 다른 기록기가 복구하지 않습니다.
+            os.utime(writer.spool_path, (an_hour_ago, an_hour_ago))
+            self.assertEqual(self.make_writer().recover(), 0)
+        writer.shutdown()
+        self.assertEqual(ActivityLog.objects.count(), 1)
+
+    def test_shutdown_drains_buffer(self):
+        writer = self.make_writer()
+        for i in range(2):
+            writer.log(self.actor, 'TEST', f'event {i}')
+        writer.shutdown()
+        self.assertEqual(ActivityLog.objects.count(), 2)
+
+
+@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+class DashboardStatsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        stats.rebuild_counters()
+        self.admin = User.objects.create_user(username='admin', role='admin')
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        self.course = Course.objects.create(name='네트워크', professor=self.professor)
+        self.assignment = Assignment.objects.create(
+            course=self.course, title='과제 1', due_date=timezone.now() + timedelta(days=1)
+        )
+        self.submissions = []
+        for i in range(3):
+            student = User.objects.create_user(username=f'student{i}', role='student')
+            self.submissions.append(Submission.objects.create(
+                assignment=self.assignment, student=student, is_late=(i == 0),
+                file=SimpleUploadedFile(f'report{i}.txt', b'hello'),
+            ))
+
+    def test_counters_track_changes_incrementally(self):
+        self.submissions[1].grade = 90
+        self.submissions[1].save()
+        self.submissions[2].delete()
+        self.admin.role = 'professor'
+        self.admin.save()
+
+        self.assertEqual(stats.get_counters(), stats.compute_counters())
+
+    def test_dashboard_response_is_cached(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.get('/api/admin/stats/')
+        self.assertEqual(response.data['totalSubmissions'], 3)
+        self.assertEqual(response.data['lateSubmissions'], 1)
+        self.assertEqual(response.data['onTimeSubmissions'], 2)
+        self.assertEqual(response.data['ungradedSubmissions'], 3)
+        self.assertEqual(response.data['usersByRole'], {'student': 3, 'professor': 1, 'admin': 1})
+
+        with self.assertNumQueries(0):
+            self.client.get('/api/admin/stats/')
+
+    def test_rebuild_command_fixes_drift(self):
+        stats.increment({stats.COURSES: 5})
+        call_command('rebuild_stats', stdout=StringIO())
+        self.assertEqual(stats.get_counters()[stats.COURSES], 1)
+
+
+class ResponseCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        self.student = User.objects.create_user(username='student', role='student')
+        self.course = Course.objects.create(name='컴파일러', professor=self.professor)
+        self.course.students.add(self.student)
+
+    def test_repeated_reads_are_served_from_cache(self):
+        self.client.force_authenticate(self.student)
+        first = self.client.get('/api/courses/')
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/courses/')
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(first['ETag'], second['ETag'])
+
+    def test_if_none_match_returns_304(self):
+        self.client.force_authenticate(self.student)
+        etag = self.client.get('/api/notices/')['ETag']
+        response = self.client.get('/api/notices/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_last_modified_returns_304(self):
+        self.client.force_authenticate(self.student)
+        url = f'/api/courses/{self.course.id}/'
+        # 버전이 정확히 초 단위일 때만 If-Modified-Since로 304를 줍니다.
+        second = int(time.time())
+        cache.set_many({VERSION_PREFIX + course_namespace(self.course.id): second,
+                        VERSION_PREFIX + user_namespace(self.student.id): second - 5}, timeout=None)
+        last_modified = self.client.get(url)['Last-Modified']
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+
+    def test_if_modified_since_ignores_changes_within_the_same_second(self):
+        self.client.force_authenticate(self.student)
+        url = f'/api/courses/{self.course.id}/'
+        second = int(time.time())
+        cache.set(VERSION_PREFIX + course_namespace(self.course.id), second + 0.2, timeout=None)
+        last_modified = self.client.get(url)['Last-Modified']
+        # 같은 초 안에 과목이 다시 바뀌면 Last-Modified는 같지만 응답은 달라졌습니다.
+        cache.set(VERSION_PREFIX + course_namespace(self.course.id), second + 0.7, timeout=None)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Last-Modified'], last_modified)
+
+    def test_writes_invalidate_dependent_responses(self):
+        self.client.force_authenticate(self.student)
+        etag = self.client.get('/api/assignments/')['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Assignment.objects.create(course=self.course, title='새 과제', due_date=timezone.now())
+        response = self.client.get('/api/assignments/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.students.remove(self.student)
+        response = self.client.get('/api/assignments/')
+        self.assertEqual(response.data['results'], [])
+
+    def test_cache_is_per_user(self):
+        other = User.objects.create_user(username='other', role='student')
+        self.client.force_authenticate(self.student)
+        self.assertEqual(len(self.client.get('/api/courses/').data['results']), 1)
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.get('/api/courses/').data['results'], [])
+
+
+@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT, SUBMISSION_UPLOAD_TEMP_DIR=os.path.join(TEST_MEDIA_ROOT, 'tmp'),
+                   ACTIVITY_LOG_WRITER={'ASYNC': False}, TASK_QUEUE=IMMEDIATE_TASKS)
+class SubmissionUploadTests(APITestCase):
+    def setUp(self):
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        self.student = User.objects.create_user(username='student', role='student')
+        self.course = Course.objects.create(name='알고리즘', professor=self.professor)
+        self.assignment = Assignment.objects.create(
+            course=self.course, title='과제 1', due_date=timezone.now() + timedelta(days=1),
+            max_upload_size=1000, allowed_extensions='pdf, txt',
+        )
+        self.client.force_authenticate(self.student)
+        self.submit_url = f'/api/assignments/{self.assignment.id}/submit/'
+
+    def test_multipart_upload_records_size_and_hash(self):
+        content = b'hello world' * 10
+        response = self.client.post(self.submit_url, {'file': SimpleUploadedFile('report.txt', content)})
+        self.assertEqual(response.status_code, 201)
+
+        submission = Submission.objects.get()
+        self.assertEqual(submission.file_size, len(content))
+        self.assertEqual(submission.file_sha256, hashlib.sha256(content).hexdigest())
+        with submission.file.open('rb') as f:
+            self.assertEqual(f.read(), content)
+
+    def test_second_submission_is_rejected_even_when_racing(self):
+        self.assertEqual(self.client.post(self.submit_url, {'file': SimpleUploadedFile('a.txt', b'a')}).status_code, 201)
+        response = self.client.post(self.submit_url, {'file': SimpleUploadedFile('b.txt', b'b')})
+        self.assertEqual(response.status_code, 400)
+
+        # 앞선 확인을 동시에 통과한 요청도 unique_submission_per_student 제약으로 400이 됩니다.
+        with patch('core.views.Submission.objects.filter') as filter_submissions:
+            filter_submissions.return_value.exists.return_value = False
+            response = self.client.post(self.submit_url, {'file': SimpleUploadedFile('c.txt', b'c')})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('already submitted', str(response.data))
+        self.assertEqual(Submission.objects.count(), 1)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Submission.objects.create(assignment=self.assignment, student=self.student, file='d.txt')
+
+    def test_rejects_disallowed_type_and_oversized_file(self):
+        response = self.client.post(self.submit_url, {'file': SimpleUploadedFile('report.exe', b'x')})
+        self.assertEqual(response.status_code, 415)
+        response = self.client.post(self.submit_url, {'file': SimpleUploadedFile('report.pdf', b'x' * 1001)})
+        self.assertEqual(response.status_code, 413)
+        self.assertFalse(Submission.objects.exists())
+
+    def test_chunked_resumable_upload(self):
+        content = b'0123456789' * 60
+        response = self.client.post('/api/uploads/', {
+            'assignment': self.assignment.id, 'filename': 'report.pdf', 'size': len(content),
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        url = f"/api/uploads/{response.data['id']}/"
+
+        def put_chunk(start, end):
+            return self.client.generic('PUT', url, content[start:end + 1], content_type='application/octet-stream',
+                                       HTTP_CONTENT_RANGE=f'bytes {start}-{end}/{len(content)}')
+
+        self.assertEqual(put_chunk(0, 299).status_code, 200)
+        # 끊겼다가 이어 올리는 상황: 잘못된 위치는 409와 함께 현재 위치를 알려 줍니다.
+        conflict = put_chunk(400, 599)
+        self.assertEqual(conflict.status_code, 409)
+        self.assertEqual(conflict.data['received'], 300)
+        self.assertEqual(put_chunk(300, 599).data['received'], 600)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.submit_url, {'upload_id': response.data['id'], 'description': '조각 업로드'})
+        self.assertEqual(response.status_code, 201)
+        submission = Submission.objects.get()
+        self.assertEqual(submission.file_sha256, hashlib.sha256(content).hexdigest())
+        with submission.file.open('rb') as f:
+            self.assertEqual(f.read(), content)
+        self.assertFalse(UploadSession.objects.exists())
+
+    def test_missing_part_file_restarts_the_upload(self):
+        content = b'0123456789' * 60
+        response = self.client.post('/api/uploads/', {
+            'assignment': self.assignment.id, 'filename': 'report.pdf', 'size': len(content),
+        }, format='json')
+        session = UploadSession.objects.get(pk=response.data['id'])
+        url = f'/api/uploads/{session.pk}/'
+
+        def put_chunk(start, end):
+            return self.client.generic('PUT', url, content[start:end + 1], content_type='application/octet-stream',
+                                       HTTP_CONTENT_RANGE=f'bytes {start}-{end}/{len(content)}')
+
+        self.assertEqual(put_chunk(0, 299).status_code, 200)
+        # 서버의 임시 파일이 사라진 상황: 500 대신 409와 함께 처음부터 다시 보내라고 알려 줍니다.
+        os.remove(session_part_path(session))
+        conflict = put_chunk(300, 599)
+        self.assertEqual(conflict.status_code, 409)
+        self.assertEqual(conflict.data['received'], 0)
+        self.assertEqual(put_chunk(0, 299).data['received'], 300)
+        self.assertEqual(put_chunk(300, 599).data['received'], 600)
+        discard_session(session)
+
+    def test_upload_session_checks_limits_up_front(self):
+        response = self.client.post('/api/uploads/', {
+            'assignment': self.assignment.id, 'filename': 'report.pdf', 'size': 5000,
+        }, format='json')
+        self.assertEqual(response.status_code, 413)
+
+    def test_identical_files_are_stored_once(self):
+        content = b'same template' * 5
+        self.client.post(self.submit_url, {'file': SimpleUploadedFile('a.txt', content)})
+        other = User.objects.create_user(username='student2', role='student')
+        self.client.force_authenticate(other)
+        self.client.post(self.submit_url, {'file': SimpleUploadedFile('b.txt', content)})
+
+        first, second = Submission.objects.order_by('id')
+        self.assertEqual(first.file.name, second.file.name)
+        self.assertEqual((first.file_name, second.file_name), ('a.txt', 'b.txt'))
+        blob = FileBlob.objects.get()
+        self.assertEqual((blob.sha256, blob.ref_count), (hashlib.sha256(content).hexdigest(), 2))
+
+    def test_replaced_file_is_collected_after_grace_period(self):
+        self.client.post(self.submit_url, {'file': SimpleUploadedFile('v1.txt', b'first draft')})
+        submission = Submission.objects.get()
+        old_name = submission.file.name
+
+        response = self.client.patch(f'/api/submissions/{submission.id}/', {'file': SimpleUploadedFile('v2.txt', b'final')})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(FileBlob.objects.get(sha256=os.path.basename(old_name)).ref_count, 0)
+
+        storage = submission.file.storage
+        call_command('gc_submission_blobs', stdout=StringIO())
+        self.assertTrue(storage.exists(old_name))
+        FileBlob.objects.filter(ref_count=0).update(updated_at=timezone.now() - timedelta(hours=2))
+        call_command('gc_submission_blobs', stdout=StringIO())
+        self.assertFalse(storage.exists(old_name))
+        submission.refresh_from_db()
+        self.assertTrue(storage.exists(submission.file.name))
+        self.assertEqual(FileBlob.objects.get().ref_count, 1)
+
+    def test_gc_keeps_a_file_the_storage_just_reused(self):
+        self.client.post(self.submit_url, {'file': SimpleUploadedFile('v1.txt', b'first draft')})
+        submission = Submission.objects.get()
+        self.client.patch(f'/api/submissions/{submission.id}/', {'file': SimpleUploadedFile('v2.txt', b'final')})
+        FileBlob.objects.filter(ref_count=0).update(updated_at=timezone.now() - timedelta(hours=2))
+
+        # 저장소가 기존 파일을 재사용한 직후(참조 수를 올리기 전)에 가비지 컬렉션이 돌아도 파일을 지우지 않습니다.
+        storage = submission.file.storage
+        name = storage.save('v1.txt', ContentFile(b'first draft'))
+        call_command('gc_submission_blobs', stdout=StringIO())
+        self.assertTrue(storage.exists(name))
+
+        # 가비지 컬렉션이 먼저 지웠다면, 저장소는 파일을 다시 씁니다.
+        FileBlob.objects.filter(ref_count=0).update(updated_at=timezone.now() - timedelta(hours=2))
+        call_command('gc_submission_blobs', stdout=StringIO())
+        self.assertFalse(storage.exists(name))
+        self.assertEqual(storage.save('v1.txt', ContentFile(b'first draft')), name)
+        self.assertTrue(storage.exists(name))
+
+
+@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT, SUBMISSION_UPLOAD_TEMP_DIR=os.path.join(TEST_MEDIA_ROOT, 'tmp'),
+                   ACTIVITY_LOG_WRITER={'ASYNC': False}, SUBMISSION_X_ACCEL_REDIRECT_PREFIX='')
+class SubmissionDownloadTests(APITestCase):
+    content = b'0123456789abcdef' * 4
+
+    def setUp(self):
+        # 테스트 사이에 같은 id의 사용자가 다시 만들어지므로 캐시된 소속 정보를 지웁니다.
+        cache.clear()
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        self.student = User.objects.create_user(username='student', role='student')
+        self.other = User.objects.create_user(username='other', role='student')
+        course = Course.objects.create(name='운영체제', professor=self.professor)
+        assignment = Assignment.objects.create(course=course, title='과제 1', due_date=timezone.now() + timedelta(days=1))
+        self.client.force_authenticate(self.student)
+        self.client.post(f'/api/assignments/{assignment.id}/submit/', {'file': SimpleUploadedFile('report.txt', self.content)})
+        self.submission = Submission.objects.get()
+        self.url = f'/api/submissions/{self.submission.id}/file/'
+
+    def test_file_url_is_a_signed_download_link(self):
+        file_url = self.client.get('/api/my-submissions/').data['results'][0]['file_url']
+        self.client.force_authenticate(None)
+        response = self.client.get(file_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+        self.assertIn('report.txt', response['Content-Disposition'])
+
+        response = self.client.get(self.url + '?token=forged')
+        self.assertEqual(response.status_code, 401)
+
+    def test_only_owner_professor_and_admin_can_download(self):
+        self.client.force_authenticate(self.other)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+        self.client.force_authenticate(self.professor)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_range_request_streams_partial_content(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=16-31')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes 16-31/{len(self.content)}')
+        self.assertEqual(b''.join(response.streaming_content), self.content[16:32])
+        self.assertEqual(self.client.get(self.url, HTTP_RANGE='bytes=500-').status_code, 416)
+
+    @override_settings(SUBMISSION_X_ACCEL_REDIRECT_PREFIX='/protected-media/')
+    def test_delegates_to_proxy_with_x_accel_redirect(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Accel-Redirect'], '/protected-media/' + self.submission.file.name)
+        self.assertEqual(response.content, b'')
+
+    def test_export_streams_zip_with_manifest(self):
+        Submission.objects.update(is_late=True, grade=90, feedback='잘했어요')
+        self.client.force_authenticate(self.other)
+        url = f'/api/assignments/{self.submission.assignment_id}/submissions/export/'
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.force_authenticate(self.professor)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+        self.assertEqual(archive.namelist(), ['manifest.csv', 'student_LATE_report.txt'])
+        self.assertEqual(archive.read('student_LATE_report.txt'), self.content)
+        rows = list(csv.reader(io.StringIO(archive.read('manifest.csv').decode('utf-8-sig'))))
+        self.assertEqual(rows[1][0], 'student')
+        self.assertEqual(rows[1][5:], ['90', '잘했어요'])
+
+
+@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+class BulkGradingTests(APITestCase):
+    def setUp(self):
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        course = Course.objects.create(name='데이터베이스', professor=self.professor)
+        self.assignment = Assignment.objects.create(course=course, title='과제 1', due_date=timezone.now())
+        self.url = f'/api/assignments/{self.assignment.id}/grades/'
+        self.client.force_authenticate(self.professor)
+
+    def add_submissions(self, count, start=0):
+        students = [User.objects.create_user(username=f'student{i}', role='student') for i in range(start, start + count)]
+        return [Submission.objects.create(assignment=self.assignment, student=s, file='x.txt') for s in students]
+
+    def test_grades_in_constant_queries(self):
+        stats.rebuild_counters()
+        submissions = self.add_submissions(3)
+        grades = [{'submissionId': s.id, 'grade': 80 + i, 'feedback': '좋아요'} for i, s in enumerate(submissions)]
+        # 조회(잠금), bulk_update, 카운터, 알림, 활동 로그(+검색 색인) 등 학생 수와 무관한 9개
+        with self.assertNumQueries(9):
+            response = self.client.post(self.url, {'grades': grades}, format='json')
+        self.assertEqual(response.data['updated'], 3)
+
+        submissions += self.add_submissions(10, start=3)
+        grades = [{'submissionId': s.id, 'grade': 70} for s in submissions]
+        with self.assertNumQueries(9):
+            self.client.post(self.url, {'grades': grades}, format='json')
+
+        self.assertEqual(set(Submission.objects.values_list('grade', flat=True)), {70})
+        self.assertEqual(Submission.objects.filter(feedback='좋아요').count(), 3)
+        self.assertEqual(Notification.objects.count(), 16)
+        self.assertEqual(ActivityLog.objects.filter(action_type='GRADED_SUBMISSION').count(), 16)
+        self.assertEqual(stats.get_counters()[stats.SUBMISSIONS_UNGRADED], 0)
+
+    def test_csv_upload_by_username(self):
+        self.add_submissions(2)
+        upload = SimpleUploadedFile('grades.csv', 'username,grade,feedback\nstudent0,95,훌륭함\nstudent1,,\n'.encode('utf-8-sig'))
+        response = self.client.post(self.url, {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(dict(Submission.objects.values_list('student__username', 'grade')), {'student0': 95, 'student1': None})
+
+    def test_rejects_foreign_submissions_without_partial_updates(self):
+        own, = self.add_submissions(1)
+        other_course = Course.objects.create(name='다른 과목', professor=self.professor)
+        other_assignment = Assignment.objects.create(course=other_course, title='다른 과제', due_date=timezone.now())
+        foreign = Submission.objects.create(assignment=other_assignment, student=own.student, file='y.txt')
+
+        response = self.client.post(self.url, {'grades': [
+            {'submissionId': own.id, 'grade': 90}, {'submissionId': foreign.id, 'grade': 90},
+        ]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Submission.objects.filter(grade__isnull=False).exists())
+
+        self.client.force_authenticate(User.objects.create_user(username='prof2', role='professor'))
+        response = self.client.post(self.url, {'grades': [{'submissionId': own.id, 'grade': 90}]}, format='json')
+        self.assertEqual(response.status_code, 403)
+
+
+@override_settings(ACTIVITY_LOG_WRITER={'ASYNC': False}, TASK_QUEUE=IMMEDIATE_TASKS)
+class RealtimeNotificationTests(APITestCase):
+    def setUp(self):
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        self.student = User.objects.create_user(username='student', role='student')
+        course = Course.objects.create(name='네트워크', professor=self.professor)
+        assignment = Assignment.objects.create(course=course, title='과제 1', due_date=timezone.now())
+        self.submission = Submission.objects.create(assignment=assignment, student=self.student, file='x.txt')
+
+    def stream_url(self, user):
+        self.client.force_authenticate(user)
+        token = self.client.post('/api/notifications/stream-token/').data['token']
+        return f'/api/notifications/stream/?token={token}'
+
+    def change_role(self, user, role):
+        # 역할이 바뀌면(core/signals.py) 그 전에 받은 토큰은 모두 폐기됩니다.
+        with self.captureOnCommitCallbacks(execute=True):
+            user.role = role
+            user.save()
+
+    def grade(self):
+        self.client.force_authenticate(self.professor)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(f'/api/submissions/{self.submission.id}/grade/', {'grade': 100}, format='json')
+
+    async def test_graded_notification_is_pushed_over_sse(self):
+        url = await sync_to_async(self.stream_url)(self.student)
+        response = await self.async_client.get(url)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        events = aiter(response.streaming_content)
+        self.assertEqual(await anext(events), b'retry: 5000\n\n')
+
+        await sync_to_async(self.grade)()
+        event = (await asyncio.wait_for(anext(events), 1)).decode()
+        self.assertTrue(event.startswith('event: notification\n'))
+        payload = json.loads(event.split('data: ', 1)[1])
+        self.assertEqual(payload['id'], (await Notification.objects.aget()).id)
+        self.assertIn('isRead', payload)
+        await events.aclose()
+
+    def test_bulk_created_notifications_are_published_with_ids(self):
+        # MySQL처럼 bulk_create가 id를 채우지 않아도, 클라이언트가 읽음 처리할 수 있도록 id와 함께 보냅니다.
+        with patch.object(type(connection.features), 'can_return_rows_from_bulk_insert', False):
+            notifications = Notification.objects.bulk_create(
+                [Notification(recipient=self.student, message=f'알림 {i}') for i in range(3)])
+        self.assertIsNone(notifications[0].pk)
+        with patch('core.realtime.publish_notifications') as publish, self.captureOnCommitCallbacks(execute=True):
+            publish_notifications_on_commit(notifications)
+        published = publish.call_args.args[0]
+        self.assertEqual([n.pk for n in published], list(Notification.objects.order_by('id').values_list('id', flat=True)))
+
+    async def test_stream_rejects_invalid_token(self):
+        response = await self.async_client.get('/api/notifications/stream/?token=forged')
+        self.assertEqual(response.status_code, 401)
+
+    async def test_stream_rejects_token_of_revoked_user(self):
+        url = await sync_to_async(self.stream_url)(self.student)
+        await sync_to_async(self.change_role)(self.student, 'professor')
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 401)
+
+
+class AsyncReadViewTests(APITestCase):
+    PATHS = ['/api/courses/?expand=students', '/api/assignments/?ordering=-due_date',
+             '/api/my-submissions/?page_size=1', '/api/notifications/?include_total=true']
+
+    def setUp(self):
+        cache.clear()
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        self.student = User.objects.create_user(username='student', role='student')
+        course = Course.objects.create(name='운영체제', professor=self.professor)
+        course.students.add(self.student)
+        for i in range(2):
+            assignment = Assignment.objects.create(course=course, title=f'과제 {i}', due_date=timezone.now())
+            Submission.objects.create(assignment=assignment, student=self.student, file=f'{i}.txt')
+        Notification.objects.create(recipient=self.student, message='새 알림')
+
+    def bearer(self, user):
+        return {'Authorization': f'Bearer {ClaimsTokenObtainPairSerializer.get_token(user).access_token}'}
+
+    def fetch(self, headers):
+        """경로별 (응답, 쿼리 수)입니다. 비동기 View는 AsyncClient로, 같은 스레드의 DB 연결에서 조회합니다."""
+        cache.clear()
+        get = async_to_sync(self.async_client.get)
+        responses = []
+        for path in self.PATHS:
+            with CaptureQueriesContext(connection) as queries:
+                responses.append((get(path, headers=headers), len(queries)))
+        return responses
+
+    def test_async_views_match_sync_views(self):
+        headers = self.bearer(self.student)
+        expected = self.fetch(headers)
+        with override_settings(ROOT_URLCONF='backend.asgi_urls'):
+            self.assertTrue(resolve('/api/notifications/').func.view_class.view_is_async)
+            actual = self.fetch(headers)
+            for path, (sync_response, sync_queries), (response, queries) in zip(self.PATHS, expected, actual):
+                self.assertEqual(response.status_code, 200, path)
+                self.assertEqual(response.json(), sync_response.json(), path)
+                self.assertEqual(queries, sync_queries, path)
+
+            # 응답 캐시와 ETag도 동기 View와 같이 동작합니다.
+            etag = actual[0][0]['ETag']
+            response = async_to_sync(self.async_client.get)(self.PATHS[0], headers={**headers, 'If-None-Match': etag})
+            self.assertEqual(response.status_code, 304)
+
+    @override_settings(ROOT_URLCONF='backend.asgi_urls')
+    async def test_writes_and_errors_go_through_drf(self):
+        response = await self.async_client.get('/api/notifications/')
+        self.assertEqual(response.status_code, 401)
+        response = await self.async_client.get('/api/my-submissions/?status=unknown', headers=self.bearer(self.student))
+        self.assertEqual(response.status_code, 400)
+
+        # 생성은 동기 View가 처리합니다.
+        response = await self.async_client.post('/api/courses/', {'name': '컴파일러'}, content_type='application/json',
+                                                headers=self.bearer(self.professor))
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(await Course.objects.filter(name='컴파일러', professor=self.professor).aexists())
+        response = await self.async_client.post('/api/courses/', {'name': '컴파일러'}, content_type='application/json',
+                                                headers=self.bearer(self.student))
+        self.assertEqual(response.status_code, 403)
+
+
+class NotificationInboxTests(APITestCase):
+    def setUp(self):
+        self.student = User.objects.create_user(username='student', role='student')
+        self.other = User.objects.create_user(username='other', role='student')
+        Notification.objects.bulk_create([Notification(recipient=self.student, message=str(i)) for i in range(5)])
+        Notification.objects.create(recipient=self.other, message='other')
+        self.client.force_authenticate(self.student)
+
+    def test_unread_count_and_bulk_mark_read(self):
+        ids = list(Notification.objects.filter(recipient=self.student).order_by('id').values_list('id', flat=True))
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get('/api/notifications/unread-count/').data['unread'], 5)
+
+        with self.assertNumQueries(1):
+            response = self.client.post('/api/notifications/read/', {'upToId': ids[2]}, format='json')
+        self.assertEqual(response.data['updated'], 3)
+        self.assertEqual(self.client.get('/api/notifications/unread-count/').data['unread'], 2)
+
+        self.client.post('/api/notifications/read/', {}, format='json')
+        self.assertEqual(self.client.get('/api/notifications/unread-count/').data['unread'], 0)
+        self.assertFalse(Notification.objects.get(recipient=self.other).is_read)
+
+    def test_mark_single_read_is_one_update(self):
+        notification = Notification.objects.filter(recipient=self.student).first()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.post(f'/api/notifications/{notification.id}/read/').status_code, 204)
+        other = Notification.objects.get(recipient=self.other)
+        self.assertEqual(self.client.post(f'/api/notifications/{other.id}/read/').status_code, 404)
+
+    def test_prune_deletes_only_old_read_notifications(self):
+        old = timezone.now() - timedelta(days=100)
+        Notification.objects.filter(message__in=['0', '1']).update(is_read=True, created_at=old)
+        Notification.objects.filter(message='2').update(created_at=old)
+        Notification.objects.filter(message='3').update(is_read=True)
+        call_command('prune_notifications', '--days', '90', '--batch-size', '1', stdout=StringIO())
+        self.assertEqual(sorted(Notification.objects.values_list('message', flat=True)), ['2', '3', '4', 'other'])
+
+
+class ActivityLogArchiveTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', role='admin')
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        now = timezone.now()
+        ActivityLog.objects.bulk_create([
+            ActivityLog(actor=self.admin, action_type='LOGIN', created_at=now - timedelta(days=400)),
+            ActivityLog(actor=self.professor, action_type='GRADED_SUBMISSION', created_at=now - timedelta(days=300)),
+            ActivityLog(actor=self.professor, action_type='GRADED_SUBMISSION', created_at=now - timedelta(days=2)),
+            ActivityLog(actor=self.professor, action_type='CREATED_COURSE', created_at=now - timedelta(hours=1)),
+        ])
+        self.client.force_authenticate(self.admin)
+
+    def test_filters_by_time_range_actor_and_action_type(self):
+        since = (timezone.localdate() - timedelta(days=7)).isoformat()
+        response = self.client.get('/api/admin/logs/', {'since': since, 'actor': 'prof'})
+        self.assertEqual([log['action_type'] for log in response.data['results']], ['CREATED_COURSE', 'GRADED_SUBMISSION'])
+
+        response = self.client.get('/api/admin/logs/', {'action_type': 'GRADED_SUBMISSION', 'actor': self.professor.id})
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertEqual(self.client.get('/api/admin/logs/', {'until': 'yesterday'}).status_code, 400)
+
+    def test_archive_exports_cold_months_and_drops_them(self):
+        output_dir = tempfile.mkdtemp(prefix='lms-test-archive-')
+        call_command('archive_activity_logs', '--hot-months', '6', '--output-dir', output_dir, stdout=StringIO())
+
+        self.assertEqual(ActivityLog.objects.count(), 2)
+        archives = list(ActivityLogArchive.objects.order_by('month'))
+        self.assertEqual([a.rows for a in archives], [1, 1])
+        with gzip.open(archives[0].path, 'rt', encoding='utf-8') as f:
+            record = json.loads(f.readline())
+        self.assertEqual((record['actor_username'], record['action_type']), ('admin', 'LOGIN'))
+        results = self.client.get('/api/admin/logs/archives/').data['results']
+        self.assertEqual({r['file_name'] for r in results}, {os.path.basename(a.path) for a in archives})
+        self.assertNotIn('path', results[0])
+
+
+@override_settings(ACTIVITY_LOG_WRITER={'ASYNC': False})
+class SearchTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', role='admin')
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        self.student = User.objects.create_user(username='student', role='student')
+        course = Course.objects.create(name='데이터베이스', professor=self.professor)
+        course.students.add(self.student)
+        other = Course.objects.create(name='운영체제', professor=self.professor)
+        due = timezone.now()
+        self.mine = Assignment.objects.create(course=course, title='정규화 과제', description='3NF로 정규화하세요.', due_date=due)
+        Assignment.objects.create(course=other, title='스케줄링 과제', description='정규화와 무관', due_date=due)
+        self.body_match = Notice.objects.create(title='안내', content='기말고사 범위에 정규화가 포함됩니다.', author=self.admin)
+        self.title_match = Notice.objects.create(title='정규화 보충 수업', content='금요일 3시', author=self.admin)
+        ActivityLog.objects.create(actor=self.professor, action_type='CREATED_ASSIGNMENT', details="'정규화 과제' 생성")
+
+    def test_ranks_title_matches_and_limits_to_visible_documents(self):
+        self.client.force_authenticate(self.student)
+        response = self.client.get('/api/search/', {'q': '정규화'})
+        results = [(r['type'], r['id']) for r in response.data['results']]
+        self.assertEqual(response.data['count'], 3)
+        # 제목 일치가 본문 일치보다 앞에 오고, 수강하지 않는 과목의 과제와 로그는 보이지 않습니다.
+        self.assertLess(results.index(('notice', self.title_match.id)), results.index(('notice', self.body_match.id)))
+        self.assertIn(('assignment', self.mine.id), results)
+        self.assertIn('정규화', response.data['results'][0]['snippet'])
+
+        response = self.client.get('/api/search/', {'q': '정규화', 'page_size': 2})
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIn('page=2', response.data['next'])
+        self.assertEqual(self.client.get('/api/search/', {'q': '정규화 보충'}).data['count'], 1)
+
+    def test_logs_are_admin_only_and_index_follows_changes(self):
+        self.client.force_authenticate(self.admin)
+        self.assertEqual(self.client.get('/api/search/', {'q': '정규화', 'type': 'log'}).data['count'], 1)
+        self.assertEqual(self.client.get('/api/search/', {'q': '정규화', 'type': 'memo'}).status_code, 400)
+
+        self.title_match.title = '보강 안내'
+        self.title_match.save()
+        self.body_match.delete()
+        self.assertEqual(self.client.get('/api/search/', {'q': '정규화', 'type': 'notice'}).data['count'], 0)
+
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(self.client.get('/api/search/', {'q': '보강'}).data['count'], 1)
+
+
+@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+class ListFilterTests(APITestCase):
+    def setUp(self):
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        self.course = Course.objects.create(name='데이터베이스', professor=self.professor)
+        now = timezone.now()
+        self.assignment = Assignment.objects.create(course=self.course, title='B 과제', due_date=now, allow_late=True)
+        Assignment.objects.create(course=self.course, title='A 과제', due_date=now + timedelta(days=7), allow_late=False)
+        self.submissions = []
+        for i, (is_late, grade) in enumerate([(False, 90), (True, None), (False, None)]):
+            student = User.objects.create_user(username=f'student{i}', role='student')
+            self.course.students.add(student)
+            self.submissions.append(Submission.objects.create(
+                assignment=self.assignment, student=student, file='x.txt', file_size=10 * (i + 1),
+                is_late=is_late, grade=grade,
+            ))
+        self.client.force_authenticate(self.professor)
+
+    def get_results(self, url, params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data['results']
+
+    def test_filters_and_ordering(self):
+        url = f'/api/assignments/{self.assignment.id}/submissions/'
+        ids = lambda results: [r['id'] for r in results]
+        self.assertEqual(ids(self.get_results(url, {'status': 'late'})), [self.submissions[1].id])
+        self.assertEqual(ids(self.get_results(url, {'graded': 'false', 'is_late': 'false'})), [self.submissions[2].id])
+        self.assertEqual(ids(self.get_results(url, {'ordering': 'file_size'})), [s.id for s in self.submissions])
+        # 크기를 모르는 예전 제출물도 0으로 정렬되어, 다음 페이지 커서가 깨지지 않습니다.
+        Submission.objects.filter(pk=self.submissions[0].pk).update(file_size=0)
+        first_page = self.client.get(url, {'ordering': 'file_size', 'page_size': 1}).data
+        self.assertEqual(ids(first_page['results']), [self.submissions[0].id])
+        self.assertEqual(ids(self.client.get(first_page['next']).data['results']), [self.submissions[1].id])
+        self.assertEqual(len(self.get_results(url, {'submitted_since': '2000-01-01', 'submitted_until': '2000-01-02'})), 0)
+        self.assertEqual(self.client.get(url, {'status': 'lost'}).status_code, 400)
+
+        titles = [a['title'] for a in self.get_results('/api/assignments/', {'ordering': 'title'})]
+        self.assertEqual(titles, ['A 과제', 'B 과제'])
+        self.assertEqual(len(self.get_results('/api/assignments/', {'allow_late': 'false'})), 1)
+        self.assertEqual(len(self.get_results('/api/assignments/', {'course_id': self.course.id})), 2)
+        self.assertEqual(self.client.get('/api/assignments/', {'course_id': 'abc'}).status_code, 400)
+
+    def test_sparse_fieldsets(self):
+        course = self.get_results('/api/courses/', {})[0]
+        self.assertEqual(course['student_count'], 3)
+        self.assertNotIn('students', course)
+        self.assertEqual(len(self.get_results('/api/courses/', {'expand': 'students'})[0]['students']), 3)
+        self.assertEqual(len(self.client.get(f'/api/courses/{self.course.id}/').data['students']), 3)
+
+        url = f'/api/assignments/{self.assignment.id}/submissions/'
+        results = self.get_results(url, {'fields': 'id,studentUsername,grade'})
+        self.assertEqual(set(results[0]), {'id', 'studentUsername', 'grade'})
+        self.assertEqual(self.client.get(url, {'fields': 'id,password'}).status_code, 400)
+
+
+@override_settings(ACTIVITY_LOG_WRITER={'ASYNC': False})
+class GradebookTests(APITestCase):
+    def setUp(self):
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        self.course = Course.objects.create(name='데이터베이스', professor=self.professor)
+        now = timezone.now()
+        self.first = Assignment.objects.create(course=self.course, title='과제 1', due_date=now)
+        self.second = Assignment.objects.create(course=self.course, title='과제 2', due_date=now + timedelta(days=7))
+        self.url = f'/api/courses/{self.course.id}/gradebook/'
+        self.client.force_authenticate(self.professor)
+        cache.clear()
+
+    def add_student(self, username, grade=None, is_late=False):
+        student = User.objects.create_user(username=username, role='student')
+        self.course.students.add(student)
+        if grade is not False:
+            Submission.objects.create(assignment=self.first, student=student, file='x.txt', grade=grade, is_late=is_late)
+        return student
+
+    def test_matrix_and_assignment_statistics(self):
+        for username, grade in [('a', 70), ('b', 80), ('c', 95), ('d', 100)]:
+            self.add_student(username, grade)
+        self.add_student('e', None, is_late=True)
+        self.add_student('f', False)
+
+        data = self.client.get(self.url).data
+        first, second = data['assignments']
+        self.assertEqual((first['submitted'], first['graded'], first['late']), (5, 4, 1))
+        self.assertEqual(first['submission_rate'], round(5 / 6, 4))
+        self.assertEqual((first['mean'], first['median']), (86.25, 87.5))
+        self.assertEqual((second['submitted'], second['median']), (0, None))
+
+        rows = {row['username']: row for row in data['students']}
+        self.assertEqual(rows['a']['cells'][0]['grade'], 70)
+        self.assertEqual(rows['e']['cells'][0]['status'], '지연 제출')
+        self.assertEqual(rows['f']['cells'][0], {'submission_id': None, 'grade': None, 'is_late': False, 'status': '제출 전'})
+
+    def test_constant_queries_and_invalidation(self):
+        submission_student = self.add_student('a', 60)
+        cache.clear()
+        # 과목 조회 + 과제, 수강생, 셀, 과제별 집계, 중앙값
+        with self.assertNumQueries(6):
+            self.client.get(self.url)
+        for i in range(5):
+            self.add_student(f's{i}', 90)
+        cache.clear()
+        with self.assertNumQueries(6):
+            self.client.get(self.url)
+
+        self.assertEqual(self.client.get(self.url).data['assignments'][0]['median'], 90)
+        submission = Submission.objects.get(student=submission_student)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/api/assignments/{self.first.id}/grades/',
+                             {'grades': [{'submissionId': submission.id, 'grade': 100}]}, format='json')
+        self.assertEqual(self.client.get(self.url).data['assignments'][0]['mean'], 91.67)
+
+        outsider = User.objects.create_user(username='other', role='professor')
+        self.client.force_authenticate(outsider)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+class MembershipPermissionTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        self.other = User.objects.create_user(username='other', role='professor')
+        self.student = User.objects.create_user(username='student', role='student')
+        self.course = Course.objects.create(name='컴퓨터구조', professor=self.professor)
+        self.assignment = Assignment.objects.create(course=self.course, title='과제 1',
+                                                    due_date=timezone.now() + timedelta(days=1))
+        self.submission = Submission.objects.create(assignment=self.assignment, student=self.student, file='x.txt')
+
+    def test_cached_membership_skips_ownership_queries(self):
+        self.client.force_authenticate(self.professor)
+        url = f'/api/assignments/{self.assignment.id}/submissions/'
+        self.client.get(url)
+        # 소속 정보가 캐시되어 있으면 제출물 페이지 쿼리만 남습니다.
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        self.client.force_authenticate(self.other)
+        self.assertEqual(self.client.get(url).data['results'], [])
+        response = self.client.patch(f'/api/submissions/{self.submission.id}/grade/', {'grade': 90}, format='json')
+        self.assertEqual(response.status_code, 403)
+
+    def test_membership_refreshes_after_enrollment(self):
+        self.client.force_authenticate(self.student)
+        url = f'/api/courses/{self.course.id}/'
+        self.assertEqual(self.client.get(url).status_code, 404)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.students.add(self.student)
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+
+class ClaimsAuthenticationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.student = User.objects.create_user(username='student', role='student', password='pw-12345')
+        Notification.objects.create(recipient=self.student, message='알림')
+
+    def login(self):
+        response = self.client.post('/api/auth/login/', {'username': 'student', 'password': 'pw-12345'}, format='json')
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        return response.data
+
+    def test_access_token_carries_claims_so_requests_skip_the_user_lookup(self):
+        self.login()
+        self.assertEqual(self.client.get('/api/notifications/').status_code, 200)
+        # 알림 페이지 쿼리만 실행합니다. (User 조회 없음, 폐기 목록은 캐시)
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/notifications/')
+        self.assertEqual(len(response.data['results']), 1)
+        # 토큰에 없는 필드는 처음 접근할 때 불러옵니다.
+        self.assertEqual(self.client.get('/api/auth/me/').data['username'], 'student')
+
+    def test_logout_revokes_access_and_refresh_tokens(self):
+        tokens = self.login()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/auth/logout/', {'refresh': tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.client.get('/api/notifications/').status_code, 401)
+        self.client.credentials()
+        response = self.client.post('/api/auth/token/refresh/', {'refresh': tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, 401)
+
+    def test_deactivated_or_deleted_user_tokens_are_rejected(self):
+        self.login()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.student.is_active = False
+            self.student.save()
+        self.assertEqual(self.client.get('/api/notifications/').status_code, 401)
+
+        self.student.is_active = True
+        self.student.save()
+        self.login()
+        self.assertEqual(self.client.get('/api/notifications/').status_code, 200)
+        # 지운 사용자의 토큰도 클레임만으로 인증되지 않아야 합니다.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.student.delete()
+        self.assertEqual(self.client.get('/api/notifications/').status_code, 401)
+
+    def test_role_change_revokes_existing_tokens(self):
+        self.login()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.student.role = 'professor'
+            self.student.save()
+        self.assertEqual(self.client.get('/api/notifications/').status_code, 401)
+
+    def test_token_issued_in_the_same_second_as_revocation_is_accepted(self):
+        # 역할 변경 등으로 폐기된 바로 그 초에 다시 로그인해도 새 토큰은 유효합니다. (iat는 초 단위)
+        now = timezone.now()
+        revoked_at = now.replace(microsecond=500000)
+        RevokedToken.objects.create(user=self.student, jti='', revoked_at=revoked_at,
+                                    expires_at=revoked_at + timedelta(days=1))
+        with patch('rest_framework_simplejwt.tokens.aware_utcnow', return_value=now.replace(microsecond=999999)):
+            self.login()
+        self.assertEqual(self.client.get('/api/notifications/').status_code, 200)
+        # 같은 초라도 폐기 전에 발급된 토큰은 거부됩니다.
+        with patch('rest_framework_simplejwt.tokens.aware_utcnow', return_value=now.replace(microsecond=100000)):
+            self.login()
+        self.assertEqual(self.client.get('/api/notifications/').status_code, 401)
+
+
+class EnrollmentTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.professor = User.objects.create_user(username='prof', role='professor')
+        self.course = Course.objects.create(name='자료구조', professor=self.professor, join_code='JOINME')
+        self.students = User.objects.bulk_create([User(username=f'student{i}', role='student') for i in range(50)])
+        self.client.force_authenticate(self.professor)
+
+    def test_incremental_add_and_remove(self):
+        url = f'/api/courses/{self.course.id}/students/'
+        ids = [s.id for s in self.students[:3]]
+        response = self.client.post(url + 'add/', {'student_ids': ids + [self.professor.id]}, format='json')
+        self.assertEqual((response.data['added'], response.data['student_count']), (3, 3))
+        self.assertEqual(response.data['unknown'], [str(self.professor.id)])
+        # 이미 등록된 학생은 건너뛰고, 응답에는 명단 대신 수만 담습니다.
+        response = self.client.post(url + 'add/', {'usernames': ['student0', 'student3']}, format='json')
+        self.assertEqual((response.data['added'], response.data['student_count']), (1, 4))
+        self.assertNotIn('students', response.data)
+
+        response = self.client.post(url + 'remove/', {'student_ids': [ids[0]]}, format='json')
+        self.assertEqual((response.data['removed'], response.data['student_count']), (1, 3))
+        response = self.client.post(url, {'student_ids': ids}, format='json')
+        self.assertEqual((response.data['added'], response.data['removed']), (1, 1))
+
+        self.client.force_authenticate(User.objects.create_user(username='prof2', role='professor'))
+        self.assertEqual(self.client.post(url + 'add/', {'student_ids': ids}, format='json').status_code, 403)
+
+    def test_csv_import_in_constant_queries(self):
+        url = f'/api/courses/{self.course.id}/students/import/'
+        self.course.students.add(self.students[0])
+        rows = ''.join(f'{s.username}\n' for s in self.students[1:]) + 'nobody\n'
+        upload = SimpleUploadedFile('roster.csv', f'username\n{rows}'.encode('utf-8-sig'))
+        # 과목, 학생 조회, 기존 수강생, bulk insert, delete, 수강생 수 (+세이브포인트 2)
+        with self.assertNumQueries(8):
+            response = self.client.post(url, {'file': upload, 'replace': 'true'}, format='multipart')
+        self.assertEqual((response.data['added'], response.data['removed']), (49, 1))
+        self.assertEqual(response.data['unknown'], ['nobody'])
+        self.assertEqual(self.course.students.count(), 49)
+
+    def test_professor_course_list_refreshes_after_enrollment(self):
+        self.assertEqual(self.client.get('/api/courses/').data['results'][0]['student_count'], 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.students.add(self.students[0])
+        self.assertEqual(self.client.get('/api/courses/').data['results'][0]['student_count'], 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/api/courses/{self.course.id}/students/add/', {'student_ids': [self.students[1].id]},
+                             format='json')
+        response = self.client.get('/api/courses/?expand=students')
+        self.assertEqual(len(response.data['results'][0]['students']), 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.students[2].courses.add(self.course)
+        self.assertEqual(self.client.get('/api/courses/').data['results'][0]['student_count'], 3)
+
+    def test_join_with_code_is_idempotent(self):
+        student = self.students[0]
+        self.client.force_authenticate(student)
+        with self.captureOnCommitCallbacks(execute=True):
+            first = self.client.post('/api/courses/join/', {'join_code': 'JOINME'}, format='json')
+        second = self.client.post('/api/courses/join/', {'join_code': 'JOINME'}, format='json')
+        self.assertEqual((first.status_code, second.status_code), (200, 200))
+        self.assertIn('already', second.data['detail'])
+        self.assertEqual(list(self.course.students.all()), [student])
+        # 등록 후에는 소속 정보가 바로 갱신되어 과목을 볼 수 있습니다.
+        self.assertEqual(self.client.get(f'/api/courses/{self.course.id}/').status_code, 200)
+
+
+TASK_CALLS = []
+
+
+@task(name='tests.record', max_retries=1)
+def record_task(value, fail=False):
+    TASK_CALLS.append(value)
+    if fail:
+        raise ValueError(value)
+
+
+@override_settings(TASK_QUEUE={'BACKEND': 'core.task_queue.DatabaseBackend', 'RETRY_DELAY_SECONDS': 0})
+class TaskQueueTests(APITestCase):
+    def setUp(self):
+        TASK_CALLS.clear()
+
+    def test_database_backend_runs_by_priority_and_retries(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            record_task.enqueue_with(args=['low'], priority=9)
+            record_task.enqueue_with(args=['high'], priority=0)
+            record_task.enqueue_with(args=['later'], delay=3600)
+            record_task.enqueue('broken', fail=True)
+        self.assertEqual(BackgroundTask.objects.count(), 4)
+        with self.assertLogs('core.task_queue', 'WARNING'):
+            self.assertEqual(DatabaseBackend().run_pending(), 4)
+
+        # 실패한 작업은 한 번 더 시도한 뒤(max_retries=1) failed로 남고, 예약된 작업은 아직 실행되지 않습니다.
+        # 바로 다시 시도하는(RETRY_DELAY_SECONDS=0) 작업도 우선순위 순서를 따릅니다.
+        self.assertEqual(TASK_CALLS, ['high', 'broken', 'broken', 'low'])
+        failed = BackgroundTask.objects.get(status=BackgroundTask.FAILED)
+        self.assertEqual((failed.attempts, failed.args), (2, ['broken']))
+        self.assertIn('ValueError', failed.last_error)
+        self.assertEqual(BackgroundTask.objects.get(status=BackgroundTask.QUEUED).args, ['later'])
+
+    @override_settings(TASK_QUEUE={'BACKEND': 'core.task_queue.DatabaseBackend', 'SCHEDULE': {
+        'reminders': {'task': 'core.send_deadline_reminders', 'every': 3600, 'kwargs': {'hours': 24}},
+    }})
+    def test_worker_runs_scheduled_deadline_reminders_once_per_period(self):
+        cache.clear()
+        professor = User.objects.create_user(username='prof', role='professor')
+        course = Course.objects.create(name='운영체제', professor=professor)
+        course.students.add(User.objects.create_user(username='student', role='student'))
+        Assignment.objects.create(course=course, title='과제 1', due_date=timezone.now() + timedelta(hours=3))
+
+        # 테스트는 트랜잭션 안에서 돌므로 첫 실행에서 넣은 작업은 커밋(블록 종료) 후에 저장됩니다.
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('run_task_worker', '--once', stdout=StringIO())
+        output = StringIO()
+        call_command('run_task_worker', '--once', stdout=output)
+        self.assertIn('Scheduled 0 periodic tasks, ran 1 tasks', output.getvalue())
+        self.assertEqual(Notification.objects.filter(kind='deadline_24h').count(), 1)
+
+    @override_settings(TASK_QUEUE={'BACKEND': 'core.task_queue.ThreadPoolBackend', 'POLL_INTERVAL_SECONDS': 0.05,
+                                   'SCHEDULE': {'record': {'task': 'tests.record', 'every': 3600, 'args': ['tick']}}})
+    def test_worker_once_waits_for_thread_pool_tasks(self):
+        cache.clear()
+        output = StringIO()
+        # 관리 명령은 트랜잭션 밖(autocommit)에서 실행되므로 작업을 바로 큐에 넣습니다.
+        with patch('core.task_queue.transaction.on_commit', side_effect=lambda callback: callback()):
+            call_command('run_task_worker', '--once', stdout=output)
+        self.assertIn('Scheduled 1 periodic tasks, ran 1 tasks', output.getvalue())
+        self.assertEqual(TASK_CALLS, ['tick'])
+
+    @override_settings(TASK_QUEUE={'BACKEND': 'core.task_queue.ThreadPoolBackend'})
+    def test_enqueue_flag_requires_database_backend(self):
+        with self.assertRaises(CommandError):
+            call_command('send_deadline_reminders', '--enqueue', stdout=StringIO())
+
+    def test_thread_pool_backend_runs_tasks_outside_the_request(self):
+        backend = ThreadPoolBackend(workers=1, poll_interval_seconds=0.05)
+        deadline = time.time() + 5
+        with self.assertLogs('core.task_queue', 'WARNING'):
+            for value, kwargs in [('retry', {'fail': True}), ('done', {})]:
+                backend.enqueue({'name': 'tests.record', 'args': [value], 'kwargs': kwargs, 'priority': 5,
+                                 'run_at': 0, 'attempts': 0})
+            while (TASK_CALLS.count('retry') < 2 or 'done' not in TASK_CALLS) and time.time() < deadline:
+                time.sleep(0.01)
+        self.assertEqual(sorted(TASK_CALLS), ['done', 'retry', 'retry'])
+
+
+@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+class BenchmarkTests(APITestCase):
+    def test_seed_works_when_bulk_create_does_not_set_primary_keys(self):
+        # MySQL처럼 bulk_create가 pk를 채우지 않는 DB에서도 수강/제출물이 올바른 행을 가리켜야 합니다.
+        with patch.object(type(connection.features), 'can_return_rows_from_bulk_insert', False):
+            call_command('seed_data', '--professors', '2', '--students', '10', '--courses', '3',
+                         '--courses-per-student', '2', '--assignments-per-course', '2', '--notices', '1',
+                         '--notifications-per-student', '1', '--logs', '5', '--files', '1', '--submission-rate', '1',
+                         '--prefix', 'nopk', stdout=StringIO())
+        self.assertEqual(Course.students.through.objects.count(), 20)
+        self.assertEqual(Submission.objects.count(), 40)
+        self.assertFalse(Submission.objects.exclude(student__in=Course.students.through.objects.filter(
+            course=OuterRef('assignment__course')).values('user')).exists())
+
+    def test_seed_and_benchmark_write_comparable_results(self):
+        call_command('seed_data', '--professors', '2', '--students', '20', '--courses', '3', '--courses-per-student',
+                     '2', '--assignments-per-course', '2', '--notices', '3', '--notifications-per-student', '2',
+                     '--logs', '30', '--files', '3', '--prefix', 'bench', stdout=StringIO())
+        self.assertEqual(Course.students.through.objects.count(), 40)
+        self.assertEqual(FileBlob.objects.filter(ref_count__gt=0).count(),
+                         len(set(Submission.objects.values_list('file', flat=True))))
+        self.assertEqual(stats.get_counters()[stats.SUBMISSIONS], Submission.objects.count())
+
+        output = os.path.join(tempfile.mkdtemp(prefix='lms-test-bench-'), 'result.json')
+        call_command('benchmark_api', '--requests', '3', '--warmup', '1', '--cold-cache', '--output', output,
+                     stdout=StringIO())
+        with open(output, encoding='utf-8') as f:
+            result = json.load(f)
+        self.assertEqual(result['endpoints']['course.gradebook']['status'], [200])
+        self.assertTrue(all(row['status'] == [200] for row in result['endpoints'].values()))
+        self.assertGreater(result['endpoints']['courses.list']['queries'], 0)
+
+        # WSGI(동기 View)와 ASGI(비동기 View) 처리량 비교. 테스트 DB는 트랜잭션 안에 있으므로 WSGI는 스레드 하나로 잽니다.
+        throughput = benchmark.run_throughput(requests=12, concurrency=1, warmup=1, servers=['wsgi'])
+        throughput['servers'].update(benchmark.run_throughput(requests=12, concurrency=4, warmup=1,
+                                                              servers=['asgi'])['servers'])
+        self.assertEqual(len(throughput['meta']['endpoints']), 4)
+        for row in throughput['servers'].values():
+            self.assertEqual((row['requests'], row['errors']), (12, 0))
+            self.assertGreater(row['requests_per_second'], 0)
+
+        # 같은 결과와 비교하면 회귀가 없고, 쿼리 수가 늘어난 결과는 회귀로 봅니다.
+        call_command('benchmark_api', '--requests', '3', '--cold-cache', '--endpoint', 'courses.list',
+                     '--compare', output, '--threshold', '100000', stdout=StringIO())
+        result['endpoints']['courses.list']['queries'] = 0
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        with self.assertRaises(CommandError):
+            call_command('benchmark_api', '--requests', '3', '--cold-cache', '--endpoint', 'courses.list',
+                         '--compare', output, '--threshold', '100000', stdout=StringIO())
+
+
+PROFILE_DIR = tempfile.mkdtemp(prefix='lms-test-profiles-')
+
+
+@override_settings(REQUEST_PROFILING={'ENABLED': True, 'SAMPLE_RATE': 1.0, 'SLOW_REQUEST_MS': 0, 'PROFILE_DIR': PROFILE_DIR})
+class RequestProfilingTests(APITestCase):
+    def setUp(self):
+        self.student = User.objects.create_user(username='student', role='student')
+        course = Course.objects.create(name='데이터베이스', professor=User.objects.create_user(username='prof', role='professor'))
+        course.students.add(self.student)
+        self.client.force_authenticate(self.student)
+        cache.clear()
+
+    def test_server_timing_metrics_and_slow_profiles(self):
+        with self.assertLogs('core.profiling', 'WARNING'):
+            response = self.client.get('/api/courses/')
+        timing = response['Server-Timing']
+        for metric in ('total;dur=', 'db;dur=', 'serialize;dur=', 'render;dur='):
+            self.assertIn(metric, timing)
+        self.assertRegex(timing, r'desc="[1-9]\d* queries')
+        self.assertTrue(any('CourseListCreateView' in name and name.endswith('.prof') for name in os.listdir(PROFILE_DIR)))
+
+        with self.assertLogs('core.profiling', 'WARNING'):
+            body = self.client.get('/api/metrics/').content.decode()
+        self.assertIn('lms_http_requests_total{view="CourseListCreateView",method="GET",status="200"}', body)
+        self.assertIn('lms_http_request_duration_seconds_bucket{view="CourseListCreateView",le="+Inf"}', body)
+
+        with override_settings(REQUEST_PROFILING={'ENABLED': True, 'METRICS_TOKEN': 'secret'}):
+            self.client = self.client_class()
+            self.assertEqual(self.client.get('/api/metrics/').status_code, 401)
+            self.assertEqual(self.client.get('/api/metrics/', HTTP_AUTHORIZATION='Bearer secret').status_code, 200)
+
+    def test_duplicate_queries_are_counted(self):
+        from .profiling import RequestProfile
+        profile = RequestProfile(duplicate_threshold=2)
+        execute = lambda sql, params, many, context: None
+        for _ in range(3):
+            profile(execute, 'SELECT 1 FROM t WHERE id = %s', [1], False, {})
+        profile(execute, 'SELECT 2', [], False, {})
+        self.assertEqual((profile.query_count, profile.duplicate_count), (4, 2))
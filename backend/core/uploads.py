@@ -0,0 +1,163 @@
+"""
+제출 파일 업로드 처리입니다.
+
+- HashingFileUploadHandler: multipart 본문을 조각(chunk) 단위로 디스크 임시 파일에 바로 쓰면서
+  SHA-256과 크기를 계산합니다. 파일 전체를 메모리에 올리지 않으며, 과제별 크기/확장자 제한을
+  본문을 다 읽기 전에 확인합니다. 임시 파일은 SUBMISSION_UPLOAD_TEMP_DIR에 만들어지므로,
+  같은 파일 시스템의 MEDIA_ROOT로 저장할 때 복사 대신 이동(rename)됩니다.
+- UploadSession: 큰 파일을 여러 번의 PUT(Content-Range)으로 나누어 올리고, 끊겨도 이어 올릴 수 있습니다.
+  완료된 세션은 제출 API에 upload_id로 넘겨 사용합니다.
+"""
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.uploadedfile import TemporaryUploadedFile, UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+# multipart 경계 문자열, 헤더, description 등 파일 외 본문에 허용하는 여유분입니다.
+MULTIPART_OVERHEAD = 64 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class FileTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = 'The uploaded file exceeds the size limit for this assignment.'
+    default_code = 'file_too_large'
+
+
+class UnsupportedFileType(APIException):
+    status_code = status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+    default_detail = 'This file type is not allowed for this assignment.'
+    default_code = 'unsupported_file_type'
+
+
+# --- 과제별 제한 ---
+def get_max_upload_size(assignment):
+    return assignment.max_upload_size or settings.SUBMISSION_MAX_UPLOAD_SIZE
+
+
+def get_allowed_extensions(assignment):
+    return {ext.strip().lower().lstrip('.') for ext in assignment.allowed_extensions.split(',') if ext.strip()}
+
+
+def check_upload_allowed(assignment, filename, size=None):
+    allowed = get_allowed_extensions(assignment)
+    extension = Path(filename).suffix.lower().lstrip('.')
+    if allowed and extension not in allowed:
+        raise UnsupportedFileType(f"Allowed file types: {', '.join(sorted(allowed))}.")
+    if size is not None and size > get_max_upload_size(assignment):
+        raise FileTooLarge(f'The file must be at most {get_max_upload_size(assignment)} bytes.')
+
+
+def get_temp_dir():
+    temp_dir = Path(settings.SUBMISSION_UPLOAD_TEMP_DIR)
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    return temp_dir
+
+
+# --- multipart 스트리밍 업로드 ---
+class SubmissionTemporaryUploadedFile(TemporaryUploadedFile):
+    """SUBMISSION_UPLOAD_TEMP_DIR(필요하면 만들어 둡니다)에 기록되는 임시 업로드 파일입니다."""
+    def __init__(self, name, content_type, size, charset, content_type_extra=None):
+        file = tempfile.NamedTemporaryFile(suffix='.upload' + Path(name).suffix, dir=get_temp_dir())
+        UploadedFile.__init__(self, file, name, content_type, size, charset, content_type_extra)
+
+
+class HashingFileUploadHandler(FileUploadHandler):
+    def __init__(self, request=None, assignment=None):
+        super().__init__(request)
+        self.assignment = assignment
+        self.max_size = get_max_upload_size(assignment)
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        # 요청 본문 전체가 제한보다 크면 본문을 읽기 전에 거절합니다.
+        if content_length and content_length > self.max_size + MULTIPART_OVERHEAD:
+            raise FileTooLarge()
+        return None
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        check_upload_allowed(self.assignment, self.file_name)
+        self.hasher = hashlib.sha256()
+        self.received = 0
+        self.file = SubmissionTemporaryUploadedFile(self.file_name, self.content_type, 0, self.charset, self.content_type_extra)
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > self.max_size:
+            self.file.close()
+            raise FileTooLarge()
+        self.hasher.update(raw_data)
+        self.file.write(raw_data)
+
+    def file_complete(self, file_size):
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.sha256 = self.hasher.hexdigest()
+        return self.file
+
+
+# --- 조각 업로드 세션 ---
+class SpooledFile(File):
+    """디스크에 이미 저장된 파일입니다. 저장소가 복사하지 않고 이동할 수 있도록 경로를 알려 줍니다."""
+    def __init__(self, path, name, size, sha256):
+        super().__init__(open(path, 'rb'), name=name)
+        self.path = str(path)
+        self.size = size
+        self.sha256 = sha256
+
+    def temporary_file_path(self):
+        return self.path
+
+
+def session_part_path(session):
+    return get_temp_dir() / f'{session.pk}.part'
+
+
+def stored_part_size(session):
+    """세션 임시 파일에 실제로 남아 있는 바이트 수입니다. 파일이 없으면 0입니다."""
+    try:
+        return os.path.getsize(session_part_path(session))
+    except FileNotFoundError:
+        return 0
+
+
+def append_chunk(session, stream, start, length):
+    """요청 본문을 세션 파일의 start 위치에 이어서 씁니다. 실제로 쓴 바이트 수를 돌려줍니다."""
+    written = 0
+    with open(session_part_path(session), 'r+b' if start else 'wb') as part:
+        part.seek(start)
+        part.truncate()
+        while written < length:
+            chunk = stream.read(min(64 * 1024, length - written))
+            if not chunk:
+                break
+            part.write(chunk)
+            written += len(chunk)
+    return written
+
+
+def hash_file(path):
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def open_completed_session(session):
+    path = session_part_path(session)
+    return SpooledFile(path, session.filename, session.size, hash_file(path))
+
+
+def discard_session(session):
+    path = session_part_path(session)
+    if os.path.exists(path):
+        os.remove(path)
+    session.delete()
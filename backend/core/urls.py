@@ -2,6 +2,7 @@ from django.urls import path
 from .views import (
     RegisterView,
     MeView,
+    LogoutView,
     AssignmentListCreateView,
     AssignmentDetailView,
     AdminDashboardStatsView,
@@ -9,19 +10,35 @@ from .views import (
     UserDetailUpdateView,
     SubmissionCreateView,
     SubmissionUpdateView,
+    SubmissionFileDownloadView,
     AssignmentSubmissionsListView,
+    AssignmentSubmissionsExportView,
     SubmissionGradeView,
+    AssignmentBulkGradeView,
     MySubmissionsListView,
     NoticeListCreateView,
     NoticeDetailView,
     CourseListCreateView,
     CourseDetailView,
     CourseStudentManagementView,
+    CourseStudentsChangeView,
+    CourseRosterImportView,
+    CourseGradebookView,
     NotificationListView,
+    SearchView,
+    request_metrics,
     MarkNotificationAsReadView,
+    MarkAllNotificationsAsReadView,
+    NotificationUnreadCountView,
+    NotificationStreamTokenView,
+    notification_stream,
     ActivityLogListView,
-    JoinCourseWithCodeView  # ✅ 새로운 뷰를 import 합니다.
+    ActivityLogArchiveListView,
+    JoinCourseWithCodeView,  # ✅ 새로운 뷰를 import 합니다.
+    UploadSessionCreateView,
+    UploadSessionDetailView,
 )
+from . import async_views
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -33,11 +50,17 @@ urlpatterns = [
     path('auth/login/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('auth/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('auth/me/', MeView.as_view(), name='me'),
+    path('auth/logout/', LogoutView.as_view(), name='logout'),
 
     # --- Professor: Course Management ---
     path('courses/', CourseListCreateView.as_view(), name='course-list-create'),
     path('courses/<int:pk>/', CourseDetailView.as_view(), name='course-detail'),
     path('courses/<int:pk>/students/', CourseStudentManagementView.as_view(), name='course-student-management'),
+    path('courses/<int:pk>/students/add/', CourseStudentsChangeView.as_view(action='add'), name='course-students-add'),
+    path('courses/<int:pk>/students/remove/', CourseStudentsChangeView.as_view(action='remove'),
+         name='course-students-remove'),
+    path('courses/<int:pk>/students/import/', CourseRosterImportView.as_view(), name='course-roster-import'),
+    path('courses/<int:pk>/gradebook/', CourseGradebookView.as_view(), name='course-gradebook'),
 
     # --- Student: Join Course ---
     # ✅ 학생의 '코드로 참여하기' URL을 추가합니다.
@@ -51,15 +74,30 @@ urlpatterns = [
     path('assignments/<int:assignment_id>/submit/', SubmissionCreateView.as_view(), name='submission-create'),
     path('assignments/<int:assignment_id>/submissions/', AssignmentSubmissionsListView.as_view(),
          name='assignment-submissions-list'),
+    path('assignments/<int:assignment_id>/submissions/export/', AssignmentSubmissionsExportView.as_view(),
+         name='assignment-submissions-export'),
+    path('assignments/<int:assignment_id>/grades/', AssignmentBulkGradeView.as_view(), name='assignment-bulk-grade'),
     path('submissions/<int:pk>/', SubmissionUpdateView.as_view(), name='submission-update'),
+    path('submissions/<int:pk>/file/', SubmissionFileDownloadView.as_view(), name='submission-file'),
     path('submissions/<int:pk>/grade/', SubmissionGradeView.as_view(), name='submission-grade'),
     path('my-submissions/', MySubmissionsListView.as_view(), name='my-submissions-list'),
 
+    # --- Chunked (resumable) uploads ---
+    path('uploads/', UploadSessionCreateView.as_view(), name='upload-session-create'),
+    path('uploads/<uuid:pk>/', UploadSessionDetailView.as_view(), name='upload-session-detail'),
+
     # --- Admin ---
     path('admin/stats/', AdminDashboardStatsView.as_view(), name='admin-stats'),
     path('admin/users/', UserListView.as_view(), name='admin-user-list'),
     path('admin/users/<int:pk>/', UserDetailUpdateView.as_view(), name='admin-user-detail-update'),
     path('admin/logs/', ActivityLogListView.as_view(), name='activity-log-list'),
+    path('admin/logs/archives/', ActivityLogArchiveListView.as_view(), name='activity-log-archive-list'),
+
+    # --- Metrics (core/profiling.py) ---
+    path('metrics/', request_metrics, name='metrics'),
+
+    # --- Search ---
+    path('search/', SearchView.as_view(), name='search'),
 
     # --- Notices ---
     path('notices/', NoticeListCreateView.as_view(), name='notice-list-create'),
@@ -67,6 +105,17 @@ urlpatterns = [
 
     # --- Notifications ---
     path('notifications/', NotificationListView.as_view(), name='notification-list'),
+    path('notifications/unread-count/', NotificationUnreadCountView.as_view(), name='notification-unread-count'),
+    path('notifications/read/', MarkAllNotificationsAsReadView.as_view(), name='notification-mark-all-read'),
+    path('notifications/stream-token/', NotificationStreamTokenView.as_view(), name='notification-stream-token'),
+    path('notifications/stream/', notification_stream, name='notification-stream'),
     path('notifications/<int:pk>/read/', MarkNotificationAsReadView.as_view(), name='notification-mark-read'),
 ]
 
+# ASGI 서버용(backend/asgi_urls.py): 자주 호출되는 목록 API는 같은 경로, 같은 이름의 비동기 View로 연결합니다.
+async_urlpatterns = [
+    path('courses/', async_views.CourseListCreateView.as_view(), name='course-list-create'),
+    path('assignments/', async_views.AssignmentListCreateView.as_view(), name='assignment-list-create'),
+    path('my-submissions/', async_views.MySubmissionsListView.as_view(), name='my-submissions-list'),
+    path('notifications/', async_views.NotificationListView.as_view(), name='notification-list'),
+] + urlpatterns
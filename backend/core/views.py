@@ -1,19 +1,78 @@
+import os
+import re
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import generics, permissions, status
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.parsers import MultiPartParser, FormParser
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from rest_framework.exceptions import PermissionDenied, ValidationError
-from django.db.models import Q
-from .models import User, Assignment, Course, Submission, Notice, ActivityLog, Notification
+from django.utils.crypto import constant_time_compare
+from django.utils.http import content_disposition_header
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.db import IntegrityError, transaction
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
+from .models import User, Assignment, Course, Submission, Notice, ActivityLog, ActivityLogArchive, Notification, \
+    UploadSession
 from .serializers import (
     UserRegisterSerializer, UserSerializer, AssignmentSerializer,
     UserAdminUpdateSerializer, SubmissionSerializer, SubmissionGradingSerializer,
-    NoticeSerializer, CourseSerializer, NotificationSerializer, ActivityLogSerializer
+    NoticeSerializer, CourseSerializer, NotificationSerializer, ActivityLogSerializer, UploadSessionSerializer,
+    BulkGradeEntrySerializer, ActivityLogArchiveSerializer, requested_expansions
+)
+from .enrollment import Enrollment, enroll_students, find_students, read_roster_csv, set_students, \
+    unenroll_students
+from .filters import TRUE_VALUES, StableOrderingFilter, filter_assignments, filter_submissions, parse_time_param
+from .uploads import (
+    HashingFileUploadHandler, FileTooLarge, check_upload_allowed, append_chunk, open_completed_session,
+    discard_session, stored_part_size
 )
+from .activity import log_activity
+from .tasks import discard_upload_session, notify_graded
+from .stats import get_dashboard_stats
+from .response_cache import CachedResponseMixin, NOTICES_NAMESPACE, course_namespace, gradebook_namespace, \
+    user_namespace
+from .authentication import revoke_token, token_user_id
+from .downloads import DownloadTokenAuthentication, serve_submission_file
+from .exports import iter_submissions_zip
+from .grading import apply_grades, read_grades_csv
+from .gradebook import build_gradebook
+from .search import DOCUMENT_TYPES, search
+from .profiling import get_profiling_settings, metrics
+from .realtime import event_stream, make_stream_token, notification_channel, read_stream_token
 from .permissions import IsProfessor, IsAdmin, IsProfessorOrAdmin, IsOwnerOfSubmission, IsProfessorOrAdminUser, \
-    IsCourseProfessor
+    IsCourseProfessor, IsCourseProfessorOrAdmin, CanViewSubmission, TeachesCourse, get_membership
+
+
+CONTENT_RANGE_RE = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+
+
+def course_students_prefetch():
+    """CourseSerializer가 중첩 직렬화하는 수강생 목록을 한 번의 쿼리로 미리 불러옵니다."""
+    return Prefetch('students', queryset=User.objects.only('id', 'username', 'email', 'role').order_by('id'))
+
+
+def with_student_count(queryset, request, view):
+    """
+    수강생 수(student_count)를 서브쿼리로 붙이고, ?expand=students일 때만 수강생 목록을 미리 불러옵니다.
+    수강생으로 거른 쿼리셋(filter(students=user))에 Count를 붙이면 거른 행만 세므로 서브쿼리를 사용합니다.
+    """
+    enrollments = Course.students.through.objects.filter(course_id=OuterRef('pk')) \
+        .values('course_id').annotate(count=Count('*')).values('count')
+    queryset = queryset.annotate(student_count=Coalesce(Subquery(enrollments, output_field=IntegerField()), 0))
+    if 'students' in requested_expansions(request, view):
+        queryset = queryset.prefetch_related(course_students_prefetch())
+    return queryset
 
 
 # --- 1. Authentication and User Views ---
@@ -31,16 +90,69 @@ class MeView(generics.RetrieveAPIView):
         return self.request.user
 
 
+class LogoutView(APIView):
+    """요청에 쓴 액세스 토큰과, 함께 보낸 리프레시 토큰({"refresh": ...})을 폐기합니다. (core/authentication.py)"""
+    permission_classes = (permissions.IsAuthenticated,)
+
+    def post(self, request):
+        tokens = [request.auth] if request.auth is not None else []
+        if request.data.get('refresh'):
+            try:
+                refresh = RefreshToken(request.data['refresh'])
+            except TokenError:
+                raise ValidationError({"refresh": "The refresh token is invalid or has expired."})
+            if token_user_id(refresh) != request.user.pk:
+                raise ValidationError({"refresh": "The refresh token belongs to another user."})
+            tokens.append(refresh)
+        with transaction.atomic():
+            for token in tokens:
+                revoke_token(token)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 # --- 2. Student-specific Views ---
+def save_submission_file(serializer, request, assignment, /, **kwargs):
+    """
+    multipart로 받은 파일 또는 완료된 조각 업로드 세션(upload_id)의 파일을 크기/해시와 함께 저장합니다.
+    파일이 바뀌지 않는 수정 요청이면 나머지 필드만 저장합니다.
+    """
+    upload_id = serializer.validated_data.pop('upload_id', None)
+    session = None
+    if upload_id is not None:
+        session = get_object_or_404(UploadSession, pk=upload_id, owner=request.user, assignment=assignment)
+        if not session.is_complete:
+            raise ValidationError("The upload session is not complete yet.")
+        kwargs['file'] = open_completed_session(session)
+
+    upload = kwargs.get('file') or serializer.validated_data.get('file')
+    if upload is not None:
+        kwargs['file_size'] = upload.size
+        kwargs['file_sha256'] = upload.sha256
+        # 저장소 경로는 내용 해시이므로 사용자가 올린 원래 파일 이름은 따로 보관합니다.
+        kwargs['file_name'] = os.path.basename(upload.name)
+
+    instance = serializer.save(**kwargs)
+    if session is not None:
+        kwargs['file'].close()
+        # 임시 파일 정리는 응답을 기다리게 할 필요가 없으므로 작업 큐에서 합니다.
+        discard_upload_session.enqueue(str(session.pk))
+    return instance
+
+
 class SubmissionCreateView(generics.CreateAPIView):
     queryset = Submission.objects.all()
     serializer_class = SubmissionSerializer
     permission_classes = [permissions.IsAuthenticated]
     parser_classes = [MultiPartParser, FormParser]
 
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        # 본문을 읽기 전에 과제별 업로드 제한을 적용하도록 업로드 핸들러를 교체합니다.
+        self.assignment = get_object_or_404(Assignment, pk=self.kwargs.get('assignment_id'))
+        request.upload_handlers = [HashingFileUploadHandler(request, self.assignment)]
+
     def perform_create(self, serializer):
-        assignment_id = self.kwargs.get('assignment_id')
-        assignment = get_object_or_404(Assignment, pk=assignment_id)
+        assignment = self.assignment
         now = timezone.now()
         is_late = False
 
@@ -49,11 +161,18 @@ class SubmissionCreateView(generics.CreateAPIView):
                 raise PermissionDenied("This assignment is past the deadline and does not allow late submissions.")
             is_late = True
 
+        already_submitted = "You have already submitted this assignment. Please use the update functionality."
         if Submission.objects.filter(student=self.request.user, assignment=assignment).exists():
-            raise ValidationError("You have already submitted this assignment. Please use the update functionality.")
+            raise ValidationError(already_submitted)
 
-        submission = serializer.save(student=self.request.user, assignment=assignment, is_late=is_late)
-        ActivityLog.objects.create(
+        # 동시에 두 번 제출된 경우에도 unique_submission_per_student 제약이 중복 저장을 막습니다.
+        try:
+            with transaction.atomic():
+                submission = save_submission_file(serializer, self.request, assignment,
+                                                  student=self.request.user, assignment=assignment, is_late=is_late)
+        except IntegrityError:
+            raise ValidationError(already_submitted)
+        log_activity(
             actor=self.request.user,
             action_type="SUBMITTED_ASSIGNMENT",
             details=f"Assignment '{submission.assignment.title}' was submitted."
@@ -61,11 +180,23 @@ class SubmissionCreateView(generics.CreateAPIView):
 
 
 class SubmissionUpdateView(generics.UpdateAPIView):
-    queryset = Submission.objects.all()
+    queryset = Submission.objects.select_related('student', 'assignment')
     serializer_class = SubmissionSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOfSubmission]
     parser_classes = [MultiPartParser, FormParser]
 
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in ('PUT', 'PATCH'):
+            # 권한 확인 후, 본문을 읽기 전에 이 제출물 과제의 업로드 제한을 적용합니다.
+            self.submission = self.get_object()
+            request.upload_handlers = [HashingFileUploadHandler(request, self.submission.assignment)]
+
+    def get_object(self):
+        if getattr(self, 'submission', None) is not None:
+            return self.submission
+        return super().get_object()
+
     def perform_update(self, serializer):
         submission = self.get_object()
         assignment = submission.assignment
@@ -74,15 +205,99 @@ class SubmissionUpdateView(generics.UpdateAPIView):
         if now > assignment.due_date:
             raise PermissionDenied("You cannot update your submission after the deadline.")
 
-        serializer.save()
+        save_submission_file(serializer, self.request, assignment)
+
+
+class SubmissionFileDownloadView(generics.RetrieveAPIView):
+    """
+    제출 파일을 내려받습니다. 권한을 확인한 뒤 전송은 프록시(X-Accel-Redirect) 또는 스트리밍 응답으로 처리합니다.
+    SubmissionSerializer.file_url이 서명 토큰이 붙은 이 주소를 돌려줍니다.
+    """
+    queryset = Submission.objects.select_related('assignment__course')
+    authentication_classes = [DownloadTokenAuthentication, *api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+    permission_classes = [permissions.IsAuthenticated, CanViewSubmission]
+
+    def retrieve(self, request, *args, **kwargs):
+        submission = self.get_object()
+        if not submission.file:
+            raise NotFound("This submission has no file.")
+        return serve_submission_file(request, submission)
+
+
+class UploadSessionCreateView(generics.CreateAPIView):
+    """큰 파일을 조각으로 나누어 올리기 위한 세션을 만듭니다. 크기/확장자 제한은 여기서 미리 확인합니다."""
+    serializer_class = UploadSessionSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def perform_create(self, serializer):
+        assignment = serializer.validated_data['assignment']
+        check_upload_allowed(assignment, serializer.validated_data['filename'], serializer.validated_data['size'])
+        serializer.save(owner=self.request.user)
+
+
+class UploadSessionDetailView(APIView):
+    """
+    GET: 지금까지 받은 바이트 수(received)를 알려 줍니다. 끊긴 업로드는 이 위치부터 이어 올립니다.
+    PUT: `Content-Range: bytes <start>-<end>/<size>` 헤더와 함께 조각 하나를 올립니다.
+    DELETE: 업로드를 취소합니다.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_session(self, request, pk):
+        return get_object_or_404(UploadSession, pk=pk, owner=request.user)
+
+    def get(self, request, pk):
+        return Response(UploadSessionSerializer(self.get_session(request, pk)).data)
+
+    def put(self, request, pk):
+        match = CONTENT_RANGE_RE.match(request.headers.get('Content-Range', ''))
+        if not match:
+            return Response({"detail": "A 'Content-Range: bytes start-end/size' header is required."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        start, end, size = (int(value) for value in match.groups())
+        length = end - start + 1
+
+        with transaction.atomic():
+            session = get_object_or_404(UploadSession.objects.select_for_update(), pk=pk, owner=request.user)
+            if size != session.size or end >= session.size or length <= 0:
+                return Response({"detail": "Content-Range does not match this upload."},
+                                status=status.HTTP_400_BAD_REQUEST)
+            if length > settings.SUBMISSION_UPLOAD_CHUNK_SIZE:
+                raise FileTooLarge(f"Each chunk must be at most {settings.SUBMISSION_UPLOAD_CHUNK_SIZE} bytes.")
+            if start != session.received:
+                # 순서가 어긋난 조각입니다. 클라이언트는 received 위치부터 다시 보내면 됩니다.
+                return Response(UploadSessionSerializer(session).data, status=status.HTTP_409_CONFLICT)
+            stored = stored_part_size(session)
+            if stored < session.received:
+                # 임시 파일이 지워졌거나 잘렸습니다. 실제로 남아 있는 위치부터 다시 보내도록 알려 줍니다.
+                session.received = stored
+                session.save(update_fields=['received'])
+                return Response(UploadSessionSerializer(session).data, status=status.HTTP_409_CONFLICT)
+
+            written = append_chunk(session, request.stream, start, length)
+            if written != length:
+                return Response({"detail": "The chunk body is shorter than its Content-Range."},
+                                status=status.HTTP_400_BAD_REQUEST)
+            session.received = start + written
+            session.save(update_fields=['received'])
+        return Response(UploadSessionSerializer(session).data)
+
+    def delete(self, request, pk):
+        discard_session(self.get_session(request, pk))
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class MySubmissionsListView(generics.ListAPIView):
+    """필터: core.filters.filter_submissions, 정렬: ?ordering=submitted_at|file_size"""
     serializer_class = SubmissionSerializer
     permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [StableOrderingFilter]
+    ordering_fields = ['submitted_at', 'file_size', 'id']
+    ordering = ('-submitted_at', '-id')
 
     def get_queryset(self):
-        return Submission.objects.filter(student=self.request.user).order_by('-submitted_at')
+        queryset = Submission.objects.filter(student=self.request.user).select_related('student', 'assignment')
+        return filter_submissions(queryset, self.request)
 
 
 class JoinCourseWithCodeView(APIView):
@@ -93,65 +308,178 @@ class JoinCourseWithCodeView(APIView):
         if not join_code:
             return Response({"detail": "Join code is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            course = Course.objects.get(join_code=join_code)
-            course.students.add(request.user)
-            return Response({"detail": f"Successfully joined '{course.name}'."}, status=status.HTTP_200_OK)
-        except Course.DoesNotExist:
+        course = Course.objects.filter(join_code=join_code).only('id', 'name').first()
+        if course is None:
             return Response({"detail": "Invalid join code."}, status=status.HTTP_404_NOT_FOUND)
+        if request.user.role != 'student':
+            return Response({"detail": "Only students can join a course."}, status=status.HTTP_403_FORBIDDEN)
+        # 이미 참여한 과목이면 아무것도 바꾸지 않습니다. 동시에 두 번 요청해도 한 번만 등록됩니다.
+        if enroll_students(course, [request.user.pk]):
+            return Response({"detail": f"Successfully joined '{course.name}'."}, status=status.HTTP_200_OK)
+        return Response({"detail": f"You have already joined '{course.name}'."}, status=status.HTTP_200_OK)
 
 
 # --- 3. Professor-specific Views ---
 class AssignmentSubmissionsListView(generics.ListAPIView):
+    """필터: core.filters.filter_submissions, 정렬: ?ordering=submitted_at|file_size"""
     serializer_class = SubmissionSerializer
     permission_classes = [permissions.IsAuthenticated, IsProfessor]
+    filter_backends = [StableOrderingFilter]
+    ordering_fields = ['submitted_at', 'file_size', 'id']
+    ordering = ('-submitted_at', '-id')
 
     def get_queryset(self):
         assignment_id = self.kwargs.get('assignment_id')
-        assignment = get_object_or_404(Assignment, pk=assignment_id)
-        if assignment.course.professor == self.request.user:
-            return Submission.objects.filter(assignment=assignment)
+        membership = get_membership(self.request)
+        if membership.teaches(membership.assignment_courses.get(assignment_id)):
+            queryset = Submission.objects.filter(assignment_id=assignment_id).select_related('student', 'assignment')
+            return filter_submissions(queryset, self.request)
+        # 담당하지 않는 과제는 빈 목록, 없는 과제는 404입니다.
+        get_object_or_404(Assignment, pk=assignment_id)
         return Submission.objects.none()
 
 
+class AssignmentSubmissionsExportView(APIView):
+    """과제의 모든 제출 파일과 성적 목록(manifest.csv)을 하나의 ZIP으로 스트리밍합니다."""
+    permission_classes = [permissions.IsAuthenticated, IsProfessor, TeachesCourse]
+
+    def get(self, request, assignment_id):
+        assignment = get_object_or_404(Assignment, pk=assignment_id)
+        self.check_object_permissions(request, assignment)
+
+        log_activity(
+            actor=request.user,
+            action_type="EXPORTED_SUBMISSIONS",
+            details=f"Submissions for '{assignment.title}' were exported as a ZIP archive."
+        )
+        response = StreamingHttpResponse(
+            (chunk for chunk in iter_submissions_zip(assignment) if chunk), content_type='application/zip'
+        )
+        response['Content-Disposition'] = content_disposition_header(True, f'{assignment.title}_submissions.zip')
+        return response
+
+
 class SubmissionGradeView(generics.UpdateAPIView):
-    queryset = Submission.objects.all()
+    queryset = Submission.objects.select_related('student', 'assignment__course')
     serializer_class = SubmissionGradingSerializer
-    permission_classes = [permissions.IsAuthenticated, IsProfessor]
+    permission_classes = [permissions.IsAuthenticated, IsProfessor, TeachesCourse]
 
     def perform_update(self, serializer):
         submission = serializer.save()
-
-        Notification.objects.create(
-            recipient=submission.student,
-            message=f"'{submission.assignment.course.name}' 과목의 '{submission.assignment.title}' 과제에 새로운 피드백이 등록되었습니다."
-        )
-        ActivityLog.objects.create(
+        # 알림은 커밋 후 작업 큐에서 만듭니다. (core/tasks.py)
+        notify_graded.enqueue(submission.id)
+        log_activity(
             actor=self.request.user,
             action_type="GRADED_SUBMISSION",
             details=f"Submission for '{submission.assignment.title}' by {submission.student.username} was graded with score {submission.grade}."
         )
 
-    def get_object(self):
-        submission = super().get_object()
-        if submission.assignment.course.professor == self.request.user:
-            return submission
-        self.permission_denied(self.request)
+
+class AssignmentBulkGradeView(APIView):
+    """
+    과제의 여러 제출물을 한 번에 채점합니다.
+    JSON: {"grades": [{"submission_id": 1, "grade": 90, "feedback": "..."}, ...]}
+    또는 multipart로 CSV 파일(file)을 올립니다. (core/grading.py)
+    """
+    permission_classes = [permissions.IsAuthenticated, IsProfessor, TeachesCourse]
+    parser_classes = [*api_settings.DEFAULT_PARSER_CLASSES, MultiPartParser, FormParser]
+
+    def post(self, request, assignment_id):
+        assignment = get_object_or_404(Assignment.objects.select_related('course'), pk=assignment_id)
+        self.check_object_permissions(request, assignment)
+
+        upload = request.FILES.get('file')
+        entries = read_grades_csv(upload) if upload is not None else request.data.get('grades')
+        if not entries:
+            raise ValidationError({"grades": "Provide a non-empty 'grades' list or a CSV file."})
+        serializer = BulkGradeEntrySerializer(data=entries, many=True)
+        serializer.is_valid(raise_exception=True)
+
+        submissions = apply_grades(assignment, request.user, serializer.validated_data)
+        return Response({"updated": len(submissions)}, status=status.HTTP_200_OK)
+
+
+class CourseGradebookView(CachedResponseMixin, APIView):
+    """
+    과목의 학생 × 과제 성적부와 과제별 제출률/평균/중앙값입니다. (core/gradebook.py)
+    담당 교수와 관리자가 같은 내용을 보므로 사용자와 관계없이 한 번만 캐시합니다.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsProfessorOrAdmin, IsCourseProfessorOrAdmin]
+    cache_per_user = False
+
+    def get_cache_namespaces(self):
+        return [course_namespace(self.kwargs['pk']), gradebook_namespace(self.kwargs['pk'])]
+
+    def get(self, request, pk):
+        course = get_object_or_404(Course, pk=pk)
+        self.check_object_permissions(request, course)
+        return self.cached_response(lambda request: Response(build_gradebook(course)), request)
+
+
+def enrollment_response(course, added=(), removed=(), unknown=()):
+    """수강생 변경 결과입니다. 명단 전체 대신 바뀐 수와 현재 수강생 수만 돌려줍니다."""
+    return Response({
+        "added": len(added),
+        "removed": len(removed),
+        "unknown": unknown,
+        "student_count": Enrollment.objects.filter(course_id=course.pk).count(),
+    }, status=status.HTTP_200_OK)
 
 
 class CourseStudentManagementView(APIView):
-    permission_classes = [permissions.IsAuthenticated, IsProfessor]
+    """수강생 명단을 {"student_ids": [...]}로 맞춥니다. 바뀐 학생만 등록/해제합니다. (core/enrollment.py)"""
+    permission_classes = [permissions.IsAuthenticated, IsProfessor, IsCourseProfessor]
 
     def post(self, request, pk):
         course = get_object_or_404(Course, pk=pk)
-        if course.professor != request.user:
-            return Response({"detail": "You do not have permission to manage this course."},
-                            status=status.HTTP_403_FORBIDDEN)
-        student_ids = request.data.get('student_ids', [])
-        students = User.objects.filter(id__in=student_ids, role='student')
-        course.students.set(students)
-        serializer = CourseSerializer(course, context={'request': request})
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        self.check_object_permissions(request, course)
+        student_ids, unknown = find_students(ids=request.data.get('student_ids', []))
+        with transaction.atomic():
+            added, removed = set_students(course, student_ids)
+        return enrollment_response(course, added, removed, unknown)
+
+
+class CourseStudentsChangeView(APIView):
+    """
+    수강생을 추가(action='add') 또는 해제(action='remove')합니다.
+    {"student_ids": [...]} 또는 {"usernames": [...]}이며, 이미 반영된 학생은 건너뜁니다.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsProfessor, IsCourseProfessor]
+    action = 'add'
+
+    def post(self, request, pk):
+        course = get_object_or_404(Course, pk=pk)
+        self.check_object_permissions(request, course)
+        ids, usernames = request.data.get('student_ids') or [], request.data.get('usernames') or []
+        if not isinstance(ids, list) or not isinstance(usernames, list) or not (ids or usernames):
+            raise ValidationError({"student_ids": "Provide a non-empty 'student_ids' or 'usernames' list."})
+        student_ids, unknown = find_students(ids, usernames)
+        if self.action == 'add':
+            return enrollment_response(course, added=enroll_students(course, student_ids), unknown=unknown)
+        return enrollment_response(course, removed=unenroll_students(course, student_ids), unknown=unknown)
+
+
+class CourseRosterImportView(APIView):
+    """
+    CSV 파일(file, 헤더: username 또는 student_id)로 수강생을 한 번에 등록합니다.
+    replace=true이면 CSV에 없는 학생은 해제해 명단을 CSV와 같게 맞춥니다.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsProfessor, IsCourseProfessor]
+    parser_classes = [MultiPartParser, FormParser]
+
+    def post(self, request, pk):
+        course = get_object_or_404(Course, pk=pk)
+        self.check_object_permissions(request, course)
+        upload = request.FILES.get('file')
+        if upload is None:
+            raise ValidationError({"file": "Upload a CSV file."})
+        student_ids, unknown = find_students(*read_roster_csv(upload))
+        with transaction.atomic():
+            if str(request.data.get('replace', '')).lower() in TRUE_VALUES:
+                added, removed = set_students(course, student_ids)
+            else:
+                added, removed = enroll_students(course, student_ids), []
+        return enrollment_response(course, added, removed, unknown)
 
 
 # --- 4. Admin-specific Views ---
@@ -159,20 +487,27 @@ class AdminDashboardStatsView(APIView):
     permission_classes = [permissions.IsAuthenticated, IsAdmin]
 
     def get(self, request, *args, **kwargs):
-        stats_data = {
-            'totalCourses': Course.objects.count(),
-            'totalAssignments': Assignment.objects.count(),
-            'totalSubmissions': Submission.objects.filter(file__isnull=False).count(),
-            'totalUsers': User.objects.count(),
-        }
-        return Response(stats_data)
+        # 카운터 테이블 + 캐시에서 읽습니다. (core/stats.py)
+        return Response(get_dashboard_stats())
 
 
 class UserListView(generics.ListAPIView):
-    queryset = User.objects.all().order_by('id')
+    """필터: ?role=, ?username=(앞부분 일치), 정렬: ?ordering=username|id"""
     serializer_class = UserSerializer
+    filter_backends = [StableOrderingFilter]
+    ordering_fields = ['username', 'id']
+    ordering = ('id',)
     permission_classes = [permissions.IsAuthenticated, IsProfessorOrAdminUser]
 
+    def get_queryset(self):
+        queryset = User.objects.all()
+        params = self.request.query_params
+        if params.get('role'):
+            queryset = queryset.filter(role=params['role'])
+        if params.get('username'):
+            queryset = queryset.filter(username__istartswith=params['username'])
+        return queryset
+
 
 class UserDetailUpdateView(generics.RetrieveUpdateAPIView):
     queryset = User.objects.all()
@@ -185,22 +520,64 @@ class UserDetailUpdateView(generics.RetrieveUpdateAPIView):
 
 
 class ActivityLogListView(generics.ListAPIView):
-    queryset = ActivityLog.objects.all()
+    """
+    활동 로그 목록입니다. 운영 테이블에는 최근 기록만 있으며, 오래된 달은 archive_activity_logs 명령으로 보관됩니다.
+    필터: ?since=, ?until=(미포함), ?actor=<id 또는 username>, ?action_type=
+    각 필터는 (created_at), (actor, created_at), (action_type, created_at) 인덱스를 사용합니다.
+    """
     serializer_class = ActivityLogSerializer
+    ordering = ('-created_at', '-id')
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    def get_queryset(self):
+        queryset = ActivityLog.objects.select_related('actor')
+        params = self.request.query_params
+        since, until = parse_time_param(self.request, 'since'), parse_time_param(self.request, 'until')
+        if since:
+            queryset = queryset.filter(created_at__gte=since)
+        if until:
+            queryset = queryset.filter(created_at__lt=until)
+        actor = params.get('actor')
+        if actor:
+            queryset = queryset.filter(actor_id=int(actor)) if actor.isdigit() else queryset.filter(actor__username=actor)
+        if params.get('action_type'):
+            queryset = queryset.filter(action_type=params['action_type'])
+        return queryset
+
+
+class ActivityLogArchiveListView(generics.ListAPIView):
+    """운영 테이블에서 보관 파일로 옮겨 간 달의 목록입니다."""
+    queryset = ActivityLogArchive.objects.all()
+    serializer_class = ActivityLogArchiveSerializer
+    ordering = ('-month', '-id')
     permission_classes = [permissions.IsAuthenticated, IsAdmin]
 
 
 # --- 5. Shared Views (Permissions controlled internally) ---
-class CourseListCreateView(generics.ListCreateAPIView):
+class CourseListCreateView(CachedResponseMixin, generics.ListCreateAPIView):
+    """
+    수강생 목록 대신 student_count를 보냅니다. 목록이 필요하면 ?expand=students를 줍니다.
+    필터: ?name=(부분 일치), 정렬: ?ordering=name|id
+    """
     serializer_class = CourseSerializer
+    filter_backends = [StableOrderingFilter]
+    ordering_fields = ['name', 'id']
+    ordering = ('id',)
+
+    def get_cache_namespaces(self):
+        return [user_namespace(self.request.user.pk)]
 
     def get_queryset(self):
         user = self.request.user
         if user.role == 'professor':
-            return Course.objects.filter(professor=user)
+            queryset = Course.objects.filter(professor=user)
         elif user.role == 'student':
-            return Course.objects.filter(students=user)
-        return Course.objects.none()
+            queryset = Course.objects.filter(students=user)
+        else:
+            return Course.objects.none()
+        if self.request.query_params.get('name'):
+            queryset = queryset.filter(name__icontains=self.request.query_params['name'])
+        return with_student_count(queryset, self.request, self)
 
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -211,15 +588,19 @@ class CourseListCreateView(generics.ListCreateAPIView):
         serializer.save(professor=self.request.user)
 
 
-class CourseDetailView(generics.RetrieveUpdateDestroyAPIView):
+class CourseDetailView(CachedResponseMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = CourseSerializer
     queryset = Course.objects.all()
+    # 상세 화면은 수강생 관리에 목록이 필요하므로 기본으로 포함합니다. (?fields=로 뺄 수 있습니다.)
+    default_expand = ('students',)
+
+    def get_cache_namespaces(self):
+        return [course_namespace(self.kwargs['pk']), user_namespace(self.request.user.pk)]
 
     def get_queryset(self):
-        user = self.request.user
-        if user.is_authenticated:
-            return Course.objects.filter(Q(professor=user) | Q(students=user)).distinct()
-        return Course.objects.none()
+        # 담당/수강 과목 id로 거르므로 수강생 테이블 JOIN과 DISTINCT가 필요 없습니다.
+        queryset = get_membership(self.request).member_courses(Course.objects.all())
+        return with_student_count(queryset, self.request, self)
 
     def get_permissions(self):
         if self.request.method in ['PUT', 'PATCH', 'DELETE']:
@@ -227,24 +608,25 @@ class CourseDetailView(generics.RetrieveUpdateDestroyAPIView):
         return [permissions.IsAuthenticated()]
 
 
-class AssignmentListCreateView(generics.ListCreateAPIView):
+class AssignmentListCreateView(CachedResponseMixin, generics.ListCreateAPIView):
+    """필터: core.filters.filter_assignments, 정렬: ?ordering=due_date|title|id"""
     serializer_class = AssignmentSerializer
+    filter_backends = [StableOrderingFilter]
+    ordering_fields = ['due_date', 'title', 'id']
+    ordering = ('id',)
+
+    def get_cache_namespaces(self):
+        return [user_namespace(self.request.user.pk)]
 
     def get_queryset(self):
         user = self.request.user
-        course_id = self.request.query_params.get('course_id')
-
         if user.role == 'student':
             queryset = Assignment.objects.filter(course__students=user)
-            if course_id:
-                return queryset.filter(course_id=course_id)
-            return queryset
         elif user.role == 'professor':
             queryset = Assignment.objects.filter(course__professor=user)
-            if course_id:
-                return queryset.filter(course_id=course_id)
-            return queryset
-        return Assignment.objects.none()
+        else:
+            return Assignment.objects.none()
+        return filter_assignments(queryset, self.request)
 
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -268,12 +650,18 @@ class AssignmentDetailView(generics.RetrieveUpdateDestroyAPIView):
     def get_permissions(self):
         if self.request.method == 'GET':
             return [permissions.IsAuthenticated()]
-        return [permissions.IsAuthenticated(), IsProfessor()]
+        return [permissions.IsAuthenticated(), IsProfessor(), TeachesCourse()]
 
 
-class NoticeListCreateView(generics.ListCreateAPIView):
-    queryset = Notice.objects.all().order_by('-created_at')
+class NoticeListCreateView(CachedResponseMixin, generics.ListCreateAPIView):
+    queryset = Notice.objects.select_related('author')
     serializer_class = NoticeSerializer
+    ordering = ('-created_at', '-id')
+    # 공지 목록은 모든 사용자에게 같으므로 사용자별로 나누지 않습니다.
+    cache_per_user = False
+
+    def get_cache_namespaces(self):
+        return [NOTICES_NAMESPACE]
 
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -285,7 +673,7 @@ class NoticeListCreateView(generics.ListCreateAPIView):
 
 
 class NoticeDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Notice.objects.all()
+    queryset = Notice.objects.select_related('author')
     serializer_class = NoticeSerializer
 
     def get_permissions(self):
@@ -294,20 +682,134 @@ class NoticeDetailView(generics.RetrieveUpdateDestroyAPIView):
         return [permissions.IsAuthenticated()]
 
 
+class SearchView(APIView):
+    """
+    공지 / 과제 / (관리자는) 활동 로그 통합 검색입니다. 점수순으로 정렬하고 페이지 번호로 나눕니다. (core/search.py)
+    ?q=검색어 &type=notice,assignment,log(생략하면 볼 수 있는 전체) &page= &page_size=
+    점수순 결과는 커서의 기준이 될 고정 키가 없으므로 다른 목록과 달리 페이지 번호를 사용합니다.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    page_size = 20
+    max_page_size = 50
+
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            raise ValidationError({"q": "A search query is required."})
+        doc_types = [t for t in request.query_params.get('type', '').split(',') if t] or list(DOCUMENT_TYPES)
+        unknown = set(doc_types) - set(DOCUMENT_TYPES)
+        if unknown:
+            raise ValidationError({"type": f"Unknown type: {', '.join(sorted(unknown))}."})
+        try:
+            page = max(int(request.query_params.get('page', 1)), 1)
+            page_size = min(max(int(request.query_params.get('page_size', self.page_size)), 1), self.max_page_size)
+        except ValueError:
+            raise ValidationError({"page": "page and page_size must be integers."})
+
+        results, count = search(request.user, get_membership(request), query, doc_types, (page - 1) * page_size, page_size)
+        url = request.build_absolute_uri()
+        return Response({
+            "count": count,
+            "next": replace_query_param(url, 'page', page + 1) if page * page_size < count else None,
+            "previous": replace_query_param(url, 'page', page - 1) if page > 1 else None,
+            "results": results,
+        })
+
+
 class NotificationListView(generics.ListAPIView):
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    ordering = ('-created_at', '-id')
 
     def get_queryset(self):
         return Notification.objects.filter(recipient=self.request.user)
 
 
+class NotificationStreamTokenView(APIView):
+    """알림 스트림(EventSource) 연결에 쓸 짧게 유효한 토큰을 발급합니다. (core/realtime.py)"""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        jti = request.auth.get(jwt_settings.JTI_CLAIM) if request.auth is not None else None
+        return Response({"token": make_stream_token(request.user, jti),
+                         "expires_in": settings.REALTIME_STREAM_TOKEN_MAX_AGE})
+
+
+async def notification_stream(request):
+    """
+    새 알림을 Server-Sent Events로 실시간 전달합니다. ASGI 서버(uvicorn/daphne 등)에서만 동작합니다.
+    서명 토큰으로 사용자를 확인하고 연결할 때 한 번만 폐기 목록을 확인하므로, 연결을 오래 유지해도 DB 연결을 잡고 있지 않습니다.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({"detail": "The notification stream requires an ASGI server."}, status=501)
+    # 폐기 목록은 캐시에 없으면 DB에서 읽으므로 동기 스레드에서 확인합니다.
+    user_id = await sync_to_async(read_stream_token)(request.GET.get('token', ''))
+    if user_id is None:
+        return JsonResponse({"detail": "The stream token is invalid or has expired."}, status=401)
+
+    response = StreamingHttpResponse(
+        event_stream(notification_channel(user_id), settings.REALTIME_HEARTBEAT_SECONDS),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    # nginx가 응답을 모아 두지 않고 바로 보내도록 합니다.
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
 class MarkNotificationAsReadView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, pk):
-        notification = get_object_or_404(Notification, pk=pk, recipient=request.user)
-        notification.is_read = True
-        notification.save()
+        # 행을 읽어 save()하지 않고 UPDATE 한 번으로 처리합니다.
+        if not Notification.objects.filter(pk=pk, recipient=request.user).update(is_read=True):
+            if not Notification.objects.filter(pk=pk, recipient=request.user).exists():
+                raise NotFound()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+
+class NotificationUnreadCountView(APIView):
+    """알림 벨 배지용 안 읽은 알림 수입니다. notification_inbox_idx 인덱스만으로 셉니다."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        unread = Notification.objects.filter(recipient=request.user, is_read=False).count()
+        return Response({"unread": unread})
+
+
+class MarkAllNotificationsAsReadView(APIView):
+    """
+    안 읽은 알림을 UPDATE 한 번으로 모두 읽음 처리합니다.
+    up_to_id를 주면 그 id 이하만 처리하므로, 화면에 표시된 뒤 새로 도착한 알림은 남겨 둘 수 있습니다.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        notifications = Notification.objects.filter(recipient=request.user, is_read=False)
+        up_to_id = request.data.get('up_to_id')
+        if up_to_id is not None:
+            try:
+                notifications = notifications.filter(pk__lte=int(up_to_id))
+            except (TypeError, ValueError):
+                raise ValidationError({"up_to_id": "A valid integer is required."})
+        return Response({"updated": notifications.update(is_read=True)})
+
+
+# --- 6. Operational Metrics ---
+LOOPBACK_ADDRESSES = ('127.0.0.1', '::1')
+
+
+def request_metrics(request):
+    """
+    RequestProfilingMiddleware가 모은 요청 지표를 Prometheus 텍스트 형식으로 돌려줍니다. (core/profiling.py)
+    METRICS_TOKEN이 있으면 Authorization: Bearer <토큰>이, 없으면 같은 호스트에서의 요청만 허용합니다.
+    """
+    config = get_profiling_settings()
+    if not config['ENABLED']:
+        raise Http404
+    if config['METRICS_TOKEN']:
+        if not constant_time_compare(request.headers.get('Authorization', ''), f"Bearer {config['METRICS_TOKEN']}"):
+            return HttpResponse(status=status.HTTP_401_UNAUTHORIZED)
+    elif request.META.get('REMOTE_ADDR') not in LOOPBACK_ADDRESSES:
+        return HttpResponse(status=status.HTTP_403_FORBIDDEN)
+    return HttpResponse(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')